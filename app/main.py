@@ -34,7 +34,7 @@ from core.schemas import OHLC, OpenInterest, FundingRate
 from core.schemas import PredictedFunding
 from core.logging import logger
 from core.config import settings, validate_configuration
-from services.event_bus import bus
+from services.event_bus import bus, drain_batch
 from services.all_liquidations import get_all_liquidations_service
 from services.oi_vol_monitor import get_oi_vol_monitor
 from services.all_large_trades import get_all_large_trades_service
@@ -759,7 +759,12 @@ async def websocket_stream(
 
         async for event in stream_methods[stream]():
             try:
-                await websocket.send_json(event.model_dump(mode="json"))
+                # Serialize straight to JSON in pydantic-core, skipping the
+                # intermediate dict and Starlette's stdlib json.dumps. Calling the
+                # class's compiled serializer directly also skips the per-call
+                # argument handling of model_dump_json().
+                payload = type(event).__pydantic_serializer__.to_json(event)
+                await websocket.send_text(payload.decode())
             except Exception as e:
                 logger.error(f"Send error: {e}")
                 break
@@ -783,13 +788,19 @@ async def websocket_stream(
 @app.websocket("/ws/all/liquidations")
 async def websocket_all_liquidations(
     websocket: WebSocket,
-    min_value_usd: float = Query(default=5_000.0, description="Minimum USD value to forward to client")
+    min_value_usd: float = Query(default=5_000.0, description="Minimum USD value to forward to client"),
+    batch: bool = Query(default=False, description="Coalesce bursts into liquidation_batch frames")
 ):
     """
     Aggregated liquidation stream across multiple exchanges (Binance, OKX, Hyperliquid).
 
+    With batch=true, events already queued are sent together as one
+    {"type": "liquidation_batch", "items": [...]} frame; a lone event is still
+    sent immediately (as a batch of one).
+
     Example:
         ws://localhost:8000/ws/all/liquidations?min_value_usd=50000
+        ws://localhost:8000/ws/all/liquidations?min_value_usd=50000&batch=true
     """
     await websocket.accept()
     logger.info("WS connected: all/liquidations")
@@ -797,11 +808,22 @@ async def websocket_all_liquidations(
     try:
         while True:
             try:
+                if batch:
+                    # Per-connection filtering by USD value; items are pre-encoded
+                    items = [
+                        e.json for e in await drain_batch(queue)
+                        if float(e.data.get("value", 0)) >= float(min_value_usd)
+                    ]
+                    if items:
+                        await websocket.send_text(
+                            '{"type":"liquidation_batch","items":[' + ",".join(items) + "]}"
+                        )
+                    continue
                 event = await queue.get()
                 # Per-connection filtering by USD value
-                if float(event.get("value", 0)) < float(min_value_usd):
+                if float(event.data.get("value", 0)) < float(min_value_usd):
                     continue
-                await websocket.send_json(event)
+                await websocket.send_text(event.json)
             except Exception as e:
                 logger.error(f"[WS all/liquidations] send error: {e}")
                 break
@@ -837,9 +859,9 @@ async def websocket_oi_vol(
         while True:
             try:
                 event = await queue.get()
-                if event.get("timeframe") not in allowed:
+                if event.data.get("timeframe") not in allowed:
                     continue
-                await websocket.send_json(event)
+                await websocket.send_text(event.json)
             except Exception as e:
                 logger.error(f"[WS oi-vol] send error: {e}")
                 break
@@ -870,9 +892,9 @@ async def websocket_all_large_trades(
         while True:
             try:
                 event = await queue.get()
-                if float(event.get("value", 0)) < float(min_value_usd):
+                if float(event.data.get("value", 0)) < float(min_value_usd):
                     continue
-                await websocket.send_json(event)
+                await websocket.send_text(event.json)
             except Exception as e:
                 logger.error(f"[WS all/large_trades] send error: {e}")
                 break
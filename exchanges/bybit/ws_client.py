@@ -90,7 +90,9 @@ class BybitWSClient:
         Raises:
             Exception: If connection or subscription fails
         """
-        ws = await websockets.connect(self.BASE_URL)
+        # Kline/trade frames are small JSON; permessage-deflate would only add
+        # a zlib pass per frame
+        ws = await websockets.connect(self.BASE_URL, compression=None)
         await ws.send(json.dumps(subscription))
         self.logger.info(f"Subscribed to {subscription.get('args', ['unknown'])[0] if subscription.get('args') else 'unknown'} stream")
         self._reconnect_attempt = 0
@@ -32,7 +32,8 @@ Structure:
     exchanges/hyperliquid/
     ├── __init__.py          # This file (HyperliquidExchange class)
     ├── api_client.py        # REST API client with aiohttp
-    └── ws_client.py         # WebSocket streaming client
+    ├── ws_client.py         # WebSocket streaming client
+    └── symbols.py           # Pair -> coin symbol lookup tables
 """
 
 from typing import List, AsyncGenerator, Optional
@@ -42,7 +43,7 @@ from core.schemas import PredictedFunding
 from core.logging import logger, get_logger
 from core.utils.time import to_utc_datetime, current_utc_timestamp
 from .api_client import HyperliquidAPIClient
-from .ws_client import HyperliquidWSClient, create_candle_stream, create_trade_stream
+from .ws_client import HyperliquidWSClient
 
 
 class HyperliquidExchange(ExchangeInterface):
@@ -13,7 +13,8 @@ API Documentation:
 
 Rate Limits:
     - Hyperliquid has rate limits on their endpoints
-    - This client implements automatic retry with exponential backoff
+    - This client implements automatic retry with jittered exponential backoff
+    - Concurrent identical requests are coalesced into a single POST
 
 Usage:
     async with HyperliquidAPIClient() as client:
@@ -23,11 +24,44 @@ Usage:
 
 import aiohttp
 import asyncio
-from typing import List, Dict, Optional, Any
+import json
+import time
+import ijson
+from typing import List, Dict, Optional, Any, Awaitable, Callable, Tuple, TypeVar
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 from core.logging import get_logger
-from core.utils.time import to_utc_datetime
+from core.utils.time import to_utc_datetime, current_utc_datetime
 from core.schemas import OHLC, OpenInterest, FundingRate
 from core.schemas import PredictedFunding, PredictedVenueFunding
+from .symbols import extract_coin_symbol
+
+# Optional: aiodns lets aiohttp resolve hosts via c-ares instead of the
+# default thread-pool resolver (getaddrinfo in an executor)
+try:
+    import aiodns  # noqa: F401
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
+
+T = TypeVar("T")
+
+
+class _RetryableStatus(Exception):
+    """Raised inside the retry loop for HTTP statuses worth retrying (429/503)."""
+
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+# Failures that trigger another attempt; anything else fails fast
+_RETRYABLE_ERRORS = (asyncio.TimeoutError, aiohttp.ClientError, _RetryableStatus)
 
 
 class HyperliquidAPIClient:
@@ -49,6 +83,7 @@ class HyperliquidAPIClient:
 
     Notes:
         - Uses context manager for automatic session cleanup
+        - Reuses pooled keep-alive connections across concurrent requests
         - Implements retry logic for rate limits
         - All timestamps converted to UTC datetime
         - Uses POST requests with JSON payloads (Hyperliquid API standard)
@@ -56,12 +91,41 @@ class HyperliquidAPIClient:
 
     BASE_URL = "https://api.hyperliquid.xyz/info"
 
-    def __init__(self):
+    # Request settings shared by every POST
+    MAX_ATTEMPTS = 3
+    _HEADERS = {"Content-Type": "application/json"}
+    _TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+    # Connection pool: concurrent fetches reuse keep-alive connections
+    # to the single API host instead of opening a new TLS session each
+    MAX_CONNECTIONS = 32
+    KEEPALIVE_TIMEOUT = 30.0
+    DNS_CACHE_TTL = 300
+    _WARMUP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+    # How long all-market snapshots (metaAndAssetCtxs, predictedFundings)
+    # are reused before re-fetching (seconds)
+    SNAPSHOT_TTL = 5.0
+
+    def __init__(self, warmup: bool = True):
         """
         Initialize the Hyperliquid API client.
+
+        Args:
+            warmup: Open a connection (DNS + TLS) in the background when the
+                    session is created, so the first real request is warm
         """
         self.logger = get_logger(__name__)
         self.session: Optional[aiohttp.ClientSession] = None
+        self._warmup = warmup
+        self._warmup_task: Optional[asyncio.Task] = None
+
+        # In-flight requests keyed by canonical payload (single-flight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Short-lived all-market snapshots: (fetched_at, ...)
+        self._ctx_cache: Optional[Tuple[float, Dict[str, int], List[Dict[str, Any]]]] = None
+        self._predicted_cache: Optional[Tuple[float, List[Any]]] = None
 
     # ============================================
     # Context Manager for Session Management
@@ -71,11 +135,25 @@ class HyperliquidAPIClient:
         """
         Enter async context - creates HTTP session.
 
+        The session uses a pooled keep-alive connector so bursts of
+        concurrent requests (OHLC + OI + funding fan-out) share a bounded
+        set of warm connections.
+
         Returns:
             Self for use in async with statement
         """
-        self.session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.MAX_CONNECTIONS,
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            use_dns_cache=True,
+            ttl_dns_cache=self.DNS_CACHE_TTL,
+            resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
         self.logger.debug("HyperliquidAPIClient session created")
+
+        if self._warmup:
+            self._warmup_task = asyncio.create_task(self._warmup_connection())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -87,86 +165,219 @@ class HyperliquidAPIClient:
             exc_val: Exception value if error occurred
             exc_tb: Exception traceback if error occurred
         """
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+        self._warmup_task = None
+
         if self.session:
             await self.session.close()
             self.logger.debug("HyperliquidAPIClient session closed")
 
+    async def _warmup_connection(self) -> None:
+        """
+        Resolve DNS and complete the TLS handshake ahead of the first request.
+
+        The HEAD response itself is irrelevant; the point is leaving a warm
+        keep-alive connection (and cached DNS entry) in the pool. Errors are
+        ignored - the first real request simply pays the cold-start cost.
+        """
+        try:
+            async with self.session.head(self.BASE_URL, timeout=self._WARMUP_TIMEOUT):
+                pass
+            self.logger.debug("HyperliquidAPIClient connection warmed up")
+        except Exception as e:
+            self.logger.debug("HyperliquidAPIClient warmup failed (ignored): %s", e)
+
     # ============================================
     # HTTP Request Handler with Retry Logic
     # ============================================
 
     async def _post(self, payload: Dict[str, Any]) -> Any:
+        """
+        Make POST request to Hyperliquid API, coalescing identical in-flight calls.
+
+        If another coroutine is already waiting on a request with the same
+        payload, this call awaits that result instead of issuing a second POST.
+        The shared result must be treated as read-only by callers.
+
+        Args:
+            payload: JSON payload for the POST request
+
+        Returns:
+            JSON response from API
+
+        Raises:
+            RuntimeError: If request fails after all retries
+        """
+        key = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return await self._single_flight(key, payload, lambda: self._post_with_retry(payload))
+
+    async def _single_flight(
+        self, key: str, payload: Dict[str, Any], fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run ``fetch`` once per ``key`` among concurrent callers.
+
+        The first caller (leader) runs it; callers arriving while it is in
+        flight await the leader's result or exception. If the leader itself
+        is cancelled, followers get a RuntimeError rather than being
+        cancelled along with it.
+
+        Args:
+            key: Identity of the request (equal keys share one fetch)
+            payload: JSON payload, for logging
+            fetch: Coroutine factory issuing the request
+
+        Returns:
+            The (shared, read-only) result of ``fetch``
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.logger.debug("POST %s - Joining in-flight request", payload.get("type", "unknown"))
+            # Shield so a cancelled follower doesn't cancel the leader's request
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await fetch()
+        except asyncio.CancelledError:
+            # Followers weren't cancelled themselves; fail them normally
+            future.set_exception(RuntimeError("In-flight request cancelled"))
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved; followers (if any) still receive the exception
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            del self._inflight[key]
+
+    async def _post_items(self, payload: Dict[str, Any], build: Callable[[Dict[str, Any]], T]) -> List[T]:
+        """
+        Make POST request and stream-decode a top-level JSON array.
+
+        Each array element is passed to ``build`` as soon as it is parsed, so
+        the raw dicts never coexist in memory with the built objects. Use this
+        for large list responses (e.g. candleSnapshot); small endpoints should
+        keep using _post().
+
+        Unlike _post(), this does not coalesce identical requests itself: the
+        result depends on ``build`` as well as the payload. Callers share one
+        streamed request through _single_flight(), keyed on the payload plus
+        whatever ``build`` depends on (see get_historical_ohlc).
+
+        Args:
+            payload: JSON payload for the POST request
+            build: Callable converting one raw array item into a result object
+
+        Returns:
+            List of built objects, in response order
+
+        Raises:
+            RuntimeError: If request fails after all retries
+        """
+        async def read_items(resp: aiohttp.ClientResponse) -> List[T]:
+            return [build(item) async for item in ijson.items_async(resp.content, "item", use_float=True)]
+
+        return await self._post_with_retry(payload, read=read_items)
+
+    async def _post_with_retry(
+        self,
+        payload: Dict[str, Any],
+        read: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = None
+    ) -> Any:
         """
         Make POST request to Hyperliquid API with retry logic.
 
         This method handles:
-        - Rate limiting (429 errors) with exponential backoff
+        - Rate limiting (429/503) and transient network errors, retried with
+          jittered exponential backoff (tenacity)
         - Request timeouts
         - Error logging
-        - Automatic retries (up to 3 attempts)
+        - Automatic retries (up to MAX_ATTEMPTS attempts)
 
         Args:
             payload: JSON payload for the POST request
+            read: Optional coroutine consuming a successful response
+                  (default: decode the whole body as JSON)
 
         Returns:
-            JSON response from API
+            JSON response from API (or the result of ``read``)
 
         Raises:
-            RuntimeError: If request fails after all retries
+            RuntimeError: If request fails after all retries, or on a
+                          non-retryable HTTP status
 
-        Rate Limit Handling:
-            - 429: Too many requests
-            Retry delay: 1.5s * (attempt + 1)
+        Retry Policy:
+            - Retried: 429, 503, timeouts, aiohttp.ClientError
+            - Delay: random in [0, min(2^attempt, 10)] seconds
         """
         if not self.session:
             raise RuntimeError("Client session not initialized. Use 'async with' statement.")
 
         url = self.BASE_URL
+        request_type = payload.get("type", "unknown")
 
-        # Build headers
-        headers = {"Content-Type": "application/json"}
-
-        # Retry loop (max 3 attempts)
-        for attempt in range(3):
-            try:
-                async with self.session.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    # Success
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self.logger.debug(f"POST {payload.get('type', 'unknown')} - Success (attempt {attempt + 1})")
-                        return data
-
-                    # Rate limit errors - retry with backoff
-                    elif resp.status in (429, 503):
-                        delay = 1.5 * (attempt + 1)
-                        self.logger.warning(
-                            f"Rate limited (HTTP {resp.status}) on {payload.get('type', 'unknown')}. "
-                            f"Retrying in {delay:.1f}s... (attempt {attempt + 1}/3)"
-                        )
-                        await asyncio.sleep(delay)
-                        continue
-
-                    # Other errors - log and break
-                    else:
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.MAX_ATTEMPTS),
+                wait=wait_random_exponential(multiplier=1.0, max=10),
+                retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+                before_sleep=lambda state: self._log_retry(request_type, state),
+                reraise=True,
+            ):
+                with attempt:
+                    async with self.session.post(
+                        url,
+                        json=payload,
+                        headers=self._HEADERS,
+                        timeout=self._TIMEOUT
+                    ) as resp:
+                        # Success
+                        if resp.status == 200:
+                            data = await read(resp) if read else await resp.json()
+                            self.logger.debug(
+                                "POST %s - Success (attempt %d)", request_type, attempt.retry_state.attempt_number
+                            )
+                            return data
+
+                        # Rate limit errors - retry with backoff
+                        if resp.status in (429, 503):
+                            raise _RetryableStatus(resp.status)
+
+                        # Other errors - log and give up
                         text = await resp.text()
-                        self.logger.error(f"HTTP {resp.status} on {payload.get('type', 'unknown')}: {text}")
+                        self.logger.error("HTTP %d on %s: %s", resp.status, request_type, text)
                         break
 
-            except asyncio.TimeoutError:
-                self.logger.error(f"Timeout on {payload.get('type', 'unknown')} (attempt {attempt + 1}/3)")
-                await asyncio.sleep(1.0 * (attempt + 1))
+        except _RETRYABLE_ERRORS as e:
+            self.logger.error("Request failed on %s after %d attempts: %r", request_type, self.MAX_ATTEMPTS, e)
 
-            except Exception as e:
-                self.logger.error(f"Request failed on {payload.get('type', 'unknown')}: {e} (attempt {attempt + 1}/3)")
-                await asyncio.sleep(1.0 * (attempt + 1))
+        raise RuntimeError(f"Failed to fetch from {url} after {self.MAX_ATTEMPTS} attempts")
 
-        # All retries failed
-        raise RuntimeError(f"Failed to fetch from {url} after 3 attempts")
+    def _log_retry(self, request_type: str, state: RetryCallState) -> None:
+        """
+        Log a failed attempt before tenacity sleeps and retries it.
+
+        Args:
+            request_type: Hyperliquid request type (payload "type")
+            state: Tenacity retry state for the current call
+        """
+        exc = state.outcome.exception() if state.outcome else None
+        delay = state.next_action.sleep if state.next_action else 0.0
+        self.logger.warning(
+            "Request failed on %s (%r). Retrying in %.1fs... (attempt %d/%d)",
+            request_type, exc, delay, state.attempt_number, self.MAX_ATTEMPTS
+        )
 
     # ============================================
     # API Methods
@@ -206,62 +417,63 @@ class HyperliquidAPIClient:
         """
         # Convert trading pair to coin symbol (BTCUSDT -> BTC)
         coin_symbol = self._extract_coin_symbol(symbol)
-        
-        payload = {"type": "metaAndAssetCtxs"}
 
-        self.logger.info(f"Fetching open interest: {symbol} -> {coin_symbol}")
+        self.logger.info("Fetching open interest: %s -> %s", symbol, coin_symbol)
 
         try:
-            data = await self._post(payload)
-
-            # Parse response structure
-            # Response is a list with 2 elements:
-            # [0] = meta (universe, marginTables, etc.)
-            # [1] = asset contexts (list of OI, funding, markPx, etc.)
-            if not data or not isinstance(data, list) or len(data) < 2:
-                self.logger.warning(f"Unexpected response format for OI: {data}")
+            snapshot = await self._get_asset_ctxs()
+            if snapshot is None:
                 return None
 
-            meta = data[0]
-            asset_ctxs = data[1]
-
-            if not isinstance(asset_ctxs, list):
-                self.logger.warning(f"Asset contexts not a list: {type(asset_ctxs)}")
+            oi = self._build_open_interest(symbol, coin_symbol, *snapshot)
+            if oi is None:
+                self.logger.warning("No OI data found for %s (coin: %s)", symbol, coin_symbol)
                 return None
 
-            coins = meta.get("universe", [])
-
-            # Find the matching coin index
-            for idx, coin_info in enumerate(coins):
-                coin_name = coin_info.get("name", "").upper()
-                if coin_name == coin_symbol.upper():
-                    # Get the context data from the same index
-                    if idx < len(asset_ctxs):
-                        ctx = asset_ctxs[idx]
-                        oi_value = float(ctx.get("openInterest", 0))
-                        mark_price = float(ctx.get("markPx", 0))
-
-                        # Use current time since assetCtxs doesn't include timestamp
-                        from core.utils.time import current_utc_datetime
-
-                        oi = OpenInterest(
-                            exchange="hyperliquid",
-                            symbol=symbol.upper(),  # Keep original symbol for consistency
-                            open_interest=oi_value,
-                            open_interest_value=oi_value * mark_price if mark_price > 0 else None,
-                            timestamp=current_utc_datetime()
-                        )
-
-                        self.logger.info(f"Open interest for {symbol}: {oi.open_interest:,.2f}")
-                        return oi
-
-            self.logger.warning(f"No OI data found for {symbol} (coin: {coin_symbol})")
-            return None
+            self.logger.info("Open interest for %s: %.2f", symbol, oi.open_interest)
+            return oi
 
         except Exception as e:
-            self.logger.error(f"Error fetching open interest for {symbol}: {e}")
+            self.logger.error("Error fetching open interest for %s: %s", symbol, e)
             return None
 
+    async def get_open_interest_many(self, symbols: List[str]) -> Dict[str, OpenInterest]:
+        """
+        Fetch current open interest for several symbols from one snapshot.
+
+        Hyperliquid returns every market in a single metaAndAssetCtxs response,
+        so all lookups share one request instead of one download per symbol.
+
+        Args:
+            symbols: Trading pairs (e.g., ["BTCUSDT", "ETH"])
+
+        Returns:
+            Dict of uppercase symbol -> OpenInterest (symbols not found are omitted)
+
+        Example:
+            >>> ois = await client.get_open_interest_many(["BTCUSDT", "ETHUSDT"])
+            >>> print(ois["BTCUSDT"].open_interest)
+        """
+        self.logger.info("Fetching open interest for %d symbols", len(symbols))
+
+        try:
+            snapshot = await self._get_asset_ctxs()
+            if snapshot is None:
+                return {}
+
+            result: Dict[str, OpenInterest] = {}
+            for symbol in symbols:
+                oi = self._build_open_interest(symbol, self._extract_coin_symbol(symbol), *snapshot)
+                if oi is not None:
+                    result[oi.symbol] = oi
+
+            self.logger.info("Fetched open interest for %d/%d symbols", len(result), len(symbols))
+            return result
+
+        except Exception as e:
+            self.logger.error("Error fetching open interest for %d symbols: %s", len(symbols), e)
+            return {}
+
     async def get_funding_rate(self, symbol: str, limit: int = 100) -> List[FundingRate]:
         """
         Fetch historical funding rates for a symbol.
@@ -312,39 +524,42 @@ class HyperliquidAPIClient:
             "endTime": end_time
         }
 
-        self.logger.info(f"Fetching funding rate history: {symbol} -> {coin_symbol} (limit={limit})")
+        self.logger.info("Fetching funding rate history: %s -> %s (limit=%d)", symbol, coin_symbol, limit)
 
         try:
             data = await self._post(payload)
 
             if not data:
-                self.logger.warning(f"No funding history for {symbol}")
+                self.logger.warning("No funding history for %s", symbol)
                 return []
 
             # Sort by time ascending and take the most recent 'limit' entries
+            # (into a new list: the response may be shared with other callers)
             try:
-                data.sort(key=lambda x: x.get("time", 0))
+                data = sorted(data, key=lambda x: x.get("time", 0))
             except Exception:
                 pass
             funding_data = data[-limit:] if len(data) > limit else data
 
             # Normalize to FundingRate schema
-            funding_rates = [
-                FundingRate(
+            # Values are coerced here, so skip per-item Pydantic validation
+            out_symbol = symbol.upper()
+            funding_rates = []
+            for item in funding_data:
+                funding_time = to_utc_datetime(item["time"])
+                funding_rates.append(FundingRate.model_construct(
                     exchange="hyperliquid",
-                    symbol=symbol.upper(),
+                    symbol=out_symbol,
                     funding_rate=float(item["fundingRate"]),
-                    funding_time=to_utc_datetime(item["time"]),
-                    timestamp=to_utc_datetime(item["time"])
-                )
-                for item in funding_data
-            ]
+                    funding_time=funding_time,
+                    timestamp=funding_time
+                ))
 
-            self.logger.info(f"Fetched {len(funding_rates)} funding rates for {symbol}")
+            self.logger.info("Fetched %d funding rates for %s", len(funding_rates), symbol)
             return funding_rates
 
         except Exception as e:
-            self.logger.error(f"Error fetching funding rate for {symbol}: {e}")
+            self.logger.error("Error fetching funding rate for %s: %s", symbol, e)
             return []
 
     async def get_predicted_funding(self) -> Dict[str, float]:
@@ -352,12 +567,10 @@ class HyperliquidAPIClient:
         Fetch predicted next funding rates for all symbols (HlPerp only summary).
         Deprecated in favor of get_predicted_funding_full which includes venues.
         """
-        payload = {"type": "predictedFundings"}
-
         self.logger.info("Fetching predicted funding rates")
 
         try:
-            data = await self._post(payload)
+            data = await self._get_predicted_fundings()
 
             if not data:
                 self.logger.warning("No predicted funding data")
@@ -369,25 +582,25 @@ class HyperliquidAPIClient:
                 if not isinstance(item, list) or len(item) < 2:
                     continue
 
-                coin = item[0]
-                exchanges_data = item[1]
-
-                # Find Hyperliquid's prediction (HlPerp)
-                for exchange_data in exchanges_data:
-                    if not isinstance(exchange_data, list) or len(exchange_data) < 2:
-                        continue
-
-                    exchange_name = exchange_data[0]
-                    if exchange_name == "HlPerp":
-                        funding_info = exchange_data[1]
-                        result[coin] = float(funding_info.get("fundingRate", 0))
-                        break
+                # Find Hyperliquid's prediction (HlPerp), stopping at the first match
+                funding_info = next(
+                    (
+                        exchange_data[1]
+                        for exchange_data in item[1]
+                        if isinstance(exchange_data, list)
+                        and len(exchange_data) >= 2
+                        and exchange_data[0] == "HlPerp"
+                    ),
+                    None
+                )
+                if funding_info is not None:
+                    result[item[0]] = float(funding_info.get("fundingRate", 0))
 
-            self.logger.info(f"Fetched predicted funding for {len(result)} symbols")
+            self.logger.info("Fetched predicted funding for %d symbols", len(result))
             return result
 
         except Exception as e:
-            self.logger.error(f"Error fetching predicted funding: {e}")
+            self.logger.error("Error fetching predicted funding: %s", e)
             return {}
 
     async def get_predicted_funding_full(self) -> List[PredictedFunding]:
@@ -397,10 +610,9 @@ class HyperliquidAPIClient:
         Returns:
             List[PredictedFunding] with venues including fundingRate and nextFundingTime.
         """
-        payload = {"type": "predictedFundings"}
         self.logger.info("Fetching predicted funding rates (full)")
         try:
-            data = await self._post(payload)
+            data = await self._get_predicted_fundings()
             if not data:
                 return []
 
@@ -422,10 +634,10 @@ class HyperliquidAPIClient:
                         nft_dt = to_utc_datetime(nft) if nft is not None else None
                         venues.append(PredictedVenueFunding(venue=venue_name, funding_rate=rate, next_funding_time=nft_dt))
                 results.append(PredictedFunding(coin=coin, venues=venues))
-            self.logger.info(f"Fetched predicted funding (full) for {len(results)} coins")
+            self.logger.info("Fetched predicted funding (full) for %d coins", len(results))
             return results
         except Exception as e:
-            self.logger.error(f"Error fetching predicted funding (full): {e}")
+            self.logger.error("Error fetching predicted funding (full): %s", e)
             return []
 
     async def get_historical_ohlc(
@@ -445,7 +657,8 @@ class HyperliquidAPIClient:
             end_time: End time in milliseconds
 
         Returns:
-            List of OHLC objects sorted by timestamp (oldest first)
+            List of OHLC objects sorted by timestamp (oldest first); shared
+            with identical concurrent calls, so treat it as read-only
 
         Raises:
             RuntimeError: If API request fails
@@ -480,6 +693,7 @@ class HyperliquidAPIClient:
         Notes:
             - Can fetch up to ~5000 candles per request
             - All timestamps in milliseconds
+            - Response is stream-decoded to cap peak memory on large windows
 
         Example:
             >>> ohlc = await client.get_historical_ohlc("BTCUSDT", "1h", 1720000000000, 1720086400000)
@@ -498,51 +712,155 @@ class HyperliquidAPIClient:
             }
         }
 
-        self.logger.info(f"Fetching historical OHLC: {symbol} -> {coin_symbol} {interval} ({start_time} - {end_time})")
+        self.logger.info(
+            "Fetching historical OHLC: %s -> %s %s (%s - %s)", symbol, coin_symbol, interval, start_time, end_time
+        )
+
+        out_symbol = symbol.upper()  # Keep original symbol for consistency
+
+        def build(item: Dict[str, Any]) -> OHLC:
+            # Normalize to OHLC schema. Values are already coerced and
+            # normalized here, so skip per-candle Pydantic validation.
+            volume = float(item["v"])
+            close = float(item["c"])
+            return OHLC.model_construct(
+                exchange="hyperliquid",
+                symbol=out_symbol,
+                interval=interval,
+                timestamp=to_utc_datetime(item["t"]),
+                open=float(item["o"]),
+                high=float(item["h"]),
+                low=float(item["l"]),
+                close=close,
+                volume=volume,
+                quote_volume=volume * close,  # Estimate quote volume
+                trades_count=int(item.get("n", 0)),
+                is_closed=True  # Historical candles are always closed
+            )
 
         try:
-            data = await self._post(payload)
-
-            if not data:
-                self.logger.warning(f"No OHLC data for {symbol}")
+            # Stream-decode: each candle is normalized as soon as it is parsed.
+            # Identical concurrent requests share one POST and one built list
+            # (build depends only on the payload and out_symbol)
+            key = "candleSnapshot:" + out_symbol + ":" + json.dumps(payload, sort_keys=True, separators=(",", ":"))
+            ohlc_list = await self._single_flight(key, payload, lambda: self._post_items(payload, build))
+
+            if not ohlc_list:
+                self.logger.warning("No OHLC data for %s", symbol)
                 return []
 
-            # Normalize to OHLC schema
-            ohlc_list = [
-                OHLC(
-                    exchange="hyperliquid",
-                    symbol=symbol.upper(),  # Keep original symbol for consistency
-                    interval=interval,
-                    timestamp=to_utc_datetime(item["t"]),
-                    open=float(item["o"]),
-                    high=float(item["h"]),
-                    low=float(item["l"]),
-                    close=float(item["c"]),
-                    volume=float(item["v"]),
-                    quote_volume=float(item.get("v", 0)) * float(item["c"]),  # Estimate quote volume
-                    trades_count=int(item.get("n", 0)),
-                    is_closed=True  # Historical candles are always closed
-                )
-                for item in data
-            ]
-
-            self.logger.info(f"Fetched {len(ohlc_list)} OHLC candles for {symbol}")
+            self.logger.info("Fetched %d OHLC candles for %s", len(ohlc_list), symbol)
             return ohlc_list
 
         except Exception as e:
-            self.logger.error(f"Error fetching historical OHLC for {symbol}: {e}")
+            self.logger.error("Error fetching historical OHLC for %s: %s", symbol, e)
             return []
 
+    # ============================================
+    # Snapshot Cache
+    # ============================================
+
+    async def _get_asset_ctxs(self) -> Optional[Tuple[Dict[str, int], List[Dict[str, Any]]]]:
+        """
+        Get the all-market asset contexts, reusing a recent snapshot.
+
+        Returns:
+            (coin name -> index, asset contexts) or None if the response is malformed
+
+        Notes:
+            - Response is a list with 2 elements:
+              [0] = meta (universe, marginTables, etc.)
+              [1] = asset contexts (list of OI, funding, markPx, etc.)
+            - Snapshots younger than SNAPSHOT_TTL are served from memory
+        """
+        cached = self._ctx_cache
+        if cached is not None and time.monotonic() - cached[0] < self.SNAPSHOT_TTL:
+            return cached[1], cached[2]
+
+        data = await self._post({"type": "metaAndAssetCtxs"})
+
+        if not data or not isinstance(data, list) or len(data) < 2:
+            self.logger.warning("Unexpected response format for OI: %s", data)
+            return None
+
+        meta = data[0]
+        asset_ctxs = data[1]
+
+        if not isinstance(asset_ctxs, list):
+            self.logger.warning("Asset contexts not a list: %s", type(asset_ctxs))
+            return None
+
+        name_to_idx = {
+            coin_info.get("name", "").upper(): idx
+            for idx, coin_info in enumerate(meta.get("universe", []))
+        }
+
+        self._ctx_cache = (time.monotonic(), name_to_idx, asset_ctxs)
+        return name_to_idx, asset_ctxs
+
+    async def _get_predicted_fundings(self) -> List[Any]:
+        """
+        Get the raw predictedFundings response, reusing a recent snapshot.
+
+        Returns:
+            Raw response list ([[coin, [[venue, info], ...]], ...]); treat as read-only
+        """
+        cached = self._predicted_cache
+        if cached is not None and time.monotonic() - cached[0] < self.SNAPSHOT_TTL:
+            return cached[1]
+
+        data = await self._post({"type": "predictedFundings"})
+        if data:
+            self._predicted_cache = (time.monotonic(), data)
+        return data
+
     # ============================================
     # Helper Methods
     # ============================================
 
+    def _build_open_interest(
+        self,
+        symbol: str,
+        coin_symbol: str,
+        name_to_idx: Dict[str, int],
+        asset_ctxs: List[Dict[str, Any]]
+    ) -> Optional[OpenInterest]:
+        """
+        Build an OpenInterest for one coin from an asset-context snapshot.
+
+        Args:
+            symbol: Requested trading pair (kept as the output symbol)
+            coin_symbol: Hyperliquid coin name (e.g., "BTC")
+            name_to_idx: Coin name -> index into asset_ctxs
+            asset_ctxs: Asset contexts from metaAndAssetCtxs
+
+        Returns:
+            OpenInterest or None if the coin is not listed
+        """
+        idx = name_to_idx.get(coin_symbol.upper())
+        if idx is None or idx >= len(asset_ctxs):
+            return None
+
+        ctx = asset_ctxs[idx]
+        oi_value = float(ctx.get("openInterest", 0))
+        mark_price = float(ctx.get("markPx", 0))
+
+        return OpenInterest(
+            exchange="hyperliquid",
+            symbol=symbol.upper(),  # Keep original symbol for consistency
+            open_interest=oi_value,
+            open_interest_value=oi_value * mark_price if mark_price > 0 else None,
+            # Use current time since assetCtxs doesn't include timestamp
+            timestamp=current_utc_datetime()
+        )
+
     def _extract_coin_symbol(self, symbol: str) -> str:
         """
         Extract coin symbol from trading pair for Hyperliquid API.
         
         Hyperliquid uses single coin symbols (BTC, ETH) instead of trading pairs (BTCUSDT, ETHUSDT).
-        This method converts trading pairs to the appropriate coin symbol.
+        This method converts trading pairs to the appropriate coin symbol
+        using the shared lookup tables in exchanges.hyperliquid.symbols.
         
         Args:
             symbol: Trading pair symbol (e.g., "BTCUSDT", "ETHUSDT", "BTC", "ETH")
@@ -558,166 +876,4 @@ class HyperliquidAPIClient:
             >>> client._extract_coin_symbol("BTC")
             "BTC"
         """
-        symbol = symbol.upper()
-        
-        # Common trading pairs to coin mapping
-        pair_to_coin = {
-            "BTCUSDT": "BTC",
-            "ETHUSDT": "ETH", 
-            "SOLUSDT": "SOL",
-            "AVAXUSDT": "AVAX",
-            "MATICUSDT": "MATIC",
-            "DOGEUSDT": "DOGE",
-            "ADAUSDT": "ADA",
-            "DOTUSDT": "DOT",
-            "LINKUSDT": "LINK",
-            "UNIUSDT": "UNI",
-            "ATOMUSDT": "ATOM",
-            "NEARUSDT": "NEAR",
-            "FTMUSDT": "FTM",
-            "ALGOUSDT": "ALGO",
-            "ICPUSDT": "ICP",
-            "VETUSDT": "VET",
-            "FILUSDT": "FIL",
-            "TRXUSDT": "TRX",
-            "ETCUSDT": "ETC",
-            "XLMUSDT": "XLM",
-            "BCHUSDT": "BCH",
-            "LTCUSDT": "LTC",
-            "XRPUSDT": "XRP",
-            "BNBUSDT": "BNB",
-            "ADAUSDT": "ADA",
-            "SHIBUSDT": "SHIB",
-            "APEUSDT": "APE",
-            "SANDUSDT": "SAND",
-            "MANAUSDT": "MANA",
-            "AXSUSDT": "AXS",
-            "CRVUSDT": "CRV",
-            "COMPUSDT": "COMP",
-            "MKRUSDT": "MKR",
-            "SNXUSDT": "SNX",
-            "YFIUSDT": "YFI",
-            "SUSHIUSDT": "SUSHI",
-            "1INCHUSDT": "1INCH",
-            "AAVEUSDT": "AAVE",
-            "GRTUSDT": "GRT",
-            "BATUSDT": "BAT",
-            "ZRXUSDT": "ZRX",
-            "ENJUSDT": "ENJ",
-            "CHZUSDT": "CHZ",
-            "HOTUSDT": "HOT",
-            "ZILUSDT": "ZIL",
-            "IOTAUSDT": "IOTA",
-            "ONTUSDT": "ONT",
-            "QTUMUSDT": "QTUM",
-            "NEOUSDT": "NEO",
-            "WAVESUSDT": "WAVES",
-            "OMGUSDT": "OMG",
-            "ZECUSDT": "ZEC",
-            "DASHUSDT": "DASH",
-            "XMRUSDT": "XMR",
-            "EOSUSDT": "EOS",
-            "IOSTUSDT": "IOST",
-            "NANOUSDT": "NANO",
-            "DGBUSDT": "DGB",
-            "RVNUSDT": "RVN",
-            "SCUSDT": "SC",
-            "STORJUSDT": "STORJ",
-            "KNCUSDT": "KNC",
-            "REPUSDT": "REP",
-            "LSKUSDT": "LSK",
-            "ARDRUSDT": "ARDR",
-            "ARKUSDT": "ARK",
-            "STRATUSDT": "STRAT",
-            "FUNUSDT": "FUN",
-            "REQUSDT": "REQ",
-            "XEMUSDT": "XEM",
-            "ICXUSDT": "ICX",
-            "VENUSDT": "VEN",
-            "POWRUSDT": "POWR",
-            "LENDUSDT": "LEND",
-            "ADXUSDT": "ADX",
-            "BNTUSDT": "BNT",
-            "CMTUSDT": "CMT",
-            "DNTUSDT": "DNT",
-            "GTOUSDT": "GTO",
-            "ICNUSDT": "ICN",
-            "MCOUSDT": "MCO",
-            "WTCUSDT": "WTC",
-            "LRCUSDT": "LRC",
-            "TNTUSDT": "TNT",
-            "FUELUSDT": "FUEL",
-            "MANAUSDT": "MANA",
-            "BCPTUSDT": "BCPT",
-            "BNBUSDT": "BNB",
-            "NEBLUSDT": "NEBL",
-            "GASUSDT": "GAS",
-            "NAVUSDT": "NAV",
-            "TRIGUSDT": "TRIG",
-            "APPCUSDT": "APPC",
-            "VIBUSDT": "VIB",
-            "RLCUSDT": "RLC",
-            "INSUSDT": "INS",
-            "PIVXUSDT": "PIVX",
-            "IOSTUSDT": "IOST",
-            "CHATUSDT": "CHAT",
-            "STEEMUSDT": "STEEM",
-            "NANOUSDT": "NANO",
-            "VIAUSDT": "VIA",
-            "BLZUSDT": "BLZ",
-            "AEUSDT": "AE",
-            "RPXUSDT": "RPX",
-            "NCASHUSDT": "NCASH",
-            "POAUSDT": "POA",
-            "ZILUSDT": "ZIL",
-            "ONTUSDT": "ONT",
-            "STXUSDT": "STX",
-            "QKCUSDT": "QKC",
-            "LSKUSDT": "LSK",
-            "ADAUSDT": "ADA",
-            "XLMUSDT": "XLM",
-            "IOTAUSDT": "IOTA",
-            "NEOUSDT": "NEO",
-            "XRPUSDT": "XRP",
-            "ETCUSDT": "ETC",
-            "BCHUSDT": "BCH",
-            "LTCUSDT": "LTC",
-            "BTCUSDT": "BTC",
-            "ETHUSDT": "ETH"
-        }
-        
-        # Check if it's a known trading pair
-        if symbol in pair_to_coin:
-            return pair_to_coin[symbol]
-        
-        # If it's already a single coin symbol, return as-is
-        # Common single coin symbols
-        single_coins = {
-            "BTC", "ETH", "SOL", "AVAX", "MATIC", "DOGE", "ADA", "DOT", "LINK", 
-            "UNI", "ATOM", "NEAR", "FTM", "ALGO", "ICP", "VET", "FIL", "TRX", 
-            "ETC", "XLM", "BCH", "LTC", "XRP", "BNB", "SHIB", "APE", "SAND", 
-            "MANA", "AXS", "CRV", "COMP", "MKR", "SNX", "YFI", "SUSHI", "1INCH", 
-            "AAVE", "GRT", "BAT", "ZRX", "ENJ", "CHZ", "HOT", "ZIL", "IOTA", 
-            "ONT", "QTUM", "NEO", "WAVES", "OMG", "ZEC", "DASH", "XMR", "EOS", 
-            "IOST", "NANO", "DGB", "RVN", "SC", "STORJ", "KNC", "REP", "LSK", 
-            "ARDR", "ARK", "STRAT", "FUN", "REQ", "XEM", "ICX", "VEN", "POWR", 
-            "LEND", "ADX", "BNT", "CMT", "DNT", "GTO", "ICN", "MCO", "WTC", 
-            "LRC", "TNT", "FUEL", "BCPT", "NEBL", "GAS", "NAV", "TRIG", "APPC", 
-            "VIB", "RLC", "INS", "PIVX", "CHAT", "STEEM", "VIA", "BLZ", "AE", 
-            "RPX", "NCASH", "POA", "STX", "QKC"
-        }
-        
-        if symbol in single_coins:
-            return symbol
-        
-        # If we can't determine the coin, try to extract from common patterns
-        # Remove common suffixes
-        for suffix in ["USDT", "USDC", "BUSD", "DAI", "TUSD", "USDP"]:
-            if symbol.endswith(suffix):
-                coin = symbol[:-len(suffix)]
-                if coin in single_coins:
-                    return coin
-        
-        # Default fallback - return the symbol as-is and let the API handle it
-        self.logger.warning(f"Unknown symbol format: {symbol}, using as-is")
-        return symbol
+        return extract_coin_symbol(symbol)
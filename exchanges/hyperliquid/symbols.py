@@ -0,0 +1,76 @@
+"""
+Hyperliquid Symbol Helpers
+
+Hyperliquid identifies markets by coin (BTC, ETH) rather than by trading
+pair (BTCUSDT, ETHUSDT). This module holds the lookup tables used to map
+the pair symbols accepted by our API onto Hyperliquid coin names.
+
+The tables are built once at import time and folded into a single map, so
+symbol resolution is one hash lookup instead of rebuilding ~200-entry
+literals and scanning quote suffixes on every call.
+"""
+
+from typing import Dict, FrozenSet, Tuple
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# Known Hyperliquid coin symbols
+SINGLE_COINS: FrozenSet[str] = frozenset({
+    "BTC", "ETH", "SOL", "AVAX", "MATIC", "DOGE", "ADA", "DOT", "LINK",
+    "UNI", "ATOM", "NEAR", "FTM", "ALGO", "ICP", "VET", "FIL", "TRX",
+    "ETC", "XLM", "BCH", "LTC", "XRP", "BNB", "SHIB", "APE", "SAND",
+    "MANA", "AXS", "CRV", "COMP", "MKR", "SNX", "YFI", "SUSHI", "1INCH",
+    "AAVE", "GRT", "BAT", "ZRX", "ENJ", "CHZ", "HOT", "ZIL", "IOTA",
+    "ONT", "QTUM", "NEO", "WAVES", "OMG", "ZEC", "DASH", "XMR", "EOS",
+    "IOST", "NANO", "DGB", "RVN", "SC", "STORJ", "KNC", "REP", "LSK",
+    "ARDR", "ARK", "STRAT", "FUN", "REQ", "XEM", "ICX", "VEN", "POWR",
+    "LEND", "ADX", "BNT", "CMT", "DNT", "GTO", "ICN", "MCO", "WTC",
+    "LRC", "TNT", "FUEL", "BCPT", "NEBL", "GAS", "NAV", "TRIG", "APPC",
+    "VIB", "RLC", "INS", "PIVX", "CHAT", "STEEM", "VIA", "BLZ", "AE",
+    "RPX", "NCASH", "POA", "STX", "QKC"
+})
+
+# Common trading pairs to coin mapping (e.g., "BTCUSDT" -> "BTC")
+PAIR_TO_COIN: Dict[str, str] = {f"{coin}USDT": coin for coin in SINGLE_COINS}
+
+# Quote-currency suffixes stripped when resolving unknown pairs
+QUOTE_SUFFIXES: Tuple[str, ...] = ("USDT", "USDC", "BUSD", "DAI", "TUSD", "USDP")
+
+# Every accepted spelling -> coin: each coin with every quote suffix, then bare
+# coins and known pairs (later entries win, matching the old lookup order)
+SYMBOL_TO_COIN: Dict[str, str] = {
+    **{f"{coin}{suffix}": coin for coin in SINGLE_COINS for suffix in QUOTE_SUFFIXES},
+    **{coin: coin for coin in SINGLE_COINS},
+    **PAIR_TO_COIN,
+}
+
+
+def extract_coin_symbol(symbol: str) -> str:
+    """
+    Extract coin symbol from trading pair for Hyperliquid API.
+
+    Args:
+        symbol: Trading pair symbol (e.g., "BTCUSDT", "ETHUSDT", "BTC", "ETH")
+
+    Returns:
+        Coin symbol for Hyperliquid API (e.g., "BTC", "ETH"). Unknown symbols
+        are returned uppercased and as-is.
+
+    Examples:
+        >>> extract_coin_symbol("BTCUSDT")
+        "BTC"
+        >>> extract_coin_symbol("eth")
+        "ETH"
+    """
+    symbol = symbol.upper()
+
+    coin = SYMBOL_TO_COIN.get(symbol)
+    if coin is not None:
+        return coin
+
+    # Default fallback - return the symbol as-is and let the API handle it
+    logger.warning("Unknown symbol format: %s, using as-is", symbol)
+    return symbol
@@ -23,12 +23,58 @@ Usage:
 """
 
 import asyncio
+import logging
+import re
+import socket
 import websockets
-import json
-from typing import AsyncGenerator, Optional
+import orjson
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from websockets.typing import Data
+
 from core.logging import get_logger
 from core.schemas import OHLC, LargeTrade
-from core.utils.time import to_utc_datetime
+from .symbols import extract_coin_symbol
+
+# Exchange identifier stamped on every normalized message
+_EXCHANGE = "hyperliquid"
+
+# Channel names of data frames (anything else is a control/ack frame)
+_CANDLE_CHANNEL = "candle"
+_TRADES_CHANNEL = "trades"
+
+# Subscription frames only vary by coin/interval, so they are formatted from
+# pre-serialized templates instead of building and encoding a dict
+_CANDLE_SUB_TEMPLATE = '{"method":"subscribe","subscription":{"type":"candle","coin":"%s","interval":"%s"}}'
+_TRADES_SUB_TEMPLATE = '{"method":"subscribe","subscription":{"type":"trades","coin":"%s"}}'
+_JSON_ESCAPE_NEEDED = re.compile(r'["\\\x00-\x1f]')
+
+
+def _subscription_frame(template: str, *fields: str) -> str:
+    """Fill a subscription template, JSON-escaping any field that needs it."""
+    return template % tuple(
+        orjson.dumps(field).decode()[1:-1] if _JSON_ESCAPE_NEEDED.search(field) else field
+        for field in fields
+    )
+
+
+# Hyperliquid stamps frames in epoch milliseconds; convert directly instead of
+# going through to_utc_datetime's seconds/milliseconds detection on every frame
+_UTC = timezone.utc
+
+# Optional: fastnumbers ships a drop-in float() with a faster C parser for
+# the decimal strings Hyperliquid sends for prices and sizes
+try:
+    from fastnumbers import float as _parse_float
+except ImportError:
+    _parse_float = float
+
+
+def _to_float(value: Union[str, float]) -> float:
+    """Coerce a numeric field, passing through values already decoded as float."""
+    if type(value) is float:
+        return value
+    return _parse_float(value)
 
 
 class HyperliquidWSClient:
@@ -53,10 +99,24 @@ class HyperliquidWSClient:
         - Reconnects automatically with exponential backoff
         - Normalizes all data to standard schemas
         - Handles both live updates and backfill data
+        - uvloop is recommended for high-rate streams; standalone scripts can
+          call HyperliquidWSClient.install_uvloop() before starting the loop
+          (the API server already runs on uvloop via uvicorn[standard])
+        - Instantiate the client directly; the symbol and interval are passed
+          to stream_ohlc/stream_trades (there are no per-stream factories)
     """
 
     BASE_URL = "wss://api.hyperliquid.xyz/ws"
 
+    # Frames are small and decoded immediately, so permessage-deflate only costs
+    # CPU (and per-connection zlib buffers). Reads pause after MAX_QUEUE
+    # buffered frames, half the websockets default of 32, so a slow consumer
+    # applies backpressure sooner; frame size stays at the 1 MiB default.
+    MAX_QUEUE = 16
+
+    # Kernel receive buffer requested for the stream socket (bytes)
+    RECV_BUFFER_SIZE = 1 << 20
+
     def __init__(self, max_reconnect_delay: int = 30):
         """
         Initialize WebSocket client.
@@ -66,7 +126,34 @@ class HyperliquidWSClient:
         """
         self.max_reconnect_delay = max_reconnect_delay
         self.logger = get_logger(__name__)
-        self._reconnect_attempt = 0
+
+    # ============================================
+    # Event Loop
+    # ============================================
+
+    @staticmethod
+    def install_uvloop() -> bool:
+        """
+        Use uvloop as the asyncio event loop implementation, if installed.
+
+        Must be called once at program entry, before the event loop is
+        created (i.e. before asyncio.run()). Has no effect on a loop that
+        is already running.
+
+        Returns:
+            True if uvloop was installed, False if it is not available
+
+        Example:
+            >>> HyperliquidWSClient.install_uvloop()
+            >>> asyncio.run(main())
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return False
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
 
     # ============================================
     # WebSocket Connection Helper
@@ -74,13 +161,15 @@ class HyperliquidWSClient:
 
     async def _connect_and_subscribe(
         self,
-        subscription: dict
+        frame: str,
+        stream_type: str
     ) -> websockets.WebSocketClientProtocol:
         """
         Connect to WebSocket and send subscription message.
 
         Args:
-            subscription: Subscription payload (will be JSON encoded)
+            frame: Pre-encoded JSON subscription message (sent as a text frame)
+            stream_type: Subscription type for logging (e.g., "candle", "trades")
 
         Returns:
             WebSocket connection
@@ -88,12 +177,58 @@ class HyperliquidWSClient:
         Raises:
             Exception: If connection or subscription fails
         """
-        ws = await websockets.connect(self.BASE_URL)
-        await ws.send(json.dumps(subscription))
-        self.logger.info(f"Subscribed to {subscription.get('type', 'unknown')} stream")
-        self._reconnect_attempt = 0
+        ws = await websockets.connect(
+            self.BASE_URL,
+            compression=None,
+            max_queue=self.MAX_QUEUE,
+        )
+        self._tune_socket(ws)
+        await ws.send(frame)
+        self.logger.info(f"Subscribed to {stream_type} stream")
         return ws
 
+    def _tune_socket(self, ws: websockets.WebSocketClientProtocol) -> None:
+        """
+        Enlarge the receive buffer and disable Nagle on the stream socket.
+
+        Must run before the first recv so bursts of frames can land in one
+        wakeup. asyncio already sets TCP_NODELAY on TCP transports; it is set
+        here explicitly so the behavior does not depend on the event loop.
+        Failures are logged and ignored - the stream works without tuning.
+        """
+        sock = ws.transport.get_extra_info("socket") if ws.transport else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECV_BUFFER_SIZE)
+        except OSError as e:
+            self.logger.debug("Could not tune WebSocket socket: %s", e)
+
+    @staticmethod
+    async def _recv_batch(ws: websockets.WebSocketClientProtocol) -> List[Data]:
+        """
+        Wait for the next frame, then drain every frame already buffered.
+
+        Bursts (e.g. backfill right after subscribing) are handed to the
+        parser in one go instead of one await per frame. Draining goes
+        through recv() - which returns immediately while frames are
+        buffered - so websockets' flow control is still notified.
+
+        Args:
+            ws: Open WebSocket connection
+
+        Returns:
+            List of raw frames (at least one)
+
+        Raises:
+            websockets.exceptions.ConnectionClosed: If the connection closes
+        """
+        batch = [await ws.recv()]
+        while ws.messages:
+            batch.append(await ws.recv())
+        return batch
+
     # ============================================
     # OHLC (Candles) Stream
     # ============================================
@@ -119,10 +254,11 @@ class HyperliquidWSClient:
             OHLC: Normalized candlestick data
 
         Reconnection Strategy:
-            - Attempt 1: Wait 1 second
-            - Attempt 2: Wait 2 seconds
-            - Attempt 3: Wait 4 seconds
-            - Attempt N: Wait min(2^(N-1), max_reconnect_delay) seconds
+            - A connection that delivered data and then dropped is retried
+              immediately, and the backoff resets
+            - Otherwise (connect failed, or the server closed the socket
+              before any data arrived) attempt N waits
+              min(2^(N-1), max_reconnect_delay) seconds: 1s, 2s, 4s, ...
 
         Hyperliquid Message Format:
             {
@@ -145,62 +281,86 @@ class HyperliquidWSClient:
         """
         # Convert trading pair to coin symbol (BTCUSDT -> BTC)
         coin_symbol = self._extract_coin_symbol(symbol)
-        
-        subscription = {
-            "method": "subscribe",
-            "subscription": {
-                "type": "candle",
-                "coin": coin_symbol.upper(),
-                "interval": interval
-            }
-        }
+        symbol_up = symbol.upper()  # Keep original symbol for consistency
+
+        # Encoded once and reused on every reconnect (text frame)
+        frame = _subscription_frame(_CANDLE_SUB_TEMPLATE, coin_symbol, interval)
 
         self.logger.info(f"Subscribing to Hyperliquid OHLC: {symbol} -> {coin_symbol} {interval}")
 
-        while True:
-            try:
-                ws = await self._connect_and_subscribe(subscription)
+        # Resolve the level once per stream rather than on every skipped frame
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Normalize to OHLC schema. Fields are coerced here, so skip Pydantic
+        # validation on the per-frame path. Per-stream constants and globals are
+        # bound as defaults so the builder only touches fast locals.
+        def build_ohlc(
+            candle_data: Dict[str, Any],
+            _construct=OHLC.model_construct,
+            _exchange=_EXCHANGE,
+            _symbol=symbol_up,
+            _interval=interval,
+            _to_float=_to_float,
+            _fromtimestamp=datetime.fromtimestamp,
+            _utc=_UTC,
+        ) -> OHLC:
+            volume = _to_float(candle_data["v"])
+            close = _to_float(candle_data["c"])
+            return _construct(
+                exchange=_exchange,
+                symbol=_symbol,
+                interval=_interval,
+                timestamp=_fromtimestamp(candle_data["t"] / 1000, _utc),
+                open=_to_float(candle_data["o"]),
+                high=_to_float(candle_data["h"]),
+                low=_to_float(candle_data["l"]),
+                close=close,
+                volume=volume,
+                quote_volume=volume * close,  # Estimate
+                trades_count=int(candle_data.get("n", 0)),
+                is_closed=bool(candle_data.get("closed", False))
+            )
 
-                # Listen for messages
-                async for message in ws:
-                    try:
-                        data = json.loads(message)
+        # Per-stream backoff state, so concurrent streams on one client
+        # don't reset or inflate each other's delays
+        reconnect_attempt = 0
 
-                        # Skip non-data messages (e.g., subscription confirmations)
-                        if "channel" not in data or data.get("channel") != "candle":
-                            self.logger.debug(f"Skipping non-candle message: {data}")
+        while True:
+            try:
+                got_data = False
+                ws = await self._connect_and_subscribe(frame, "candle")
+
+                # Listen for messages, a buffered burst at a time
+                while True:
+                    for message in await self._recv_batch(ws):
+                        try:
+                            data = orjson.loads(message)
+
+                            # Skip non-data messages (e.g., subscription confirmations)
+                            if data.get("channel") != _CANDLE_CHANNEL:
+                                if log_debug:
+                                    self.logger.debug("Skipping non-candle message: %s", data)
+                                continue
+
+                            candle_data = data.get("data")
+                            if not candle_data:
+                                continue
+
+                            got_data = True
+                            yield build_ohlc(candle_data)
+
+                        except orjson.JSONDecodeError as e:
+                            self.logger.error("Failed to parse JSON: %s... Error: %s", message[:100], e)
                             continue
-
-                        candle_data = data.get("data")
-                        if not candle_data:
+                        except KeyError as e:
+                            self.logger.error("Missing field in candle data: %s. Data: %s", e, data)
+                            continue
+                        except Exception as e:
+                            self.logger.error("Error processing candle: %s", e)
                             continue
 
-                        # Normalize to OHLC schema
-                        yield OHLC(
-                            exchange="hyperliquid",
-                            symbol=symbol.upper(),  # Keep original symbol for consistency
-                            interval=interval,
-                            timestamp=to_utc_datetime(candle_data["t"]),
-                            open=float(candle_data["o"]),
-                            high=float(candle_data["h"]),
-                            low=float(candle_data["l"]),
-                            close=float(candle_data["c"]),
-                            volume=float(candle_data["v"]),
-                            quote_volume=float(candle_data["v"]) * float(candle_data["c"]),  # Estimate
-                            trades_count=int(candle_data.get("n", 0)),
-                            is_closed=candle_data.get("closed", False)
-                        )
-
-                    except json.JSONDecodeError as e:
-                        self.logger.error(f"Failed to parse JSON: {message[:100]}... Error: {e}")
-                        continue
-                    except KeyError as e:
-                        self.logger.error(f"Missing field in candle data: {e}. Data: {data}")
-                        continue
-                    except Exception as e:
-                        self.logger.error(f"Error processing candle: {e}")
-                        continue
-
+            except websockets.exceptions.ConnectionClosedOK:
+                self.logger.info("OHLC stream closed by server")
             except websockets.exceptions.WebSocketException as e:
                 self.logger.error(f"WebSocket error: {e}")
             except asyncio.CancelledError:
@@ -209,13 +369,19 @@ class HyperliquidWSClient:
             except Exception as e:
                 self.logger.error(f"Unexpected error in OHLC stream: {e}")
 
-            # Reconnect logic with exponential backoff
-            self._reconnect_attempt += 1
-            delay = min(2 ** (self._reconnect_attempt - 1), self.max_reconnect_delay)
+            # Reconnect logic with exponential backoff; only a connection that
+            # delivered data resets it (and is retried immediately)
+            if got_data:
+                reconnect_attempt = 0
+                delay = 0
+            else:
+                reconnect_attempt += 1
+                delay = min(2 ** (reconnect_attempt - 1), self.max_reconnect_delay)
             self.logger.warning(
-                f"Reconnecting to OHLC stream in {delay}s... (attempt {self._reconnect_attempt})"
+                f"Reconnecting to OHLC stream in {delay}s... (attempt {reconnect_attempt})"
             )
-            await asyncio.sleep(delay)
+            if delay:
+                await asyncio.sleep(delay)
 
     # ============================================
     # Trades Stream
@@ -263,67 +429,85 @@ class HyperliquidWSClient:
         """
         # Convert trading pair to coin symbol (BTCUSDT -> BTC)
         coin_symbol = self._extract_coin_symbol(symbol)
-        
-        subscription = {
-            "method": "subscribe",
-            "subscription": {
-                "type": "trades",
-                "coin": coin_symbol.upper()
-            }
-        }
+        symbol_up = symbol.upper()
+
+        # Encoded once and reused on every reconnect (text frame)
+        frame = _subscription_frame(_TRADES_SUB_TEMPLATE, coin_symbol)
 
         self.logger.info(f"Subscribing to Hyperliquid trades: {symbol} -> {coin_symbol}")
 
-        while True:
-            try:
-                ws = await self._connect_and_subscribe(subscription)
+        # Resolve the level once per stream rather than on every skipped frame
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Fields are coerced here; skip Pydantic validation. Per-stream
+        # constants and globals are bound as defaults (fast locals).
+        def build_trade(
+            trade: Dict[str, Any],
+            _construct=LargeTrade.model_construct,
+            _exchange=_EXCHANGE,
+            _symbol=symbol_up,
+            _to_float=_to_float,
+            _fromtimestamp=datetime.fromtimestamp,
+            _utc=_UTC,
+        ) -> LargeTrade:
+            # Determine side
+            # "B" = buy (buyer is taker), "A" = sell/ask (seller is taker)
+            raw_side = trade.get("side", "")
+            price = _to_float(trade["px"])
+            quantity = _to_float(trade["sz"])
+            return _construct(
+                exchange=_exchange,
+                symbol=_symbol,
+                side="buy" if raw_side == "B" else "sell",
+                price=price,
+                quantity=quantity,
+                value=price * quantity,
+                is_buyer_maker=raw_side == "A",  # If sell, buyer was maker
+                timestamp=_fromtimestamp(trade["time"] / 1000, _utc)
+            )
 
-                # Listen for messages
-                async for message in ws:
-                    try:
-                        data = json.loads(message)
+        # Per-stream backoff state, so concurrent streams on one client
+        # don't reset or inflate each other's delays
+        reconnect_attempt = 0
 
-                        # Skip non-data messages (e.g., subscription confirmations)
-                        if "channel" not in data or data.get("channel") != "trades":
-                            self.logger.debug(f"Skipping non-trade message: {data}")
+        while True:
+            try:
+                got_data = False
+                ws = await self._connect_and_subscribe(frame, "trades")
+
+                # Listen for messages, a buffered burst at a time
+                while True:
+                    for message in await self._recv_batch(ws):
+                        try:
+                            data = orjson.loads(message)
+
+                            # Skip non-data messages (e.g., subscription confirmations)
+                            if data.get("channel") != _TRADES_CHANNEL:
+                                if log_debug:
+                                    self.logger.debug("Skipping non-trade message: %s", data)
+                                continue
+
+                            trades_data = data.get("data", [])
+                            if not trades_data:
+                                continue
+
+                            # Process each trade in the batch
+                            got_data = True
+                            for trade in trades_data:
+                                yield build_trade(trade)
+
+                        except orjson.JSONDecodeError as e:
+                            self.logger.error("Failed to parse JSON: %s... Error: %s", message[:100], e)
                             continue
-
-                        trades_data = data.get("data", [])
-                        if not trades_data:
+                        except KeyError as e:
+                            self.logger.error("Missing field in trade data: %s. Data: %s", e, data)
+                            continue
+                        except Exception as e:
+                            self.logger.error("Error processing trade: %s", e)
                             continue
 
-                        # Process each trade in the batch
-                        for trade in trades_data:
-                            # Determine side
-                            # "B" = buy (buyer is taker), "A" = sell/ask (seller is taker)
-                            raw_side = trade.get("side", "")
-                            side = "buy" if raw_side == "B" else "sell"
-                            is_buyer_maker = raw_side == "A"  # If sell, buyer was maker
-
-                            price = float(trade["px"])
-                            quantity = float(trade["sz"])
-
-                            yield LargeTrade(
-                                exchange="hyperliquid",
-                                symbol=symbol.upper(),
-                                side=side,
-                                price=price,
-                                quantity=quantity,
-                                value=price * quantity,
-                                is_buyer_maker=is_buyer_maker,
-                                timestamp=to_utc_datetime(trade["time"])
-                            )
-
-                    except json.JSONDecodeError as e:
-                        self.logger.error(f"Failed to parse JSON: {message[:100]}... Error: {e}")
-                        continue
-                    except KeyError as e:
-                        self.logger.error(f"Missing field in trade data: {e}. Data: {data}")
-                        continue
-                    except Exception as e:
-                        self.logger.error(f"Error processing trade: {e}")
-                        continue
-
+            except websockets.exceptions.ConnectionClosedOK:
+                self.logger.info("Trades stream closed by server")
             except websockets.exceptions.WebSocketException as e:
                 self.logger.error(f"WebSocket error: {e}")
             except asyncio.CancelledError:
@@ -332,13 +516,19 @@ class HyperliquidWSClient:
             except Exception as e:
                 self.logger.error(f"Unexpected error in trades stream: {e}")
 
-            # Reconnect logic with exponential backoff
-            self._reconnect_attempt += 1
-            delay = min(2 ** (self._reconnect_attempt - 1), self.max_reconnect_delay)
+            # Reconnect logic with exponential backoff; only a connection that
+            # delivered data resets it (and is retried immediately)
+            if got_data:
+                reconnect_attempt = 0
+                delay = 0
+            else:
+                reconnect_attempt += 1
+                delay = min(2 ** (reconnect_attempt - 1), self.max_reconnect_delay)
             self.logger.warning(
-                f"Reconnecting to trades stream in {delay}s... (attempt {self._reconnect_attempt})"
+                f"Reconnecting to trades stream in {delay}s... (attempt {reconnect_attempt})"
             )
-            await asyncio.sleep(delay)
+            if delay:
+                await asyncio.sleep(delay)
 
     # ============================================
     # Helper Methods
@@ -349,7 +539,8 @@ class HyperliquidWSClient:
         Extract coin symbol from trading pair for Hyperliquid API.
         
         Hyperliquid uses single coin symbols (BTC, ETH) instead of trading pairs (BTCUSDT, ETHUSDT).
-        This method converts trading pairs to the appropriate coin symbol.
+        This method converts trading pairs to the appropriate coin symbol
+        using the shared lookup tables in exchanges.hyperliquid.symbols.
         
         Args:
             symbol: Trading pair symbol (e.g., "BTCUSDT", "ETHUSDT", "BTC", "ETH")
@@ -365,189 +556,5 @@ class HyperliquidWSClient:
             >>> client._extract_coin_symbol("BTC")
             "BTC"
         """
-        symbol = symbol.upper()
-        
-        # Common trading pairs to coin mapping
-        pair_to_coin = {
-            "BTCUSDT": "BTC",
-            "ETHUSDT": "ETH", 
-            "SOLUSDT": "SOL",
-            "AVAXUSDT": "AVAX",
-            "MATICUSDT": "MATIC",
-            "DOGEUSDT": "DOGE",
-            "ADAUSDT": "ADA",
-            "DOTUSDT": "DOT",
-            "LINKUSDT": "LINK",
-            "UNIUSDT": "UNI",
-            "ATOMUSDT": "ATOM",
-            "NEARUSDT": "NEAR",
-            "FTMUSDT": "FTM",
-            "ALGOUSDT": "ALGO",
-            "ICPUSDT": "ICP",
-            "VETUSDT": "VET",
-            "FILUSDT": "FIL",
-            "TRXUSDT": "TRX",
-            "ETCUSDT": "ETC",
-            "XLMUSDT": "XLM",
-            "BCHUSDT": "BCH",
-            "LTCUSDT": "LTC",
-            "XRPUSDT": "XRP",
-            "BNBUSDT": "BNB",
-            "SHIBUSDT": "SHIB",
-            "APEUSDT": "APE",
-            "SANDUSDT": "SAND",
-            "MANAUSDT": "MANA",
-            "AXSUSDT": "AXS",
-            "CRVUSDT": "CRV",
-            "COMPUSDT": "COMP",
-            "MKRUSDT": "MKR",
-            "SNXUSDT": "SNX",
-            "YFIUSDT": "YFI",
-            "SUSHIUSDT": "SUSHI",
-            "1INCHUSDT": "1INCH",
-            "AAVEUSDT": "AAVE",
-            "GRTUSDT": "GRT",
-            "BATUSDT": "BAT",
-            "ZRXUSDT": "ZRX",
-            "ENJUSDT": "ENJ",
-            "CHZUSDT": "CHZ",
-            "HOTUSDT": "HOT",
-            "ZILUSDT": "ZIL",
-            "IOTAUSDT": "IOTA",
-            "ONTUSDT": "ONT",
-            "QTUMUSDT": "QTUM",
-            "NEOUSDT": "NEO",
-            "WAVESUSDT": "WAVES",
-            "OMGUSDT": "OMG",
-            "ZECUSDT": "ZEC",
-            "DASHUSDT": "DASH",
-            "XMRUSDT": "XMR",
-            "EOSUSDT": "EOS",
-            "IOSTUSDT": "IOST",
-            "NANOUSDT": "NANO",
-            "DGBUSDT": "DGB",
-            "RVNUSDT": "RVN",
-            "SCUSDT": "SC",
-            "STORJUSDT": "STORJ",
-            "KNCUSDT": "KNC",
-            "REPUSDT": "REP",
-            "LSKUSDT": "LSK",
-            "ARDRUSDT": "ARDR",
-            "ARKUSDT": "ARK",
-            "STRATUSDT": "STRAT",
-            "FUNUSDT": "FUN",
-            "REQUSDT": "REQ",
-            "XEMUSDT": "XEM",
-            "ICXUSDT": "ICX",
-            "VENUSDT": "VEN",
-            "POWRUSDT": "POWR",
-            "LENDUSDT": "LEND",
-            "ADXUSDT": "ADX",
-            "BNTUSDT": "BNT",
-            "CMTUSDT": "CMT",
-            "DNTUSDT": "DNT",
-            "GTOUSDT": "GTO",
-            "ICNUSDT": "ICN",
-            "MCOUSDT": "MCO",
-            "WTCUSDT": "WTC",
-            "LRCUSDT": "LRC",
-            "TNTUSDT": "TNT",
-            "FUELUSDT": "FUEL",
-            "BCPTUSDT": "BCPT",
-            "NEBLUSDT": "NEBL",
-            "GASUSDT": "GAS",
-            "NAVUSDT": "NAV",
-            "TRIGUSDT": "TRIG",
-            "APPCUSDT": "APPC",
-            "VIBUSDT": "VIB",
-            "RLCUSDT": "RLC",
-            "INSUSDT": "INS",
-            "PIVXUSDT": "PIVX",
-            "CHATUSDT": "CHAT",
-            "STEEMUSDT": "STEEM",
-            "VIAUSDT": "VIA",
-            "BLZUSDT": "BLZ",
-            "AEUSDT": "AE",
-            "RPXUSDT": "RPX",
-            "NCASHUSDT": "NCASH",
-            "POAUSDT": "POA",
-            "STXUSDT": "STX",
-            "QKCUSDT": "QKC"
-        }
-        
-        # Check if it's a known trading pair
-        if symbol in pair_to_coin:
-            return pair_to_coin[symbol]
-        
-        # If it's already a single coin symbol, return as-is
-        # Common single coin symbols
-        single_coins = {
-            "BTC", "ETH", "SOL", "AVAX", "MATIC", "DOGE", "ADA", "DOT", "LINK", 
-            "UNI", "ATOM", "NEAR", "FTM", "ALGO", "ICP", "VET", "FIL", "TRX", 
-            "ETC", "XLM", "BCH", "LTC", "XRP", "BNB", "SHIB", "APE", "SAND", 
-            "MANA", "AXS", "CRV", "COMP", "MKR", "SNX", "YFI", "SUSHI", "1INCH", 
-            "AAVE", "GRT", "BAT", "ZRX", "ENJ", "CHZ", "HOT", "ZIL", "IOTA", 
-            "ONT", "QTUM", "NEO", "WAVES", "OMG", "ZEC", "DASH", "XMR", "EOS", 
-            "IOST", "NANO", "DGB", "RVN", "SC", "STORJ", "KNC", "REP", "LSK", 
-            "ARDR", "ARK", "STRAT", "FUN", "REQ", "XEM", "ICX", "VEN", "POWR", 
-            "LEND", "ADX", "BNT", "CMT", "DNT", "GTO", "ICN", "MCO", "WTC", 
-            "LRC", "TNT", "FUEL", "BCPT", "NEBL", "GAS", "NAV", "TRIG", "APPC", 
-            "VIB", "RLC", "INS", "PIVX", "CHAT", "STEEM", "VIA", "BLZ", "AE", 
-            "RPX", "NCASH", "POA", "STX", "QKC"
-        }
-        
-        if symbol in single_coins:
-            return symbol
-        
-        # If we can't determine the coin, try to extract from common patterns
-        # Remove common suffixes
-        for suffix in ["USDT", "USDC", "BUSD", "DAI", "TUSD", "USDP"]:
-            if symbol.endswith(suffix):
-                coin = symbol[:-len(suffix)]
-                if coin in single_coins:
-                    return coin
-        
-        # Default fallback - return the symbol as-is and let the API handle it
-        self.logger.warning(f"Unknown symbol format: {symbol}, using as-is")
-        return symbol
-
-
-# ============================================
-# Convenience Stream Builders
-# ============================================
-
-def create_candle_stream(symbol: str, interval: str) -> HyperliquidWSClient:
-    """
-    Create a WebSocket client configured for candle streaming.
-
-    Args:
-        symbol: Trading pair (e.g., "BTC", "ETH")
-        interval: Candle interval (e.g., "1m", "5m", "1h", "1d")
-
-    Returns:
-        HyperliquidWSClient instance
+        return extract_coin_symbol(symbol)
 
-    Example:
-        >>> client = create_candle_stream("BTC", "1m")
-        >>> async for candle in client.stream_ohlc("BTC", "1m"):
-        ...     print(candle.close)
-    """
-    return HyperliquidWSClient()
-
-
-def create_trade_stream(symbol: str) -> HyperliquidWSClient:
-    """
-    Create a WebSocket client configured for trade streaming.
-
-    Args:
-        symbol: Trading pair (e.g., "BTC", "ETH")
-
-    Returns:
-        HyperliquidWSClient instance
-
-    Example:
-        >>> client = create_trade_stream("BTC")
-        >>> async for trade in client.stream_trades("BTC"):
-        ...     print(f"{trade.side}: {trade.quantity}")
-    """
-    return HyperliquidWSClient()
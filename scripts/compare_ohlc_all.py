@@ -16,15 +16,26 @@ Usage:
   python scripts/compare_ohlc_all.py --interval 5m --limit 100
   python scripts/compare_ohlc_all.py --host 127.0.0.1 --port 8000 --interval 1h
   python scripts/compare_ohlc_all.py --binance-symbol BTCUSDT --bybit-symbol BTCUSDT --hyperliquid-symbol BTC
+
+If NumPy is installed, the numeric OHLC checks run vectorized over the whole
+series; otherwise they run per item.
 """
 
 import argparse
+import asyncio
 import sys
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-from dateutil import parser as dateparser
 
+try:
+    import numpy as np
+except ImportError:  # Optional: vectorized numeric checks
+    np = None
+
+
+NUMERIC_FIELDS = ("open", "high", "low", "close", "volume", "quote_volume")
 
 REQUIRED_FIELDS = [
     "exchange",
@@ -60,7 +71,8 @@ def is_number(x: Any) -> bool:
     return isinstance(x, (int, float))
 
 
-def validate_item(item: dict, interval: str) -> Tuple[bool, str]:
+def validate_item_fields(item: dict, interval: str) -> Tuple[bool, str]:
+    """Structural checks: presence, types, formatting, timestamp."""
     for f in REQUIRED_FIELDS:
         if f not in item:
             return False, f"missing field: {f}"
@@ -70,27 +82,16 @@ def validate_item(item: dict, interval: str) -> Tuple[bool, str]:
         return False, "symbol should be uppercase"
     if item["interval"] != interval:
         return False, f"interval mismatch: expected {interval}, got {item['interval']}"
-    if not all(is_number(item[k]) for k in ("open", "high", "low", "close", "volume", "quote_volume")):
+    if not all(is_number(item[k]) for k in NUMERIC_FIELDS):
         return False, "numeric fields must be numbers"
     if not isinstance(item["trades_count"], int):
         return False, "trades_count must be int"
     if not isinstance(item["is_closed"], bool):
         return False, "is_closed must be bool"
     try:
-        dateparser.isoparse(item["timestamp"])
+        datetime.fromisoformat(item["timestamp"])
     except Exception:
         return False, f"invalid timestamp: {item['timestamp']}"
-    # Logical OHLC checks
-    high, low = float(item["high"]), float(item["low"])
-    opn, cls = float(item["open"]), float(item["close"])
-    if high < low:
-        return False, "high < low"
-    if high < opn or high < cls:
-        return False, "high must be >= open/close"
-    if low > opn or low > cls:
-        return False, "low must be <= open/close"
-    if any(float(item[k]) < 0 for k in ("open", "high", "low", "close", "volume", "quote_volume")):
-        return False, "negative values found"
     if item["is_closed"] is not True:
         return False, "historical candle is_closed should be True"
     if item["trades_count"] < 0:
@@ -98,31 +99,86 @@ def validate_item(item: dict, interval: str) -> Tuple[bool, str]:
     return True, ""
 
 
+def validate_item_values(item: dict) -> Tuple[bool, str]:
+    """Logical OHLC checks on a structurally valid item."""
+    high, low = float(item["high"]), float(item["low"])
+    opn, cls = float(item["open"]), float(item["close"])
+    # Common valid case in one chained comparison; pinpoint only on failure
+    if not (low <= opn <= high and low <= cls <= high):
+        if high < low:
+            return False, "high < low"
+        if high < opn or high < cls:
+            return False, "high must be >= open/close"
+        if low > opn or low > cls:
+            return False, "low must be <= open/close"
+    if min(opn, high, low, cls, float(item["volume"]), float(item["quote_volume"])) < 0:
+        return False, "negative values found"
+    return True, ""
+
+
+def validate_item(item: dict, interval: str) -> Tuple[bool, str]:
+    ok, msg = validate_item_fields(item, interval)
+    if not ok:
+        return ok, msg
+    return validate_item_values(item)
+
+
+def values_valid_np(items: List[dict]) -> bool:
+    """Vectorized equivalent of validate_item_values over the whole series."""
+    n = len(items)
+    o, h, l, c, v, qv = (
+        np.fromiter((it[k] for it in items), dtype=np.float64, count=n) for k in NUMERIC_FIELDS
+    )
+    return bool(
+        (h >= l).all()
+        and (h >= o).all() and (h >= c).all()
+        and (l <= o).all() and (l <= c).all()
+        and (np.minimum.reduce([o, h, l, c, v, qv]) >= 0).all()
+    )
+
+
 def validate_series(items: List[dict], interval: str) -> Tuple[bool, str]:
     if not isinstance(items, list):
         return False, "response is not a list"
     if not items:
         return False, "empty list"
     for idx, it in enumerate(items):
-        ok, msg = validate_item(it, interval)
+        ok, msg = validate_item_fields(it, interval)
         if not ok:
             return False, f"item {idx}: {msg}"
+    # Numeric checks: vectorized when possible, per item to locate offenders
+    if np is None or not values_valid_np(items):
+        for idx, it in enumerate(items):
+            ok, msg = validate_item_values(it)
+            if not ok:
+                return False, f"item {idx}: {msg}"
     # Monotonic timestamps
-    times = [dateparser.isoparse(it["timestamp"]) for it in items]
+    times = [datetime.fromisoformat(it["timestamp"]) for it in items]
     for i in range(1, len(times)):
         if times[i] < times[i - 1]:
             return False, f"timestamps not monotonic at {i}"
     return True, ""
 
 
-def fetch_ohlc(base: str, exchange: str, symbol: str, interval: str, limit: int) -> List[dict]:
-    url = f"{base}/{exchange}/ohlc/{symbol}/{interval}?limit={limit}"
-    r = httpx.get(url, timeout=30.0)
+async def fetch_ohlc(client: httpx.AsyncClient, exchange: str, symbol: str, interval: str, limit: int) -> List[dict]:
+    r = await client.get(f"/{exchange}/ohlc/{symbol}/{interval}", params={"limit": limit})
     if r.status_code != 200:
         raise RuntimeError(f"{exchange} HTTP {r.status_code}: {r.text[:200]}")
     return r.json()
 
 
+async def fetch_all(base: str, targets: List[Tuple[str, str]], interval: str, limit: int) -> List[Any]:
+    """Fetch every exchange concurrently over one keep-alive client.
+
+    Returns one entry per target: the parsed list, or the raised exception.
+    """
+    async with httpx.AsyncClient(base_url=base, timeout=30.0) as client:
+        return await asyncio.gather(
+            *(fetch_ohlc(client, ex, sym, interval, limit) for ex, sym in targets),
+            return_exceptions=True,
+        )
+
+
 def pct(a: float, b: float) -> float:
     if b == 0:
         return 0.0
@@ -143,16 +199,20 @@ def main() -> int:
     latest: Dict[str, dict] = {}
     errors: Dict[str, str] = {}
 
-    # Fetch and validate
-    for ex, sym in targets:
+    # Fetch (concurrently) and validate
+    fetched = asyncio.run(fetch_all(base, targets, args.interval, args.limit))
+    for (ex, _), data in zip(targets, fetched):
+        if isinstance(data, BaseException):
+            errors[ex] = str(data)
+            continue
         try:
-            data = fetch_ohlc(base, ex, sym, args.interval, args.limit)
             ok, msg = validate_series(data, args.interval)
             if not ok:
                 errors[ex] = msg
                 continue
             results[ex] = data
-            latest[ex] = max(data, key=lambda d: dateparser.isoparse(d["timestamp"]))
+            # validate_series guarantees non-decreasing timestamps
+            latest[ex] = data[-1]
         except Exception as e:
             errors[ex] = str(e)
 
@@ -10,6 +10,13 @@ Checks performed:
 - is_closed is True for historical data
 - Monotonic non-decreasing timestamps (oldest → newest)
 
+Timestamps are parsed with ciso8601 when it is installed, falling back to
+datetime.fromisoformat otherwise.
+
+Candles are validated in-process as the response streams in. The endpoint
+caps --limit at 1500 candles, which validate in a few milliseconds - less
+than starting a process pool would cost.
+
 Usage examples:
   python scripts/validate_ohlc.py --exchange binance --symbol BTCUSDT --interval 1h --limit 100
   python scripts/validate_ohlc.py --host 127.0.0.1 --port 8000 --exchange hyperliquid --symbol BTC --interval 1m --limit 50
@@ -17,10 +24,16 @@ Usage examples:
 
 import argparse
 import sys
-from typing import Any, List, Tuple
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
 
 import httpx
-from dateutil import parser as dateparser
+import ijson
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # Optional: C ISO 8601 parser, faster than fromisoformat
+    parse_datetime = datetime.fromisoformat
 
 
 REQUIRED_FIELDS = [
@@ -52,89 +65,121 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
-def is_number(x: Any) -> bool:
-    return isinstance(x, (int, float))
-
-
-def validate_item(item: dict, req_exchange: str, req_symbol: str, req_interval: str) -> Tuple[bool, str]:
-    # Required fields
-    for f in REQUIRED_FIELDS:
-        if f not in item:
-            return False, f"missing field: {f}"
-
-    # Types
-    if not isinstance(item["exchange"], str):
-        return False, "exchange must be string"
-    if not isinstance(item["symbol"], str):
-        return False, "symbol must be string"
-    if not isinstance(item["interval"], str):
-        return False, "interval must be string"
-    if not is_number(item["open"]) or not is_number(item["high"]) or not is_number(item["low"]) or not is_number(item["close"]):
-        return False, "OHLC must be numbers"
-    if not is_number(item["volume"]) or not is_number(item["quote_volume"]):
-        return False, "volume/quote_volume must be numbers"
-    if not isinstance(item["trades_count"], int):
-        return False, "trades_count must be int"
-    if not isinstance(item["is_closed"], bool):
-        return False, "is_closed must be bool"
+_REQUIRED = frozenset(REQUIRED_FIELDS)
+_NUMBER_TYPES = (int, float)
+
+
+def validate_item(
+    item: dict, req_exchange: str, req_symbol: str, req_interval: str
+) -> Tuple[bool, str, Optional[datetime]]:
+    """Validate one candle; on success also return its parsed timestamp."""
+    # Required fields (one set difference instead of a lookup per field)
+    missing = _REQUIRED - item.keys()
+    if missing:
+        first = next(f for f in REQUIRED_FIELDS if f in missing)
+        return False, f"missing field: {first}", None
+
+    exchange = item["exchange"]
+    symbol = item["symbol"]
+    interval = item["interval"]
+    timestamp = item["timestamp"]
+    opn = item["open"]
+    high = item["high"]
+    low = item["low"]
+    cls = item["close"]
+    vol = item["volume"]
+    qvol = item["quote_volume"]
+    trades_count = item["trades_count"]
+    is_closed = item["is_closed"]
+
+    # Types (exact int/float; bools are not accepted as numbers)
+    if type(exchange) is not str:
+        return False, "exchange must be string", None
+    if type(symbol) is not str:
+        return False, "symbol must be string", None
+    if type(interval) is not str:
+        return False, "interval must be string", None
+    if not (
+        type(opn) in _NUMBER_TYPES and type(high) in _NUMBER_TYPES
+        and type(low) in _NUMBER_TYPES and type(cls) in _NUMBER_TYPES
+    ):
+        return False, "OHLC must be numbers", None
+    if not (type(vol) in _NUMBER_TYPES and type(qvol) in _NUMBER_TYPES):
+        return False, "volume/quote_volume must be numbers", None
+    if type(trades_count) is not int:
+        return False, "trades_count must be int", None
+    if type(is_closed) is not bool:
+        return False, "is_closed must be bool", None
 
     # Exchange formatting
-    if item["exchange"] != item["exchange"].lower():
-        return False, "exchange should be lowercase"
+    if exchange != exchange.lower():
+        return False, "exchange should be lowercase", None
 
     # Symbol formatting (normalize to uppercase)
-    if item["symbol"] != item["symbol"].upper():
-        return False, "symbol should be uppercase"
+    if symbol != symbol.upper():
+        return False, "symbol should be uppercase", None
 
     # Interval must match requested
-    if item["interval"] != req_interval:
-        return False, f"interval mismatch: expected {req_interval}, got {item['interval']}"
+    if interval != req_interval:
+        return False, f"interval mismatch: expected {req_interval}, got {interval}", None
 
     # Parse timestamp
     try:
-        dateparser.isoparse(item["timestamp"])
+        ts = parse_datetime(timestamp)
     except Exception:
-        return False, f"invalid timestamp: {item['timestamp']}"
-
-    # Logical OHLC constraints
-    high = float(item["high"])
-    low = float(item["low"])
-    opn = float(item["open"])
-    cls = float(item["close"])
-    vol = float(item["volume"])
-    qvol = float(item["quote_volume"])
-    if high < low:
-        return False, f"high < low ({high} < {low})"
-    if high < opn or high < cls:
-        return False, f"high must be >= open/close ({high} < {opn}/{cls})"
-    if low > opn or low > cls:
-        return False, f"low must be <= open/close ({low} > {opn}/{cls})"
-    if any(v < 0 for v in (opn, high, low, cls, vol, qvol)):
-        return False, "negative values not allowed in OHLC/volume"
+        return False, f"invalid timestamp: {timestamp}", None
+
+    # Logical OHLC constraints (common valid case in one chained comparison;
+    # the individual checks only run to pinpoint a failure)
+    if not (low <= opn <= high and low <= cls <= high):
+        if high < low:
+            return False, f"high < low ({high} < {low})", None
+        if high < opn or high < cls:
+            return False, f"high must be >= open/close ({high} < {opn}/{cls})", None
+        if low > opn or low > cls:
+            return False, f"low must be <= open/close ({low} > {opn}/{cls})", None
+    if min(opn, high, low, cls, vol, qvol) < 0:
+        return False, "negative values not allowed in OHLC/volume", None
 
     # Historical candles should be closed
-    if item["is_closed"] is not True:
-        return False, "historical candle is_closed should be True"
+    if is_closed is not True:
+        return False, "historical candle is_closed should be True", None
 
     # trades_count non-negative
-    if item["trades_count"] < 0:
-        return False, "trades_count negative"
-
-    return True, ""
-
-
-def validate_ordering(items: List[dict]) -> Tuple[bool, str]:
-    times = []
-    try:
-        for it in items:
-            times.append(dateparser.isoparse(it["timestamp"]))
-    except Exception as e:
-        return False, f"timestamp parse failed: {e}"
-    # Non-decreasing order (oldest → newest)
-    for i in range(1, len(times)):
-        if times[i] < times[i - 1]:
-            return False, f"timestamps not monotonic at index {i}: {times[i-1]} -> {times[i]}"
-    return True, ""
+    if trades_count < 0:
+        return False, "trades_count negative", None
+
+    return True, "", ts
+
+
+class NotAListError(ValueError):
+    """Raised when the response body is not a JSON array."""
+
+
+def iter_items(resp: httpx.Response) -> Iterator[Any]:
+    """
+    Yield array items from a streaming response as their bytes arrive.
+
+    Raises:
+        NotAListError: If the body is not a JSON array
+        ijson.JSONError: If the body is not valid JSON
+    """
+    items = ijson.sendable_list()
+    coro = ijson.items_coro(items, "item", use_float=True)
+    checked = False
+    for chunk in resp.iter_bytes():
+        if not checked:
+            head = chunk.lstrip()
+            if not head:
+                continue
+            if head[:1] != b"[":
+                raise NotAListError("Response is not a list")
+            checked = True
+        coro.send(chunk)
+        yield from items
+        del items[:]
+    coro.close()  # Raises on truncated or empty bodies
+    yield from items
 
 
 def main() -> int:
@@ -142,53 +187,55 @@ def main() -> int:
     url = f"http://{args.host}:{args.port}/{args.exchange}/ohlc/{args.symbol}/{args.interval}?limit={args.limit}"
     print(f"[Info] Requesting: {url}")
 
+    sample: List[Any] = []
+    count = 0
     try:
-        resp = httpx.get(url, timeout=30.0)
-    except Exception as e:
-        print(f"[Error] Request failed: {e}")
+        # A Client keeps the connection pool (keep-alive) for any further requests
+        with httpx.Client(timeout=30.0) as client, client.stream("GET", url) as resp:
+            if resp.status_code != 200:
+                resp.read()
+                print(f"[Error] HTTP {resp.status_code}: {resp.text[:300]}")
+                return 2
+
+            # Validate items and time ordering as they stream in (each timestamp
+            # parsed once; the first bad item fails without reading the rest)
+            prev_ts: Optional[datetime] = None
+            for idx, item in enumerate(iter_items(resp)):
+                ok, msg, ts = validate_item(item, args.exchange, args.symbol, args.interval)
+                if not ok:
+                    print(f"[Error] Item {idx} invalid: {msg}")
+                    return 1
+                # Non-decreasing order (oldest → newest)
+                if prev_ts is not None and ts < prev_ts:
+                    print(f"[Error] Ordering check failed: timestamps not monotonic at index {idx}: {prev_ts} -> {ts}")
+                    return 1
+                prev_ts = ts
+                if idx < args.print_sample:
+                    sample.append(item)
+                count = idx + 1
+    except NotAListError as e:
+        print(f"[Error] {e}")
         return 2
-
-    if resp.status_code != 200:
-        print(f"[Error] HTTP {resp.status_code}: {resp.text[:300]}")
-        return 2
-
-    try:
-        data = resp.json()
-    except Exception as e:
+    except ijson.JSONError as e:
         print(f"[Error] Invalid JSON: {e}")
         return 2
-
-    if not isinstance(data, list):
-        print("[Error] Response is not a list")
+    except Exception as e:
+        print(f"[Error] Request failed: {e}")
         return 2
 
-    if not data:
+    if not count:
         if args.allow_empty:
             print("[Warn] Empty list (allowed by flag).")
             return 0
         print("[Error] Empty list (use --allow-empty to accept).")
         return 1
 
-    # Validate items
-    for idx, item in enumerate(data):
-        ok, msg = validate_item(item, args.exchange, args.symbol, args.interval)
-        if not ok:
-            print(f"[Error] Item {idx} invalid: {msg}")
-            return 1
-
-    # Validate time ordering
-    ok, msg = validate_ordering(data)
-    if not ok:
-        print(f"[Error] Ordering check failed: {msg}")
-        return 1
-
-    if args.print_sample > 0:
-        sample = data[: args.print_sample]
-        print(f"[Info] Sample ({len(sample)} of {len(data)}):")
+    if sample:
+        print(f"[Info] Sample ({len(sample)} of {count}):")
         for it in sample:
             print(it)
 
-    print(f"[OK] Validated {len(data)} OHLC candles for {args.exchange} {args.symbol} {args.interval}")
+    print(f"[OK] Validated {count} OHLC candles for {args.exchange} {args.symbol} {args.interval}")
     return 0
 
 
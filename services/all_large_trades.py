@@ -7,27 +7,100 @@ global event bus under topic 'large_trade'.
 """
 
 import asyncio
-import json
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 import aiohttp
+import orjson
 import websockets
 
 from core.logging import get_logger
 from core.utils.time import to_utc_datetime
-from core.schemas import LargeTrade
 from services.event_bus import bus
 
+# Exchange side codes -> LargeTrade side
+_BYBIT_SIDES = {"Buy": "buy", "Sell": "sell"}
+_HL_SIDES = {"B": "buy", "A": "sell"}  # "A" = ask (seller is taker)
+
+
+@lru_cache(maxsize=1024)
+def _iso_ts(ms: int) -> str:
+    """
+    Epoch timestamp -> ISO 8601 UTC string, as LargeTrade serializes it.
+
+    Goes through to_utc_datetime like the model did, so seconds-resolution
+    input is detected the same way. Trades in a burst share timestamps, so
+    recent conversions are memoized.
+    """
+    return to_utc_datetime(ms).isoformat()[:-6] + "Z"
+
+
+def _large_trade_event(
+    exchange: str,
+    symbol: str,
+    side: str,
+    price: float,
+    quantity: float,
+    value: float,
+    is_buyer_maker: bool,
+    ts_ms: int,
+) -> Dict[str, Any]:
+    """
+    Build a 'large_trade' bus event directly.
+
+    Produces the same payload as {"type": "large_trade", **LargeTrade(...).model_dump(mode="json")}
+    without per-trade model validation; callers pass already-normalized
+    fields (lowercase exchange, uppercase symbol, side "buy"/"sell").
+    """
+    return {
+        "type": "large_trade",
+        "exchange": exchange,
+        "symbol": symbol,
+        "timestamp": _iso_ts(ts_ms),
+        "side": side,
+        "price": price,
+        "quantity": quantity,
+        "value": value,
+        "is_buyer_maker": is_buyer_maker,
+    }
+
 
 class AllLargeTradesService:
     """
     Background service for aggregating large trades across exchanges.
     """
 
-    BINANCE_WS_BASE = "wss://fstream.binance.com/ws"
+    BINANCE_WS_URL = "wss://fstream.binance.com/stream"
     BYBIT_WS_URL = "wss://stream.bybit.com/v5/public/linear"
     HL_WS_URL = "wss://api.hyperliquid.xyz/ws"
 
+    # Seconds stop() waits for cancelled stream tasks to finish
+    STOP_TIMEOUT = 2.0
+
+    # Trade frames are short JSON, so permessage-deflate only costs CPU.
+    # Explicit keepalive pings detect half-open sockets. Reads pause once
+    # max_queue frames are buffered, so a stalled consumer holds at most
+    # max_queue * max_size bytes (32 MiB) per socket.
+    WS_CONNECT_KWARGS: Dict[str, Any] = {
+        "compression": None,
+        "ping_interval": 20,
+        "ping_timeout": 20,
+        "max_queue": 32,
+        "max_size": 2 ** 20,
+    }
+
+    # Bybit multiplexes every publicTrade topic on one socket and batches
+    # trades per frame, so allow larger frames and bigger socket buffers.
+    # The frame queue shrinks as frames grow, keeping the buffered worst
+    # case at 64 MiB.
+    BYBIT_WS_CONNECT_KWARGS: Dict[str, Any] = {
+        **WS_CONNECT_KWARGS,
+        "max_queue": 16,
+        "max_size": 2 ** 22,
+        "write_limit": 2 ** 20,
+        "read_limit": 2 ** 20,
+    }
+
     def __init__(self) -> None:
         self._logger = get_logger(__name__)
         self._tasks: List[asyncio.Task] = []
@@ -47,9 +120,8 @@ class AllLargeTradesService:
         )
 
         # Launch per-exchange tasks
-        # Binance: one WS per symbol (aggTrade)
-        for sym in self._symbols:
-            self._tasks.append(asyncio.create_task(self._binance_symbol_loop(sym), name=f"lt_binance_{sym}"))
+        # Binance: one combined-stream WS for all symbols (aggTrade)
+        self._tasks.append(asyncio.create_task(self._binance_loop(), name="lt_binance"))
 
         # Bybit: one WS with multiple topic subscriptions
         self._tasks.append(asyncio.create_task(self._bybit_loop(), name="lt_bybit"))
@@ -64,51 +136,62 @@ class AllLargeTradesService:
         self._running.clear()
         for t in self._tasks:
             t.cancel()
-        await asyncio.gather(*self._tasks, return_exceptions=True)
+        # Bound shutdown time; a loop stuck in a handshake shouldn't hold it up
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=self.STOP_TIMEOUT)
+            if pending:
+                self._logger.warning(f"{len(pending)} task(s) still running after {self.STOP_TIMEOUT}s stop timeout")
         self._tasks.clear()
 
     # ============================================
-    # Binance (aggTrade per symbol)
+    # Binance (combined aggTrade streams)
     # ============================================
-    async def _binance_symbol_loop(self, symbol: str) -> None:
-        stream = f"{symbol.lower()}@aggTrade"
-        url = f"{self.BINANCE_WS_BASE}/{stream}"
+    async def _binance_loop(self) -> None:
+        # Stream name -> normalized symbol, resolved once instead of per message
+        stream_to_sym = {f"{sym.lower()}@aggTrade": sym.upper() for sym in self._symbols}
+        url = f"{self.BINANCE_WS_URL}?streams={'/'.join(stream_to_sym)}"
+        # Hot-loop names bound to locals
+        loads, decode_error = orjson.loads, orjson.JSONDecodeError
+        publish, make_event = bus.publish, _large_trade_event
+        thr = self._threshold
         while self._running.is_set():
             try:
-                async with websockets.connect(url) as ws:
-                    self._logger.info(f"[Binance] Connected large trade stream: {symbol}")
-                    async for raw in ws:
+                async with websockets.connect(url, **self.WS_CONNECT_KWARGS) as ws:
+                    self._logger.info(f"[Binance] Connected large trade stream for {len(stream_to_sym)} symbols")
+                    recv = ws.recv
+                    while True:
+                        raw = await recv()
                         try:
-                            msg = json.loads(raw)
-                        except json.JSONDecodeError:
+                            frame = loads(raw)
+                        except decode_error:
+                            continue
+                        # Combined stream frames: {"stream": "btcusdt@aggTrade", "data": {...}}
+                        symbol_up = stream_to_sym.get(frame.get("stream"))
+                        if symbol_up is None:
                             continue
-                        if msg.get("e") != "aggTrade":
+                        msg = frame.get("data")
+                        if not msg or msg.get("e") != "aggTrade":
                             continue
                         try:
-                            price = float(msg.get("p", 0))
-                            qty = float(msg.get("q", 0))
+                            price = float(msg["p"])
+                            qty = float(msg["q"])
                             value = price * qty
-                            if value < self._threshold:
+                            if value < thr:
                                 continue
                             is_buyer_maker = bool(msg.get("m", False))
                             side = "sell" if is_buyer_maker else "buy"
-                            lt = LargeTrade(
-                                exchange="binance",
-                                symbol=symbol.upper(),
-                                side=side,
-                                price=price,
-                                quantity=qty,
-                                value=value,
-                                is_buyer_maker=is_buyer_maker,
-                                timestamp=to_utc_datetime(msg.get("T")),
-                            )
-                            await bus.publish("large_trade", {"type": "large_trade", **lt.model_dump(mode="json")})
+                            await publish("large_trade", make_event(
+                                "binance", symbol_up, side, price, qty, value,
+                                is_buyer_maker, int(msg["T"]),
+                            ))
                         except Exception:
                             continue
             except asyncio.CancelledError:
                 break
+            except websockets.exceptions.ConnectionClosedOK:
+                continue  # Clean close: reconnect right away
             except Exception as e:
-                self._logger.error(f"[Binance] Large trade stream error ({symbol}): {e}. Reconnecting in 5s...")
+                self._logger.error(f"[Binance] Large trade stream error: {e}. Reconnecting in 5s...")
                 await asyncio.sleep(5)
 
     # ============================================
@@ -116,47 +199,62 @@ class AllLargeTradesService:
     # ============================================
     async def _bybit_loop(self) -> None:
         topics = [f"publicTrade.{sym}" for sym in self._symbols]
+        # Topic -> normalized symbol, resolved once instead of per message
+        topic_to_sym = {topic: sym.upper() for topic, sym in zip(topics, self._symbols)}
         batch_size = 100
+        # Subscription frames encoded once, reused on every reconnect
+        sub_frames = [
+            orjson.dumps({"op": "subscribe", "args": topics[i : i + batch_size]}).decode()
+            for i in range(0, len(topics), batch_size)
+        ]
+        # Hot-loop names bound to locals
+        loads, decode_error = orjson.loads, orjson.JSONDecodeError
+        publish_many, make_event = bus.publish_many, _large_trade_event
+        sides = _BYBIT_SIDES
+        thr = self._threshold
         while self._running.is_set():
             try:
-                async with websockets.connect(self.BYBIT_WS_URL) as ws:
+                async with websockets.connect(self.BYBIT_WS_URL, **self.BYBIT_WS_CONNECT_KWARGS) as ws:
                     self._logger.info(f"[Bybit] Connected trades stream. Subscribing to {len(topics)} topics...")
-                    for i in range(0, len(topics), batch_size):
-                        batch = topics[i : i + batch_size]
-                        sub = {"op": "subscribe", "args": batch}
-                        await ws.send(json.dumps(sub))
-                        await asyncio.sleep(0.05)
-                    async for raw in ws:
+                    # Sent back to back; the socket pipelines them
+                    for frame in sub_frames:
+                        await ws.send(frame)
+                    recv = ws.recv
+                    while True:
+                        raw = await recv()
                         try:
-                            data = json.loads(raw)
-                        except json.JSONDecodeError:
+                            data = loads(raw)
+                        except decode_error:
                             continue
-                        topic = data.get("topic", "")
-                        if not topic.startswith("publicTrade.") or "data" not in data:
+                        sym = topic_to_sym.get(data.get("topic"))
+                        if sym is None or "data" not in data:
                             continue
-                        sym = topic.replace("publicTrade.", "") or ""
-                        for t in data.get("data", []):
+                        # Collect the frame's large trades and publish them as one batch
+                        events = []
+                        for t in data["data"]:
                             try:
-                                price = float(t.get("p", 0))
-                                qty = float(t.get("v", 0))
+                                # Two C-level float() parses are the cheapest reject for
+                                # sub-threshold trades; string-length heuristics measured slower
+                                price = float(t["p"])
+                                qty = float(t["v"])
                                 value = price * qty
-                                if value < self._threshold:
+                                if value < thr:
                                     continue
-                                lt = LargeTrade(
-                                    exchange="bybit",
-                                    symbol=sym.upper(),
-                                    side=str(t.get("S", "")).lower(),
-                                    price=price,
-                                    quantity=qty,
-                                    value=value,
-                                    is_buyer_maker=False,
-                                    timestamp=to_utc_datetime(int(t.get("T")) if t.get("T") is not None else 0),
-                                )
-                                await bus.publish("large_trade", {"type": "large_trade", **lt.model_dump(mode="json")})
+                                side = sides.get(t.get("S"))
+                                if side is None:
+                                    continue
+                                ts = t.get("T")
+                                events.append(make_event(
+                                    "bybit", sym, side, price, qty, value,
+                                    False, int(ts) if ts is not None else 0,
+                                ))
                             except Exception:
                                 continue
+                        await publish_many("large_trade", events)
             except asyncio.CancelledError:
                 break
+            except websockets.exceptions.ConnectionClosedOK:
+                continue  # Clean close: reconnect right away
             except Exception as e:
                 self._logger.error(f"[Bybit] Large trade stream error: {e}. Reconnecting in 5s...")
                 await asyncio.sleep(5)
@@ -173,45 +271,61 @@ class AllLargeTradesService:
 
     async def _hyperliquid_loop(self) -> None:
         coins = [self._to_hl_coin(s) for s in self._symbols]
-        subs = [{"method": "subscribe", "subscription": {"type": "trades", "coin": c}} for c in coins]
+        # Subscribed coins are already uppercase; only unknown ones get normalized
+        known_coins = {c: c for c in coins}
+        # Subscription frames encoded once, reused on every reconnect
+        subs = [
+            orjson.dumps({"method": "subscribe", "subscription": {"type": "trades", "coin": c}}).decode()
+            for c in coins
+        ]
+        # Hot-loop names bound to locals
+        loads, decode_error = orjson.loads, orjson.JSONDecodeError
+        publish_many, make_event = bus.publish_many, _large_trade_event
+        sides = _HL_SIDES
+        thr = self._threshold
         while self._running.is_set():
             try:
-                async with websockets.connect(self.HL_WS_URL) as ws:
+                async with websockets.connect(self.HL_WS_URL, **self.WS_CONNECT_KWARGS) as ws:
                     self._logger.info(f"[Hyperliquid] Connected trades stream. Subscribing to {len(subs)} coins...")
-                    for s in subs:
-                        await ws.send(json.dumps(s))
-                        await asyncio.sleep(0.05)
-                    async for raw in ws:
+                    # HL takes one coin per subscription; send them back to back
+                    for frame in subs:
+                        await ws.send(frame)
+                    recv = ws.recv
+                    while True:
+                        raw = await recv()
                         try:
-                            data = json.loads(raw)
-                        except json.JSONDecodeError:
+                            data = loads(raw)
+                        except decode_error:
                             continue
                         if data.get("channel") != "trades":
                             continue
+                        # Collect the frame's large trades and publish them as one batch
+                        events = []
                         for trade in data.get("data", []):
                             try:
-                                coin = str(trade.get("coin", "")).upper()
-                                price = float(trade.get("px", 0))
-                                qty = float(trade.get("sz", 0))
+                                price = float(trade["px"])
+                                qty = float(trade["sz"])
                                 value = price * qty
-                                if value < self._threshold:
+                                if value < thr:
+                                    continue
+                                side = sides.get(trade.get("side"))
+                                if side is None:
                                     continue
+                                raw_coin = trade.get("coin", "")
+                                coin = known_coins.get(raw_coin) or str(raw_coin).upper()
                                 # HL doesn't expose is_buyer_maker; set False
-                                lt = LargeTrade(
-                                    exchange="hyperliquid",
-                                    symbol=coin,
-                                    side=str(trade.get("side", "")).lower(),
-                                    price=price,
-                                    quantity=qty,
-                                    value=value,
-                                    is_buyer_maker=False,
-                                    timestamp=to_utc_datetime(int(trade.get("time")) if trade.get("time") is not None else 0),
-                                )
-                                await bus.publish("large_trade", {"type": "large_trade", **lt.model_dump(mode="json")})
+                                ts = trade.get("time")
+                                events.append(make_event(
+                                    "hyperliquid", coin, side, price, qty, value,
+                                    False, int(ts) if ts is not None else 0,
+                                ))
                             except Exception:
                                 continue
+                        await publish_many("large_trade", events)
             except asyncio.CancelledError:
                 break
+            except websockets.exceptions.ConnectionClosedOK:
+                continue  # Clean close: reconnect right away
             except Exception as e:
                 self._logger.error(f"[Hyperliquid] Large trade stream error: {e}. Reconnecting in 5s...")
                 await asyncio.sleep(5)
@@ -11,20 +11,146 @@ Implemented sources:
 Notes:
     - Hyperliquid liquidation detection via trades has been disabled/removed.
     - Bybit "all liquidations" requires subscribing per-symbol (not included).
+    - Frames are parsed with orjson into dicts. Schema-typed decoding (e.g.
+      msgspec Structs) saved ~0.5us per Binance event once the dict the bus
+      filters on is rebuilt - not worth a second parse path at liquidation rates.
 """
 
 import asyncio
-import json
-from typing import Any, Dict, List, Optional
+import itertools
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import aiohttp
-import websockets
+import orjson
 
 from core.logging import get_logger
 from core.utils.time import to_utc_datetime
-from core.schemas import Liquidation
 from services.event_bus import bus
 
+# Bound once at module scope for the per-frame parse in every loop
+_loads = orjson.loads
+
+
+async def _json_frames(ws: aiohttp.ClientWebSocketResponse) -> AsyncIterator[Any]:
+    """
+    Yield parsed JSON text frames until the server closes the socket.
+
+    Unparseable frames are skipped; a transport error is raised so the
+    caller's reconnect handling takes over.
+    """
+    async for msg in ws:
+        if msg.type is aiohttp.WSMsgType.TEXT:
+            try:
+                yield _loads(msg.data)
+            except orjson.JSONDecodeError:
+                continue
+        elif msg.type is aiohttp.WSMsgType.ERROR:
+            raise ws.exception() or ConnectionError("WebSocket error")
+
+
+_SIDES = frozenset(("buy", "sell"))
+
+
+@lru_cache(maxsize=2048)
+def _iso_for_second(sec: int) -> str:
+    """Whole epoch second -> naive ISO 8601 UTC string (no offset)."""
+    return to_utc_datetime(sec).isoformat()[:-6]
+
+
+def _ts_iso(ts: Any) -> str:
+    """
+    Exchange timestamp (ms, or None) -> ISO 8601 UTC string, as Liquidation serializes it.
+
+    Liquidations arrive in bursts sharing the same second, so the datetime
+    work is memoized per second and only the millisecond suffix is formatted.
+    """
+    ms = int(ts) if ts is not None else 0
+    if ms <= 1e12:
+        # Already seconds (same detection as to_utc_datetime)
+        return _iso_for_second(ms) + "Z"
+    sec, frac = divmod(ms, 1000)
+    return _iso_for_second(sec) + (f".{frac:03d}000Z" if frac else "Z")
+
+
+def _liquidation_event(
+    exchange: str, symbol: str, side: str, price: float, quantity: float, value: float, ts: Any
+) -> Dict[str, Any]:
+    """
+    Build a 'liquidation' bus event directly.
+
+    Produces the same payload as {"type": "liquidation", **Liquidation(...).model_dump(mode="json")}
+    without per-event model validation; side falls back to "sell" like the
+    stream loops always did.
+    """
+    return {
+        "type": "liquidation",
+        "exchange": exchange,
+        "symbol": symbol.upper(),
+        "timestamp": _ts_iso(ts),
+        "side": side if side in _SIDES else "sell",
+        "price": price,
+        "quantity": quantity,
+        "value": value,
+    }
+
+
+# ============================================
+# Per-exchange field extraction
+# ============================================
+# Each parser turns one raw liquidation record into a 'liquidation' event,
+# or None when it falls below min_value or is malformed (non-dict record,
+# unparseable numbers or timestamp), so one bad record is skipped without
+# dropping the stream. Price and quantity are checked against the threshold
+# before anything else is read. Builtins are bound as default args so the
+# per-event lookups are locals.
+_BAD_RECORD = (TypeError, ValueError, AttributeError)
+
+
+def _parse_binance(
+    order: Dict[str, Any], min_value: float, _float=float, _make=_liquidation_event
+) -> Optional[Dict[str, Any]]:
+    try:
+        price = _float(order.get("p") or 0)
+        qty = _float(order.get("q") or 0)
+        value = price * qty
+        if value < min_value:
+            return None
+        side = (order.get("S") or "").lower()
+        return _make("binance", order.get("s") or "", side, price, qty, value, order.get("T"))
+    except _BAD_RECORD:
+        return None
+
+
+def _parse_okx(
+    inst: str, detail: Dict[str, Any], min_value: float, _float=float, _make=_liquidation_event
+) -> Optional[Dict[str, Any]]:
+    try:
+        qty = _float(detail.get("sz") or 0)
+        price = _float(detail.get("bkPx") or 0)
+        value = qty * price
+        if value < min_value:
+            return None
+        side = (detail.get("side") or "").lower()
+        return _make("okx", inst, side, price, qty, value, detail.get("ts"))
+    except _BAD_RECORD:
+        return None
+
+
+def _parse_bybit(
+    record: Dict[str, Any], topic_symbol: str, min_value: float, _float=float, _make=_liquidation_event
+) -> Optional[Dict[str, Any]]:
+    try:
+        price = _float(record.get("p") or 0)
+        qty = _float(record.get("v") or 0)
+        value = price * qty
+        if value < min_value:
+            return None
+        side = (record.get("S") or "").lower()
+        return _make("bybit", record.get("s") or topic_symbol, side, price, qty, value, record.get("T"))
+    except _BAD_RECORD:
+        return None
+
 
 class AllLiquidationsService:
     """
@@ -37,18 +163,35 @@ class AllLiquidationsService:
     OKX_URL = "wss://ws.okx.com:8443/ws/v5/public"
     BYBIT_WS_URL = "wss://stream.bybit.com/v5/public/linear"
     BYBIT_SYMBOLS_URL = "https://api.bybit.com/v5/market/instruments-info?category=linear"
+    # Topics per Bybit subscribe message; rejected batches are split in half
+    BYBIT_SUB_BATCH = 100
+
+    # Seconds stop() waits for cancelled stream tasks to finish
+    STOP_TIMEOUT = 2.0
+
+    # Liquidation frames are short JSON, so permessage-deflate only costs CPU;
+    # heartbeat pings detect half-open sockets
+    WS_CONNECT_KWARGS: Dict[str, Any] = {"heartbeat": 20, "compress": 0}
+    REST_TIMEOUT = aiohttp.ClientTimeout(total=15)
 
     def __init__(self, min_value_usd: float = 5_000.0) -> None:
         self._logger = get_logger(__name__)
         self._tasks: List[asyncio.Task] = []
         self._running = asyncio.Event()
         self._min_value_usd = float(min_value_usd)
+        # One session (connection pool, DNS and TLS caches) shared by every
+        # stream and by the Bybit symbol fetch; opened in start()
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Source of unique Bybit subscribe req_ids (retried halves get new ones)
+        self._bybit_req_ids = itertools.count(1)
 
     async def start(self) -> None:
         if self._running.is_set():
             return
         self._running.set()
         self._logger.info("Starting AllLiquidationsService...")
+        # No overall timeout: it would also bound the long-lived WebSockets
+        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=None, sock_connect=15))
         self._tasks = [
             asyncio.create_task(self._binance_loop(), name="liq_binance"),
             asyncio.create_task(self._okx_loop(), name="liq_okx"),
@@ -62,48 +205,35 @@ class AllLiquidationsService:
         self._running.clear()
         for t in self._tasks:
             t.cancel()
-        await asyncio.gather(*self._tasks, return_exceptions=True)
+        # Bound shutdown time; a loop stuck in a handshake shouldn't hold it up
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=self.STOP_TIMEOUT)
+            if pending:
+                self._logger.warning(f"{len(pending)} task(s) still running after {self.STOP_TIMEOUT}s stop timeout")
         self._tasks.clear()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     # ============================================
     # Binance (All Market Liquidations)
     # ============================================
     async def _binance_loop(self) -> None:
+        parse, publish, min_value = _parse_binance, bus.publish, self._min_value_usd
         while self._running.is_set():
             try:
-                async with websockets.connect(self.BINANCE_URL) as ws:
+                async with self._session.ws_connect(self.BINANCE_URL, **self.WS_CONNECT_KWARGS) as ws:
                     self._logger.info("[Binance] Connected to all-market liquidation stream")
-                    async for raw in ws:
-                        try:
-                            data = json.loads(raw)
-                        except json.JSONDecodeError:
-                            continue
-
+                    async for data in _json_frames(ws):
                         # Binance may send a list of events or a single dict
                         events = data if isinstance(data, list) else [data]
                         for ev in events:
-                            order = ev.get("o", {})
+                            order = ev.get("o")
                             if not order:
                                 continue
-                            symbol = order.get("s")
-                            side = (order.get("S") or "").lower()
-                            price = float(order.get("p") or 0)
-                            qty = float(order.get("q") or 0)
-                            ts = order.get("T")
-                            value = price * qty
-                            if value < self._min_value_usd:
-                                continue
-
-                            model = Liquidation(
-                                exchange="binance",
-                                symbol=symbol or "",
-                                side=side if side in ("buy", "sell") else "sell",
-                                price=price,
-                                quantity=qty,
-                                value=value,
-                                timestamp=to_utc_datetime(int(ts)) if ts is not None else to_utc_datetime(0),
-                            )
-                            await bus.publish("liquidation", {"type": "liquidation", **model.model_dump(mode="json")})
+                            event = parse(order, min_value)
+                            if event is not None:
+                                await publish("liquidation", event)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -119,17 +249,13 @@ class AllLiquidationsService:
             "op": "subscribe",
             "args": [{"channel": "liquidation-orders", "instType": "SWAP"}],
         }
+        parse, publish, min_value = _parse_okx, bus.publish, self._min_value_usd
         while self._running.is_set():
             try:
-                async with websockets.connect(self.OKX_URL) as ws:
+                async with self._session.ws_connect(self.OKX_URL, **self.WS_CONNECT_KWARGS) as ws:
                     self._logger.info("[OKX] Connected to liquidation stream")
-                    await ws.send(json.dumps(subscribe_msg))
-                    async for raw in ws:
-                        try:
-                            data = json.loads(raw)
-                        except json.JSONDecodeError:
-                            continue
-
+                    await ws.send_str(orjson.dumps(subscribe_msg).decode())
+                    async for data in _json_frames(ws):
                         if "arg" not in data or "data" not in data:
                             # ping/pong or event ack
                             continue
@@ -138,29 +264,9 @@ class AllLiquidationsService:
                             inst = entry.get("instId") or ""
                             details = entry.get("details", [])
                             for d in details:
-                                side = (d.get("side") or "").lower()
-                                qty_str = d.get("sz")
-                                price_str = d.get("bkPx")
-                                ts = d.get("ts")
-                                try:
-                                    qty = float(qty_str or 0)
-                                    price = float(price_str or 0)
-                                except Exception:
-                                    qty, price = 0.0, 0.0
-                                value = qty * price
-                                if value < self._min_value_usd:
-                                    continue
-
-                                model = Liquidation(
-                                    exchange="okx",
-                                    symbol=inst,
-                                    side=side if side in ("buy", "sell") else "sell",
-                                    price=price,
-                                    quantity=qty,
-                                    value=value,
-                                    timestamp=to_utc_datetime(int(ts)) if ts is not None else to_utc_datetime(0),
-                                )
-                                await bus.publish("liquidation", {"type": "liquidation", **model.model_dump(mode="json")})
+                                event = parse(inst, d, min_value)
+                                if event is not None:
+                                    await publish("liquidation", event)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -172,18 +278,47 @@ class AllLiquidationsService:
     # ============================================
     async def _fetch_bybit_symbols(self) -> List[str]:
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
-                async with session.get(self.BYBIT_SYMBOLS_URL) as resp:
-                    if resp.status != 200:
-                        return []
-                    payload = await resp.json()
-                    lst = payload.get("result", {}).get("list", []) or []
-                    symbols = [str(item.get("symbol")) for item in lst if item.get("symbol")]
-                    return symbols
+            async with self._session.get(self.BYBIT_SYMBOLS_URL, timeout=self.REST_TIMEOUT) as resp:
+                if resp.status != 200:
+                    return []
+                payload = await resp.json(loads=_loads)
+                lst = payload.get("result", {}).get("list", []) or []
+                symbols = [str(item.get("symbol")) for item in lst if item.get("symbol")]
+                return symbols
         except Exception:
             return []
 
+    def _bybit_sub_frame(self, batch: List[str]) -> Tuple[str, str]:
+        """Return (req_id, encoded subscribe message) for a batch of topics."""
+        req_id = f"liq_sub_{next(self._bybit_req_ids)}"
+        return req_id, orjson.dumps({"req_id": req_id, "op": "subscribe", "args": batch}).decode()
+
+    async def _bybit_subscribe(
+        self, ws: aiohttp.ClientWebSocketResponse, pending: Dict[str, List[str]], batch: List[str]
+    ) -> None:
+        req_id, frame = self._bybit_sub_frame(batch)
+        pending[req_id] = batch
+        await ws.send_str(frame)
+
+    async def _on_bybit_subscribe_ack(
+        self, ws: aiohttp.ClientWebSocketResponse, pending: Dict[str, List[str]], ack: Dict[str, Any]
+    ) -> None:
+        batch = pending.pop(ack.get("req_id"), None)
+        if batch is None or ack.get("success"):
+            return
+        if len(batch) == 1:
+            self._logger.warning(f"[Bybit] Subscription rejected for {batch[0]}: {ack.get('ret_msg')}")
+            return
+        # Retry each half so one bad topic (or an oversize batch) can't drop the rest
+        mid = len(batch) // 2
+        await self._bybit_subscribe(ws, pending, batch[:mid])
+        await self._bybit_subscribe(ws, pending, batch[mid:])
+
     async def _bybit_loop(self) -> None:
+        parse, publish, min_value = _parse_bybit, bus.publish, self._min_value_usd
+        # Subscribe messages (req_id, frame, topics), rebuilt only when the symbol list changes
+        sub_symbols: List[str] = []
+        sub_batches: List[Tuple[str, str, List[str]]] = []
         while self._running.is_set():
             symbols = await self._fetch_bybit_symbols()
             if not symbols:
@@ -194,50 +329,38 @@ class AllLiquidationsService:
                     break
                 continue
 
-            topics = [f"allLiquidation.{sym}" for sym in symbols]
-            batch_size = 100
+            if symbols != sub_symbols:
+                topics = [f"allLiquidation.{sym}" for sym in symbols]
+                batch_size = self.BYBIT_SUB_BATCH
+                sub_batches = []
+                for i in range(0, len(topics), batch_size):
+                    batch = topics[i:i + batch_size]
+                    sub_batches.append((*self._bybit_sub_frame(batch), batch))
+                sub_symbols = symbols
             try:
-                async with websockets.connect(self.BYBIT_WS_URL) as ws:
-                    self._logger.info(f"[Bybit] Connected to liquidation stream. Subscribing to {len(topics)} topics...")
-                    # Subscribe in batches to avoid oversize messages
-                    for i in range(0, len(topics), batch_size):
-                        batch = topics[i:i + batch_size]
-                        sub = {"op": "subscribe", "args": batch}
-                        await ws.send(json.dumps(sub))
-                        await asyncio.sleep(0.05)
-
-                    async for raw in ws:
-                        try:
-                            data = json.loads(raw)
-                        except json.JSONDecodeError:
+                async with self._session.ws_connect(self.BYBIT_WS_URL, **self.WS_CONNECT_KWARGS) as ws:
+                    self._logger.info(f"[Bybit] Connected to liquidation stream. Subscribing to {len(sub_symbols)} topics...")
+                    # Subscribe in batches to avoid oversize messages, sent back to
+                    # back; in-flight batches are tracked by req_id until acked
+                    pending: Dict[str, List[str]] = {}
+                    for req_id, frame, batch in sub_batches:
+                        pending[req_id] = batch
+                        await ws.send_str(frame)
+
+                    async for data in _json_frames(ws):
+                        if data.get("op") == "subscribe":
+                            await self._on_bybit_subscribe_ack(ws, pending, data)
                             continue
 
                         topic = data.get("topic", "")
                         if not topic.startswith("allLiquidation.") or "data" not in data:
                             continue
 
+                        topic_sym = topic[len("allLiquidation."):]
                         for d in data.get("data", []):
-                            try:
-                                sym = d.get("s") or topic.replace("allLiquidation.", "")
-                                side = (d.get("S") or "").lower()
-                                price = float(d.get("p") or 0)
-                                qty = float(d.get("v") or 0)
-                                ts = d.get("T")
-                                value = price * qty
-                                if value < self._min_value_usd:
-                                    continue
-                                model = Liquidation(
-                                    exchange="bybit",
-                                    symbol=sym,
-                                    side=side if side in ("buy", "sell") else "sell",
-                                    price=price,
-                                    quantity=qty,
-                                    value=value,
-                                    timestamp=to_utc_datetime(int(ts)) if ts is not None else to_utc_datetime(0),
-                                )
-                                await bus.publish("liquidation", {"type": "liquidation", **model.model_dump(mode="json")})
-                            except Exception:
-                                continue
+                            event = parse(d, topic_sym, min_value)
+                            if event is not None:
+                                await publish("liquidation", event)
             except asyncio.CancelledError:
                 break
             except Exception as e:
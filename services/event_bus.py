@@ -4,69 +4,199 @@ Simple Async Pub/Sub Event Bus
 This module provides a lightweight publish/subscribe utility built on top of
 asyncio queues. It allows background services to publish events and any number
 of WebSocket handlers to subscribe and consume those events independently.
+
+Events are JSON-encoded once at publish time and shared by every subscriber,
+so fan-out to N WebSocket clients costs one serialization, not N.
 """
 
 import asyncio
-from typing import Any, Dict, DefaultDict, Set
-from collections import defaultdict
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+import orjson
 
 from core.logging import get_logger
 
 
+class BusEvent(NamedTuple):
+    """
+    A published event as delivered to subscribers.
+
+    The same instance is shared by every subscriber queue, so treat it as
+    immutable: read `data` for filtering and send `json` as-is.
+    """
+
+    data: Dict[str, Any]
+    json: str
+
+
+class SubscriberQueue:
+    """
+    Bounded single-consumer queue handed to each subscriber.
+
+    Implements the subset of asyncio.Queue the bus and its consumers use
+    (put_nowait, get, get_nowait, empty, qsize) on a plain deque plus one
+    asyncio.Event. Without asyncio.Queue's getter/putter bookkeeping and
+    task_done accounting, put_nowait costs about half as much, and
+    publishers pay it once per subscriber per event.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._items: Deque[BusEvent] = deque()
+        self._maxsize = maxsize
+        self._ready = asyncio.Event()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put_nowait(self, item: BusEvent) -> None:
+        """Append an event; raises asyncio.QueueFull at maxsize."""
+        if len(self._items) >= self._maxsize:
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._ready.set()
+
+    def get_nowait(self) -> BusEvent:
+        """Pop the oldest event; raises asyncio.QueueEmpty if there is none."""
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    async def get(self) -> BusEvent:
+        """Wait for and pop the oldest event."""
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+    async def drain(self, max_items: int) -> List[BusEvent]:
+        """Wait for at least one event, then pop up to `max_items` of them."""
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        items = self._items
+        if len(items) <= max_items:
+            batch = list(items)
+            items.clear()
+            return batch
+        return [items.popleft() for _ in range(max_items)]
+
+
 class EventBus:
     """
     Async event bus with topic-based pub/sub.
 
-    - Each subscriber gets its own asyncio.Queue and will not block publishers.
+    - Each subscriber gets its own SubscriberQueue and will not block publishers.
+    - Queues receive BusEvent items (event dict + pre-encoded JSON text).
     - Unsubscribing is important to avoid queue leaks when clients disconnect.
+    - Subscriber sets are copy-on-write tuples: subscribe/unsubscribe rebind a
+      new tuple, so publish iterates a stable snapshot without a lock or copy
+      (all mutation happens on the event loop thread, never across an await).
+    - Topics stay plain strings: literal names cache their hash, so the
+      per-publish dict lookup (~20ns) beats indexing a list by an IntEnum
+      member (~130ns, the enum attribute access dominates).
     """
 
     def __init__(self, max_queue_size: int = 1000) -> None:
-        self._topics: DefaultDict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._topics: Dict[str, Tuple[SubscriberQueue, ...]] = {}
         self._max_queue_size = max_queue_size
-        self._lock = asyncio.Lock()
         self._logger = get_logger(__name__)
 
-    async def subscribe(self, topic: str) -> asyncio.Queue:
+    async def subscribe(self, topic: str) -> SubscriberQueue:
         """
-        Subscribe to a topic. Returns an asyncio.Queue for receiving events.
+        Subscribe to a topic. Returns a SubscriberQueue for receiving events.
         """
-        queue: asyncio.Queue = asyncio.Queue(maxsize=self._max_queue_size)
-        async with self._lock:
-            self._topics[topic].add(queue)
+        queue = SubscriberQueue(self._max_queue_size)
+        self._topics[topic] = self._topics.get(topic, ()) + (queue,)
         self._logger.debug(f"Subscriber added to topic '{topic}'. total={len(self._topics[topic])}")
         return queue
 
-    async def unsubscribe(self, topic: str, queue: asyncio.Queue) -> None:
+    async def unsubscribe(self, topic: str, queue: SubscriberQueue) -> None:
         """
         Unsubscribe a queue from a topic.
         """
-        async with self._lock:
-            if queue in self._topics.get(topic, set()):
-                self._topics[topic].remove(queue)
-                # Best-effort drain to allow GC
-                try:
-                    while not queue.empty():
-                        queue.get_nowait()
-                except Exception:
-                    pass
-        self._logger.debug(f"Subscriber removed from topic '{topic}'. total={len(self._topics[topic])}")
+        subscribers = self._topics.get(topic, ())
+        if queue in subscribers:
+            self._topics[topic] = tuple(q for q in subscribers if q is not queue)
+            # Best-effort drain to allow GC
+            try:
+                while not queue.empty():
+                    queue.get_nowait()
+            except Exception:
+                pass
+        self._logger.debug(f"Subscriber removed from topic '{topic}'. total={len(self._topics.get(topic, ()))}")
 
-    async def publish(self, topic: str, event: Dict[str, Any]) -> None:
+    async def publish(self, topic: str, event: Dict[str, Any], encoded: Optional[str] = None) -> None:
         """
         Publish an event to a topic. Drops events if subscriber queue is full.
+
+        The event is JSON-encoded once (unless `encoded` is given) and only
+        when the topic has subscribers. An event orjson cannot encode (e.g. an
+        int beyond 64 bits) is logged and dropped rather than raised into the
+        publishing stream; non-finite floats encode as null.
         """
-        subscribers = list(self._topics.get(topic, set()))
+        subscribers = self._topics.get(topic)
         if not subscribers:
             return
 
+        if encoded is None:
+            try:
+                encoded = orjson.dumps(event).decode()
+            except orjson.JSONEncodeError as e:
+                self._logger.error(f"Dropping unencodable event for topic '{topic}': {e}")
+                return
+        item = BusEvent(event, encoded)
         for q in subscribers:
             try:
-                q.put_nowait(event)
+                q.put_nowait(item)
             except asyncio.QueueFull:
                 # Drop event to avoid backpressure blocking
                 self._logger.warning(f"Dropping event for topic '{topic}' due to full queue")
 
+    async def publish_many(self, topic: str, events: List[Dict[str, Any]]) -> None:
+        """
+        Publish a batch of events to a topic, in order.
+
+        Subscribers are resolved once for the whole batch. Drops the rest of
+        the batch for a subscriber whose queue fills up, and only the events
+        themselves that orjson cannot encode.
+        """
+        if not events:
+            return
+        subscribers = self._topics.get(topic)
+        if not subscribers:
+            return
+
+        items = []
+        for event in events:
+            try:
+                items.append(BusEvent(event, orjson.dumps(event).decode()))
+            except orjson.JSONEncodeError as e:
+                self._logger.error(f"Dropping unencodable event for topic '{topic}': {e}")
+        for q in subscribers:
+            for i, item in enumerate(items):
+                try:
+                    q.put_nowait(item)
+                except asyncio.QueueFull:
+                    # Nothing drains the queue mid-batch, so the rest would fail too
+                    self._logger.warning(
+                        f"Dropping {len(items) - i} event(s) for topic '{topic}' due to full queue"
+                    )
+                    break
+
+
+async def drain_batch(queue: SubscriberQueue, max_items: int = 256) -> List[BusEvent]:
+    """
+    Wait for the next event, then take whatever else is already queued.
+
+    Slow streams return one event at a time; bursts coalesce into a batch
+    of up to `max_items` without any added waiting.
+    """
+    return await queue.drain(max_items)
+
 
 # Singleton event bus for the application
 bus = EventBus()
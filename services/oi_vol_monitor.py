@@ -7,8 +7,9 @@ to the global event bus under topic 'oi_spike' when thresholds are exceeded.
 """
 
 import asyncio
-import statistics
-from typing import Dict, List, Tuple, Optional
+from collections import deque
+from math import fsum, sqrt
+from typing import Deque, Dict, List, Sequence, Tuple, Optional
 
 import aiohttp
 
@@ -16,6 +17,36 @@ from core.logging import get_logger
 from services.event_bus import bus
 
 
+class _RateLimiter:
+    """
+    Async token bucket: at most `rate` acquisitions per `period` seconds.
+
+    Bursts up to `rate` pass immediately; beyond that each `async with`
+    waits for the next token, so concurrent fetchers share one budget.
+    """
+
+    def __init__(self, rate: int, period: float) -> None:
+        self._capacity = float(rate)
+        self._per_second = rate / period
+        self._tokens = float(rate)
+        self._last = 0.0
+
+    async def __aenter__(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            if self._last:
+                self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._per_second)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._per_second)
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
 class OIVolMonitor:
     """
     Background service for detecting OI/Volume anomalies on Binance.
@@ -30,18 +61,37 @@ class OIVolMonitor:
     MIN_VOL_USD = {"5m": 100_000, "15m": 250_000, "1h": 1_000_000}
     MIN_OI_USD = {"5m": 500_000, "15m": 1_000_000, "1h": 2_500_000}
 
+    # Values kept per symbol/timeframe/metric for the z-score window
+    HISTORY_LEN = 100
+
+    # Concurrent (symbol, timeframe) fetches per cycle; bounded to stay under
+    # Binance's REST rate limits
+    MAX_CONCURRENT_FETCHES = 20
+
+    # Request budget per minute. Binance allows 2400 weight/min per IP (these
+    # calls weigh 1 each); half is left for the REST endpoints sharing the IP
+    REQUESTS_PER_MINUTE = 1200
+
     def __init__(self, cycle_sleep_seconds: int = 300, symbols_limit: int = 80) -> None:
         self._logger = get_logger(__name__)
         self._running = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
         self._cycle_sleep = cycle_sleep_seconds
         self._symbols_limit = symbols_limit
+        # Long-lived session so every fetch in a cycle reuses kept-alive
+        # connections instead of a fresh TCP + TLS handshake; opened in start()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._rate_limit = _RateLimiter(self.REQUESTS_PER_MINUTE, 60.0)
 
     async def start(self) -> None:
         if self._running.is_set():
             return
         self._running.set()
         self._logger.info("Starting OI/Volume monitor...")
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=15),
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+        )
         self._task = asyncio.create_task(self._run(), name="oi_vol_monitor")
 
     async def stop(self) -> None:
@@ -51,9 +101,12 @@ class OIVolMonitor:
         self._running.clear()
         if self._task:
             self._task.cancel()
-            with contextlib.suppress(Exception):
+            with contextlib.suppress(asyncio.CancelledError, Exception):
                 await self._task
             self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     # ============================================
     # Core Loop
@@ -66,49 +119,52 @@ class OIVolMonitor:
         self._logger.info(f"OI/Vol monitor tracking {len(symbols)} Binance symbols")
 
         # In-memory ring buffers by symbol/timeframe
-        store: Dict[str, Dict[str, Dict[str, List[float]]]] = {
-            s: {tf: {"oi": [], "vol": []} for tf in self.TIMEFRAMES} for s in symbols
+        store: Dict[str, Dict[str, Dict[str, Deque[float]]]] = {
+            s: {
+                tf: {"oi": deque(maxlen=self.HISTORY_LEN), "vol": deque(maxlen=self.HISTORY_LEN)}
+                for tf in self.TIMEFRAMES
+            }
+            for s in symbols
         }
 
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
         while self._running.is_set():
             cycle_start = asyncio.get_running_loop().time()
             try:
-                for sym in symbols:
-                    for tf in self.TIMEFRAMES:
-                        oi_vals = await self._fetch_open_interest(sym, tf, limit=50)
-                        vol_vals = await self._fetch_quote_volume(sym, tf, limit=50)
-                        if not oi_vals or not vol_vals:
-                            continue
-
-                        # Append new values and cap to 100
-                        store[sym][tf]["oi"].extend([v for _, v in oi_vals])
-                        store[sym][tf]["vol"].extend([v for _, v in vol_vals])
-                        store[sym][tf]["oi"] = store[sym][tf]["oi"][-100:]
-                        store[sym][tf]["vol"] = store[sym][tf]["vol"][-100:]
-
-                        # Basic guards
-                        if (
-                            store[sym][tf]["oi"][-1] < self.MIN_OI_USD[tf]
-                            or store[sym][tf]["vol"][-1] < self.MIN_VOL_USD[tf]
-                        ):
-                            continue
-
-                        z_oi = self._compute_z(store[sym][tf]["oi"])
-                        z_vol = self._compute_z(store[sym][tf]["vol"])
-                        thr = self.Z_THRESHOLDS[tf]
-                        if z_oi >= thr or z_vol >= thr:
-                            event = {
-                                "type": "oi_spike",
-                                "exchange": "binance",
-                                "symbol": sym,
-                                "timeframe": tf,
-                                "z_oi": round(z_oi, 2),
-                                "z_vol": round(z_vol, 2),
-                                "confirmed": bool(z_oi >= thr and z_vol >= thr),
-                            }
-                            await bus.publish("oi_spike", event)
-                # Gentle pacing inside the loop to avoid rate limits
-                await asyncio.sleep(0.2)
+                # Fetch every (symbol, timeframe) pair concurrently, then process
+                # the results in order
+                results = await asyncio.gather(*(
+                    self._fetch_pair(sym, tf, semaphore) for sym in symbols for tf in self.TIMEFRAMES
+                ))
+                for sym, tf, oi_vals, vol_vals in results:
+                    if not oi_vals or not vol_vals:
+                        continue
+
+                    # Append new values; the bounded deques drop the oldest in place
+                    oi_buf = store[sym][tf]["oi"]
+                    vol_buf = store[sym][tf]["vol"]
+                    oi_buf.extend(v for _, v in oi_vals)
+                    vol_buf.extend(v for _, v in vol_vals)
+
+                    # Basic guards
+                    if oi_buf[-1] < self.MIN_OI_USD[tf] or vol_buf[-1] < self.MIN_VOL_USD[tf]:
+                        continue
+
+                    z_oi = self._compute_z(oi_buf)
+                    z_vol = self._compute_z(vol_buf)
+                    thr = self.Z_THRESHOLDS[tf]
+                    if z_oi >= thr or z_vol >= thr:
+                        event = {
+                            "type": "oi_spike",
+                            "exchange": "binance",
+                            "symbol": sym,
+                            "timeframe": tf,
+                            "z_oi": round(z_oi, 2),
+                            "z_vol": round(z_vol, 2),
+                            "confirmed": bool(z_oi >= thr and z_vol >= thr),
+                        }
+                        await bus.publish("oi_spike", event)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -116,71 +172,87 @@ class OIVolMonitor:
             finally:
                 elapsed = asyncio.get_running_loop().time() - cycle_start
                 self._logger.info(f"OI/Vol monitor cycle finished in {elapsed:.1f}s; sleeping {self._cycle_sleep}s")
-                await asyncio.sleep(self._cycle_sleep)
+            # Outside the finally so a cancelled cycle exits instead of sleeping
+            await asyncio.sleep(self._cycle_sleep)
 
     # ============================================
     # Fetchers
     # ============================================
+    async def _fetch_pair(
+        self, symbol: str, timeframe: str, semaphore: asyncio.Semaphore
+    ) -> Tuple[str, str, List[Tuple[int, float]], List[Tuple[int, float]]]:
+        """Fetch OI history and quote volume for one (symbol, timeframe) pair."""
+        async with semaphore:
+            oi_vals, vol_vals = await asyncio.gather(
+                self._fetch_open_interest(symbol, timeframe, limit=50),
+                self._fetch_quote_volume(symbol, timeframe, limit=50),
+            )
+        return symbol, timeframe, oi_vals, vol_vals
+
     async def _fetch_symbols(self) -> List[str]:
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
-                async with session.get(self.EXCHANGE_INFO_URL) as resp:
-                    if resp.status != 200:
-                        return []
-                    data = await resp.json()
-                    symbols = [
-                        s["symbol"]
-                        for s in data.get("symbols", [])
-                        if (
-                            isinstance(s, dict)
-                            and s.get("contractType") == "PERPETUAL"
-                            and s.get("status") == "TRADING"
-                            and s.get("quoteAsset") == "USDT"
-                        )
-                    ]
-                    return symbols
+            async with self._rate_limit, self._session.get(self.EXCHANGE_INFO_URL) as resp:
+                if resp.status != 200:
+                    return []
+                data = await resp.json()
+                symbols = [
+                    s["symbol"]
+                    for s in data.get("symbols", [])
+                    if (
+                        isinstance(s, dict)
+                        and s.get("contractType") == "PERPETUAL"
+                        and s.get("status") == "TRADING"
+                        and s.get("quoteAsset") == "USDT"
+                    )
+                ]
+                return symbols
         except Exception:
             return []
 
     async def _fetch_open_interest(self, symbol: str, period: str, limit: int = 50) -> List[Tuple[int, float]]:
         params = {"symbol": symbol, "period": period, "limit": limit}
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
-                async with session.get(self.OI_URL, params=params) as resp:
-                    if resp.status != 200:
-                        return []
-                    payload = await resp.json()
-                    return [
-                        (int(x["timestamp"]), float(x["sumOpenInterestValue"]))
-                        for x in payload
-                        if "timestamp" in x and "sumOpenInterestValue" in x
-                    ]
+            async with self._rate_limit, self._session.get(self.OI_URL, params=params) as resp:
+                if resp.status != 200:
+                    return []
+                payload = await resp.json()
+                return [
+                    (int(x["timestamp"]), float(x["sumOpenInterestValue"]))
+                    for x in payload
+                    if "timestamp" in x and "sumOpenInterestValue" in x
+                ]
         except Exception:
             return []
 
     async def _fetch_quote_volume(self, symbol: str, interval: str, limit: int = 50) -> List[Tuple[int, float]]:
         params = {"symbol": symbol, "interval": interval, "limit": limit}
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
-                async with session.get(self.KLINES_URL, params=params) as resp:
-                    if resp.status != 200:
-                        return []
-                    kl = await resp.json()
-                    # Return (close time, quote volume)
-                    return [(int(k[6]), float(k[7])) for k in kl if isinstance(k, list) and len(k) >= 8]
+            async with self._rate_limit, self._session.get(self.KLINES_URL, params=params) as resp:
+                if resp.status != 200:
+                    return []
+                kl = await resp.json()
+                # Return (close time, quote volume)
+                return [(int(k[6]), float(k[7])) for k in kl if isinstance(k, list) and len(k) >= 8]
         except Exception:
             return []
 
     # ============================================
     # Math
     # ============================================
-    def _compute_z(self, values: List[float]) -> float:
-        if len(values) < 5:
+    def _compute_z(self, values: Sequence[float]) -> float:
+        """
+        Z-score of the latest value against the whole buffer (sample stdev).
+
+        Two fsum passes over plain floats: exact enough for <=100 values and
+        much faster than the statistics module's Fraction-based arithmetic.
+        """
+        n = len(values)
+        if n < 5:
             return 0.0
         try:
-            mean = statistics.mean(values)
-            stdev = statistics.stdev(values)
-            return (values[-1] - mean) / stdev if stdev > 0 else 0.0
+            mean = fsum(values) / n
+            var = fsum([(x - mean) * (x - mean) for x in values]) / (n - 1)
+            return (values[-1] - mean) / sqrt(var) if var > 0 else 0.0
         except Exception:
             return 0.0
 
@@ -11,9 +11,20 @@ if __name__ == "__main__":
     # Import and run uvicorn programmatically
     import uvicorn
 
+    # uvloop (libuv event loop) comes with uvicorn[standard] everywhere but
+    # Windows; request it explicitly so a missing install shows up in the logs
+    loop = "asyncio"
+    if sys.platform != "win32":
+        try:
+            import uvloop  # noqa: F401
+            loop = "uvloop"
+        except ImportError:
+            print("[start] uvloop not installed; using the default asyncio event loop")
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        log_level="info"
+        log_level="info",
+        loop=loop,
     )
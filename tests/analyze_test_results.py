@@ -9,29 +9,70 @@ Usage:
     python analyze_test_results.py test_results.json --detailed
 """
 
-import json
 import sys
 import argparse
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import ijson
+
+
+# Status -> line formatter for one REST endpoint / WebSocket stream result in
+# the detailed analysis; statuses without an entry print nothing
+REST_STATUS_FORMATTERS = {
+    "success": lambda name, r: (
+        f"        ✅ {name}: {r['data_count']} items" if "data_count" in r else f"        ✅ {name}: Success"
+    ),
+    "error": lambda name, r: f"        ❌ {name}: {r.get('error', 'Unknown error')}",
+    "no_data": lambda name, r: f"        ⚠️  {name}: No data returned",
+    "skipped": lambda name, r: f"        ⏭️  {name}: {r.get('skipped', 'Skipped')}",
+}
+
+WS_STATUS_FORMATTERS = {
+    "success": lambda name, r: f"        ✅ {name}: {r.get('messages_received', 0)} messages",
+    "timeout": lambda name, r: (
+        f"        ⏰ {name}: Timeout after {r.get('timeout_seconds', 0)}s ({r.get('messages_received', 0)} messages)"
+    ),
+    "error": lambda name, r: f"        ❌ {name}: {r.get('error', 'Unknown error')}",
+    "skipped": lambda name, r: f"        ⏭️  {name}: {r.get('skipped', 'Skipped')}",
+}
 
 
 class TestResultsAnalyzer:
-    """Analyzes test results and provides insights."""
+    """
+    Analyzes test results and provides insights.
+
+    Only the small "test_run" header is kept in memory; per-exchange results
+    are streamed from the file with ijson one exchange at a time, so memory
+    stays flat however many exchanges a (merged) results file holds.
+    """
     
     def __init__(self, results_file: str):
         self.results_file = results_file
-        self.results = self.load_results()
+        self.test_run = self.load_results()
         
     def load_results(self) -> Dict[str, Any]:
-        """Load test results from JSON file."""
+        """Load the test run header from the JSON results file."""
         try:
-            with open(self.results_file, 'r') as f:
-                return json.load(f)
+            with open(self.results_file, 'rb') as f:
+                for test_run in ijson.items(f, 'test_run', use_float=True):
+                    return test_run
+            print(f"❌ No test_run section in results file: {self.results_file}")
+            sys.exit(1)
         except FileNotFoundError:
             print(f"❌ Results file not found: {self.results_file}")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except ijson.JSONError as e:
+            print(f"❌ Invalid JSON in results file: {e}")
+            sys.exit(1)
+
+    def iter_exchanges(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream (exchange_name, exchange_data) pairs from the results file."""
+        try:
+            with open(self.results_file, 'rb') as f:
+                yield from ijson.kvitems(f, 'exchanges', use_float=True)
+        except ijson.JSONError as e:
             print(f"❌ Invalid JSON in results file: {e}")
             sys.exit(1)
             
@@ -51,7 +92,7 @@ class TestResultsAnalyzer:
         
     def print_overall_stats(self):
         """Print overall test statistics."""
-        run_info = self.results["test_run"]
+        run_info = self.test_run
         
         print(f"\n📊 OVERALL STATISTICS")
         print("-" * 40)
@@ -65,7 +106,7 @@ class TestResultsAnalyzer:
         
         # Health status
         healthy_exchanges = 0
-        for exchange_data in self.results["exchanges"].values():
+        for _, exchange_data in self.iter_exchanges():
             if exchange_data.get("health_check", {}).get("status") == "healthy":
                 healthy_exchanges += 1
                 
@@ -76,16 +117,18 @@ class TestResultsAnalyzer:
         print(f"\n🔍 EXCHANGE ANALYSIS")
         print("-" * 40)
         
-        for exchange_name, exchange_data in self.results["exchanges"].items():
-            print(f"\n📈 {exchange_name.upper()}:")
+        write = sys.stdout.write
+        for exchange_name, exchange_data in self.iter_exchanges():
+            # Each exchange's report is built up and written in one call
+            lines = [f"\n📈 {exchange_name.upper()}:"]
             
             # Health status
             health = exchange_data.get("health_check", {})
             health_status = health.get("status", "unknown")
             health_icon = "✅" if health_status == "healthy" else "❌"
-            print(f"  {health_icon} Health: {health_status}")
+            lines.append(f"  {health_icon} Health: {health_status}")
             if health.get("error"):
-                print(f"    Error: {health['error']}")
+                lines.append(f"    Error: {health['error']}")
                 
             # Test summary
             summary = exchange_data.get("summary", {})
@@ -96,64 +139,62 @@ class TestResultsAnalyzer:
             
             if total > 0:
                 success_rate = (passed / total) * 100
-                print(f"  📊 Tests: {passed}✅ {failed}❌ {skipped}⏭️ ({success_rate:.1f}% success)")
+                lines.append(f"  📊 Tests: {passed}✅ {failed}❌ {skipped}⏭️ ({success_rate:.1f}% success)")
             else:
-                print(f"  📊 Tests: No tests run")
+                lines.append(f"  📊 Tests: No tests run")
                 
             # Capabilities
             caps = exchange_data.get("capabilities", {})
-            supported_features = [k for k, v in caps.items() if v]
-            unsupported_features = [k for k, v in caps.items() if not v]
+            supported_features, unsupported_features = [], []
+            for feature, supported in caps.items():
+                (supported_features if supported else unsupported_features).append(feature)
             
-            print(f"  🎯 Supported: {', '.join(supported_features) if supported_features else 'None'}")
+            lines.append(f"  🎯 Supported: {', '.join(supported_features) if supported_features else 'None'}")
             if unsupported_features:
-                print(f"  🚫 Unsupported: {', '.join(unsupported_features)}")
+                lines.append(f"  🚫 Unsupported: {', '.join(unsupported_features)}")
                 
             # Detailed analysis
             if detailed:
-                self.print_detailed_exchange_analysis(exchange_name, exchange_data)
+                self.print_detailed_exchange_analysis(exchange_name, exchange_data, lines)
+
+            lines.append("")
+            write("\n".join(lines))
                 
-    def print_detailed_exchange_analysis(self, exchange_name: str, exchange_data: Dict):
-        """Print detailed analysis for a specific exchange."""
-        print(f"    📋 DETAILED ANALYSIS:")
+    def print_detailed_exchange_analysis(
+        self, exchange_name: str, exchange_data: Dict, lines: Optional[List[str]] = None
+    ):
+        """
+        Print detailed analysis for a specific exchange.
+
+        When `lines` is given, the output lines are appended to it for the
+        caller to write instead of being printed.
+        """
+        out = [] if lines is None else lines
+        out.append(f"    📋 DETAILED ANALYSIS:")
         
         # REST API analysis
         rest_api = exchange_data.get("rest_api", {})
         if rest_api:
-            print(f"      🌐 REST API:")
+            out.append(f"      🌐 REST API:")
             for endpoint, result in rest_api.items():
                 if isinstance(result, dict):
-                    status = result.get("status", "unknown")
-                    if status == "success":
-                        if "data_count" in result:
-                            print(f"        ✅ {endpoint}: {result['data_count']} items")
-                        else:
-                            print(f"        ✅ {endpoint}: Success")
-                    elif status == "error":
-                        print(f"        ❌ {endpoint}: {result.get('error', 'Unknown error')}")
-                    elif status == "no_data":
-                        print(f"        ⚠️  {endpoint}: No data returned")
-                    elif status == "skipped":
-                        print(f"        ⏭️  {endpoint}: {result.get('skipped', 'Skipped')}")
+                    formatter = REST_STATUS_FORMATTERS.get(result.get("status", "unknown"))
+                    if formatter:
+                        out.append(formatter(endpoint, result))
                         
         # WebSocket analysis
         websocket = exchange_data.get("websocket", {})
         if websocket:
-            print(f"      🔌 WebSocket:")
+            out.append(f"      🔌 WebSocket:")
             for stream, result in websocket.items():
                 if isinstance(result, dict):
-                    status = result.get("status", "unknown")
-                    if status == "success":
-                        messages = result.get("messages_received", 0)
-                        print(f"        ✅ {stream}: {messages} messages")
-                    elif status == "timeout":
-                        messages = result.get("messages_received", 0)
-                        timeout = result.get("timeout_seconds", 0)
-                        print(f"        ⏰ {stream}: Timeout after {timeout}s ({messages} messages)")
-                    elif status == "error":
-                        print(f"        ❌ {stream}: {result.get('error', 'Unknown error')}")
-                    elif status == "skipped":
-                        print(f"        ⏭️  {stream}: {result.get('skipped', 'Skipped')}")
+                    formatter = WS_STATUS_FORMATTERS.get(result.get("status", "unknown"))
+                    if formatter:
+                        out.append(formatter(stream, result))
+
+        if lines is None:
+            out.append("")
+            sys.stdout.write("\n".join(out))
                         
     def print_recommendations(self):
         """Print recommendations based on test results."""
@@ -163,47 +204,48 @@ class TestResultsAnalyzer:
         recommendations = []
         
         # Check for failed tests
-        failed_tests = self.results["test_run"]["failed_tests"]
+        failed_tests = self.test_run["failed_tests"]
         if failed_tests > 0:
             recommendations.append(f"🔧 Fix {failed_tests} failed tests")
             
-        # Check for unhealthy exchanges
-        unhealthy_exchanges = []
-        for exchange_name, exchange_data in self.results["exchanges"].items():
+        # One pass over the exchanges collects unhealthy exchanges, WebSocket
+        # timeouts and feature coverage together; the name sets are sorted
+        # when printed so the output is deterministic
+        unhealthy_exchanges = set()
+        timeout_exchanges = set()
+        feature_total = Counter()
+        feature_supported = Counter()
+        for exchange_name, exchange_data in self.iter_exchanges():
             health = exchange_data.get("health_check", {}).get("status")
             if health != "healthy":
-                unhealthy_exchanges.append(exchange_name)
-                
+                unhealthy_exchanges.add(exchange_name)
+
+            websocket = exchange_data.get("websocket", {})
+            timeout_exchanges.update(
+                f"{exchange_name}.{stream}"
+                for stream, result in websocket.items()
+                if isinstance(result, dict) and result.get("status") == "timeout"
+            )
+
+            caps = exchange_data.get("capabilities", {})
+            feature_total.update(caps.keys())
+            feature_supported.update(feature for feature, supported in caps.items() if supported)
+
+        # Check for unhealthy exchanges
         if unhealthy_exchanges:
-            recommendations.append(f"🏥 Investigate unhealthy exchanges: {', '.join(unhealthy_exchanges)}")
+            recommendations.append(f"🏥 Investigate unhealthy exchanges: {', '.join(sorted(unhealthy_exchanges))}")
             
         # Check for WebSocket timeouts
-        timeout_exchanges = []
-        for exchange_name, exchange_data in self.results["exchanges"].items():
-            websocket = exchange_data.get("websocket", {})
-            for stream, result in websocket.items():
-                if isinstance(result, dict) and result.get("status") == "timeout":
-                    timeout_exchanges.append(f"{exchange_name}.{stream}")
-                    
         if timeout_exchanges:
-            recommendations.append(f"⏰ Investigate WebSocket timeouts: {', '.join(timeout_exchanges)}")
+            recommendations.append(f"⏰ Investigate WebSocket timeouts: {', '.join(sorted(timeout_exchanges))}")
             
         # Check for unsupported features
-        feature_coverage = {}
-        for exchange_name, exchange_data in self.results["exchanges"].items():
-            caps = exchange_data.get("capabilities", {})
-            for feature, supported in caps.items():
-                if feature not in feature_coverage:
-                    feature_coverage[feature] = {"supported": 0, "total": 0}
-                feature_coverage[feature]["total"] += 1
-                if supported:
-                    feature_coverage[feature]["supported"] += 1
-                    
-        for feature, coverage in feature_coverage.items():
-            if coverage["supported"] == 0:
+        for feature, total in feature_total.items():
+            supported = feature_supported[feature]
+            if supported == 0:
                 recommendations.append(f"🚫 No exchanges support {feature} - consider implementation")
-            elif coverage["supported"] < coverage["total"]:
-                missing = coverage["total"] - coverage["supported"]
+            elif supported < total:
+                missing = total - supported
                 recommendations.append(f"📈 Improve {feature} support ({missing} exchanges missing)")
                 
         if not recommendations:
@@ -219,7 +261,7 @@ class TestResultsAnalyzer:
                 f.write("EXCHANGE TEST RESULTS SUMMARY\n")
                 f.write("=" * 50 + "\n\n")
                 
-                run_info = self.results["test_run"]
+                run_info = self.test_run
                 f.write(f"Test Run: {run_info['timestamp']}\n")
                 f.write(f"Exchanges: {run_info['total_exchanges']}\n")
                 f.write(f"Total Tests: {run_info['total_tests']}\n")
@@ -231,7 +273,7 @@ class TestResultsAnalyzer:
                 f.write("EXCHANGE DETAILS:\n")
                 f.write("-" * 30 + "\n")
                 
-                for exchange_name, exchange_data in self.results["exchanges"].items():
+                for exchange_name, exchange_data in self.iter_exchanges():
                     health = exchange_data.get("health_check", {}).get("status", "unknown")
                     summary = exchange_data.get("summary", {})
                     
@@ -17,17 +17,33 @@ Usage:
 """
 
 import asyncio
-import json
 import sys
 import argparse
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+import orjson
+
 from core.exchange_manager import ExchangeManager
 from core.logging import get_logger
 
 
+# (result key, capability, display name, call) for each REST endpoint and
+# WebSocket stream under test; results are recorded under the result key
+REST_TESTS = [
+    ("get_ohlc", "ohlc", "OHLC Data", lambda ex: ex.get_ohlc("BTCUSDT", "1h", limit=5)),
+    ("get_open_interest", "open_interest", "Open Interest", lambda ex: ex.get_open_interest("BTCUSDT")),
+    ("get_funding_rate", "funding_rate", "Funding Rate", lambda ex: ex.get_funding_rate("BTCUSDT")),
+]
+
+WS_TESTS = [
+    ("stream_ohlc", "ohlc", "OHLC Stream", lambda ex: ex.stream_ohlc("BTCUSDT", "1m")),
+    ("stream_large_trades", "large_trades", "Trades Stream", lambda ex: ex.stream_large_trades("BTCUSDT")),
+    ("stream_liquidations", "liquidations", "Liquidations Stream", lambda ex: ex.stream_liquidations("BTCUSDT")),
+]
+
+
 class ExchangeTestSuite:
     """
     Comprehensive test suite for all registered exchanges.
@@ -39,6 +55,9 @@ class ExchangeTestSuite:
     - Health checks
     """
     
+    # Upper bound on WebSocket streams open at once across all exchanges
+    MAX_CONCURRENT_WS = 16
+
     def __init__(self, output_file: str = "test_results.json"):
         self.output_file = output_file
         self.logger = get_logger(__name__)
@@ -53,6 +72,12 @@ class ExchangeTestSuite:
             },
             "exchanges": {}
         }
+        self._ws_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_WS)
+        # Per-exchange results are journaled here (one NDJSON line per
+        # exchange, as each finishes) so a crashed run keeps partial results;
+        # removed once the full results file is written
+        self.journal_file = f"{output_file}.ndjson"
+        self._journal = None
         
     async def run_all_tests(self, exchanges: Optional[List[str]] = None, skip_ws: bool = False):
         """
@@ -84,15 +109,31 @@ class ExchangeTestSuite:
         # Initialize all exchanges
         await manager.initialize_all()
         
-        for exchange_name in test_exchanges:
-            await self.test_exchange(manager, exchange_name, skip_ws)
+        # Exchanges are independent and mostly waiting on the network, so test
+        # them concurrently; each writes only its own results entry
+        try:
+            self._journal = open(self.journal_file, 'wb')
+        except OSError as e:
+            self.logger.error(f"❌ Failed to open results journal: {e}")
+        try:
+            await asyncio.gather(*(
+                self.test_exchange(manager, exchange_name, skip_ws) for exchange_name in test_exchanges
+            ))
+        finally:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+        # Keep results in the requested order rather than completion order
+        self.results["exchanges"] = {
+            name: self.results["exchanges"][name] for name in test_exchanges if name in self.results["exchanges"]
+        }
             
         # Shutdown all exchanges
         await manager.shutdown_all()
         
         # Generate summary and save results
         self.generate_summary()
-        self.save_results()
+        await self.save_results()
         
     async def test_exchange(self, manager: ExchangeManager, exchange_name: str, skip_ws: bool):
         """
@@ -103,7 +144,7 @@ class ExchangeTestSuite:
             exchange_name: Name of exchange to test
             skip_ws: Skip WebSocket tests
         """
-        self.logger.info(f"\n🔍 Testing {exchange_name.upper()} Exchange")
+        self.logger.info("\n🔍 Testing %s Exchange", exchange_name.upper())
         self.logger.info("-" * 60)
         
         exchange_results = {
@@ -122,7 +163,9 @@ class ExchangeTestSuite:
         
         try:
             exchange = manager.get_exchange(exchange_name)
-            exchange_results["capabilities"] = exchange.capabilities.copy()
+            # Shared, not copied: the suite only reads capabilities. A plain
+            # dict (not a MappingProxyType) so orjson serializes it natively
+            exchange_results["capabilities"] = exchange.capabilities
             
             # Test 1: Health Check
             await self.test_health_check(exchange, exchange_results)
@@ -138,53 +181,60 @@ class ExchangeTestSuite:
                 exchange_results["summary"]["skipped"] += 1
                 
         except Exception as e:
-            self.logger.error(f"❌ Failed to test {exchange_name}: {e}")
+            self.logger.error("❌ Failed to test %s: %s", exchange_name, e)
             exchange_results["error"] = str(e)
             
         self.results["exchanges"][exchange_name] = exchange_results
+        self._journal_exchange(exchange_name, exchange_results)
+        
+    def _journal_exchange(self, exchange_name: str, exchange_results: Dict):
+        """Append one exchange's results to the NDJSON journal, if open."""
+        if self._journal is None:
+            return
+        try:
+            self._journal.write(orjson.dumps(
+                {exchange_name: exchange_results},
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            ))
+            self._journal.flush()
+        except Exception as e:
+            self.logger.error("❌ Failed to journal %s results: %s", exchange_name, e)
         
     async def test_health_check(self, exchange, exchange_results: Dict):
         """Test exchange health check."""
         test_name = "health_check"
-        self.logger.info(f"  🏥 Testing {test_name}...")
+        self.logger.info("  🏥 Testing %s...", test_name)
         
         try:
             is_healthy = await exchange.health_check()
             exchange_results["health_check"]["status"] = "healthy" if is_healthy else "unhealthy"
             exchange_results["summary"]["passed"] += 1
-            self.logger.info(f"    ✅ {test_name}: {'Healthy' if is_healthy else 'Unhealthy'}")
+            self.logger.info("    ✅ %s: %s", test_name, "Healthy" if is_healthy else "Unhealthy")
         except Exception as e:
             exchange_results["health_check"]["status"] = "error"
             exchange_results["health_check"]["error"] = str(e)
             exchange_results["summary"]["failed"] += 1
-            self.logger.error(f"    ❌ {test_name}: {e}")
+            self.logger.error("    ❌ %s: %s", test_name, e)
         finally:
             exchange_results["summary"]["total_tests"] += 1
             
     async def test_rest_endpoints(self, exchange, exchange_results: Dict):
         """Test all REST API endpoints."""
-        rest_tests = [
-            ("get_ohlc", "OHLC Data"),
-            ("get_open_interest", "Open Interest"),
-            ("get_funding_rate", "Funding Rate")
-        ]
+        # Same answer as exchange.supports(feature), looked up once
+        caps = exchange.capabilities
         
-        for method_name, display_name in rest_tests:
-            if not exchange.supports(method_name.replace("get_", "")):
+        for method_name, feature, display_name, call in REST_TESTS:
+            if not caps.get(feature):
                 exchange_results["rest_api"][method_name] = {"skipped": "Not supported"}
                 exchange_results["summary"]["skipped"] += 1
                 exchange_results["summary"]["total_tests"] += 1
                 continue
                 
-            self.logger.info(f"  📊 Testing {display_name}...")
+            self.logger.info("  📊 Testing %s...", display_name)
             
             try:
-                if method_name == "get_ohlc":
-                    result = await exchange.get_ohlc("BTCUSDT", "1h", limit=5)
-                elif method_name == "get_open_interest":
-                    result = await exchange.get_open_interest("BTCUSDT")
-                elif method_name == "get_funding_rate":
-                    result = await exchange.get_funding_rate("BTCUSDT")
+                result = await call(exchange)
                     
                 if result:
                     if isinstance(result, list):
@@ -192,19 +242,19 @@ class ExchangeTestSuite:
                         exchange_results["rest_api"][method_name] = {
                             "status": "success",
                             "data_count": count,
-                            "sample_data": result[0].dict() if result else None
+                            "sample_data": result[0].model_dump(mode="json") if result else None
                         }
                     else:
                         exchange_results["rest_api"][method_name] = {
                             "status": "success",
-                            "data": result.dict()
+                            "data": result.model_dump(mode="json")
                         }
                     exchange_results["summary"]["passed"] += 1
-                    self.logger.info(f"    ✅ {display_name}: Success")
+                    self.logger.info("    ✅ %s: Success", display_name)
                 else:
                     exchange_results["rest_api"][method_name] = {"status": "no_data"}
                     exchange_results["summary"]["failed"] += 1
-                    self.logger.warning(f"    ⚠️  {display_name}: No data returned")
+                    self.logger.warning("    ⚠️  %s: No data returned", display_name)
                     
             except Exception as e:
                 exchange_results["rest_api"][method_name] = {
@@ -212,114 +262,120 @@ class ExchangeTestSuite:
                     "error": str(e)
                 }
                 exchange_results["summary"]["failed"] += 1
-                self.logger.error(f"    ❌ {display_name}: {e}")
+                self.logger.error("    ❌ %s: %s", display_name, e)
             finally:
                 exchange_results["summary"]["total_tests"] += 1
                 
     async def test_websocket_streams(self, exchange, exchange_results: Dict):
-        """Test WebSocket streams with timeout."""
-        ws_tests = [
-            ("stream_ohlc", "OHLC Stream"),
-            ("stream_large_trades", "Trades Stream"),
-            ("stream_liquidations", "Liquidations Stream")
-        ]
+        """Test WebSocket streams with timeout (streams run concurrently)."""
+        # Same answer as exchange.supports(feature), looked up once
+        caps = exchange.capabilities
         
-        for method_name, display_name in ws_tests:
-            feature_name = method_name.replace("stream_", "")
-            if not exchange.supports(feature_name):
-                exchange_results["websocket"][method_name] = {"skipped": "Not supported"}
+        async def run_one(feature: str, display_name: str, open_stream) -> Dict:
+            if not caps.get(feature):
                 exchange_results["summary"]["skipped"] += 1
                 exchange_results["summary"]["total_tests"] += 1
-                continue
+                return {"skipped": "Not supported"}
                 
-            self.logger.info(f"  🌐 Testing {display_name}...")
-            
-            try:
-                # Test WebSocket with timeout
-                if method_name == "stream_ohlc":
-                    stream = exchange.stream_ohlc("BTCUSDT", "1m")
-                elif method_name == "stream_large_trades":
-                    stream = exchange.stream_large_trades("BTCUSDT")
-                elif method_name == "stream_liquidations":
-                    stream = exchange.stream_liquidations("BTCUSDT")
-                    
-                # Wait for first message with timeout
-                message_count = 0
-                timeout_seconds = 10
+            # Caps open sockets across all concurrently tested exchanges
+            async with self._ws_semaphore:
+                self.logger.info("  🌐 Testing %s...", display_name)
                 
-                async def collect_messages():
-                    nonlocal message_count
+                try:
+                    # Test WebSocket with timeout
+                    stream = open_stream(exchange)
+                        
+                    # Wait for first message with timeout
+                    message_count = 0
+                    max_messages = 3  # Collect 3 messages then stop
+                    timeout_seconds = 10
+                    
                     try:
-                        async for message in stream:
-                            message_count += 1
-                            if message_count >= 3:  # Collect 3 messages then stop
-                                break
-                    except Exception as e:
-                        raise e
+                        try:
+                            # One timer handle on this task; no wrapper task per stream
+                            async with asyncio.timeout(timeout_seconds):
+                                async for _ in stream:
+                                    message_count += 1
+                                    if message_count == max_messages:
+                                        break
+                        finally:
+                            # Close the stream now (releasing its socket) rather
+                            # than whenever the abandoned generator is collected
+                            aclose = getattr(stream, "aclose", None)
+                            if aclose is not None:
+                                await aclose()
+                        exchange_results["summary"]["passed"] += 1
+                        self.logger.info("    ✅ %s: %d messages received", display_name, message_count)
+                        return {
+                            "status": "success",
+                            "messages_received": message_count,
+                            "timeout_seconds": timeout_seconds
+                        }
+                    except TimeoutError:
+                        exchange_results["summary"]["failed"] += 1
+                        self.logger.warning("    ⏰ %s: Timeout after %ss", display_name, timeout_seconds)
+                        return {
+                            "status": "timeout",
+                            "messages_received": message_count,
+                            "timeout_seconds": timeout_seconds
+                        }
                         
-                try:
-                    await asyncio.wait_for(collect_messages(), timeout=timeout_seconds)
-                    exchange_results["websocket"][method_name] = {
-                        "status": "success",
-                        "messages_received": message_count,
-                        "timeout_seconds": timeout_seconds
-                    }
-                    exchange_results["summary"]["passed"] += 1
-                    self.logger.info(f"    ✅ {display_name}: {message_count} messages received")
-                except asyncio.TimeoutError:
-                    exchange_results["websocket"][method_name] = {
-                        "status": "timeout",
-                        "messages_received": message_count,
-                        "timeout_seconds": timeout_seconds
-                    }
+                except Exception as e:
                     exchange_results["summary"]["failed"] += 1
-                    self.logger.warning(f"    ⏰ {display_name}: Timeout after {timeout_seconds}s")
+                    self.logger.error("    ❌ %s: %s", display_name, e)
+                    return {
+                        "status": "error",
+                        "error": str(e)
+                    }
+                finally:
+                    exchange_results["summary"]["total_tests"] += 1
                     
-            except Exception as e:
-                exchange_results["websocket"][method_name] = {
-                    "status": "error",
-                    "error": str(e)
-                }
-                exchange_results["summary"]["failed"] += 1
-                self.logger.error(f"    ❌ {display_name}: {e}")
-            finally:
-                exchange_results["summary"]["total_tests"] += 1
+        results = await asyncio.gather(*(run_one(f, d, call) for _, f, d, call in WS_TESTS))
+        # Recorded in declaration order, independent of which stream finished first
+        for (method_name, *_), result in zip(WS_TESTS, results):
+            exchange_results["websocket"][method_name] = result
                 
     def generate_summary(self):
         """Generate test summary statistics."""
-        total_tests = 0
-        passed_tests = 0
-        failed_tests = 0
-        skipped_tests = 0
-        
-        for exchange_name, exchange_data in self.results["exchanges"].items():
-            summary = exchange_data.get("summary", {})
-            total_tests += summary.get("total_tests", 0)
-            passed_tests += summary.get("passed", 0)
-            failed_tests += summary.get("failed", 0)
-            skipped_tests += summary.get("skipped", 0)
+        # Every exchange entry carries a summary (test_exchange always sets one)
+        summaries = [exchange_data["summary"] for exchange_data in self.results["exchanges"].values()]
+        total_tests = sum(summary["total_tests"] for summary in summaries)
+        passed_tests = sum(summary["passed"] for summary in summaries)
+        failed_tests = sum(summary["failed"] for summary in summaries)
+        skipped_tests = sum(summary["skipped"] for summary in summaries)
             
-        self.results["test_run"]["total_tests"] = total_tests
-        self.results["test_run"]["passed_tests"] = passed_tests
-        self.results["test_run"]["failed_tests"] = failed_tests
-        self.results["test_run"]["skipped_tests"] = skipped_tests
+        run_info = self.results["test_run"]
+        run_info["total_tests"] = total_tests
+        run_info["passed_tests"] = passed_tests
+        run_info["failed_tests"] = failed_tests
+        run_info["skipped_tests"] = skipped_tests
         
         # Calculate success rate
         if total_tests > 0:
             success_rate = (passed_tests / total_tests) * 100
-            self.results["test_run"]["success_rate"] = round(success_rate, 2)
+            run_info["success_rate"] = round(success_rate, 2)
         else:
-            self.results["test_run"]["success_rate"] = 0
+            run_info["success_rate"] = 0
             
-    def save_results(self):
-        """Save test results to JSON file."""
+    async def save_results(self):
+        """Save test results to JSON file (serialized and written in a worker thread)."""
         try:
-            with open(self.output_file, 'w') as f:
-                json.dump(self.results, f, indent=2, default=str)
+            await asyncio.to_thread(self._write_results)
             self.logger.info(f"📄 Test results saved to: {self.output_file}")
         except Exception as e:
             self.logger.error(f"❌ Failed to save results: {e}")
             
+    def _write_results(self):
+        """Serialize the results and write them to the output file (blocking)."""
+        with open(self.output_file, 'wb') as f:
+            f.write(orjson.dumps(
+                self.results,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ))
+        # The full results file supersedes the per-exchange journal
+        Path(self.journal_file).unlink(missing_ok=True)
+            
     def print_summary(self):
         """Print test summary to console."""
         run_info = self.results["test_run"]
@@ -39,76 +39,77 @@ async def test_rest_api():
     print()
 
     async with BybitAPIClient() as client:
+        # The probes are independent, so run them concurrently and report
+        # each result (or its exception) in order
+        server_time, ohlc_data, oi, rates = await asyncio.gather(
+            client.get_server_time(),
+            client.get_historical_ohlc("BTCUSDT", "1h", limit=5),
+            client.get_open_interest("BTCUSDT"),
+            client.get_funding_rate("BTCUSDT", limit=3),
+            return_exceptions=True,
+        )
+
+    # Test 1: Get Server Time (Health Check)
+    print("🕐 Test 1: Get Server Time")
+    print("-" * 60)
+    if isinstance(server_time, Exception):
+        print(f"✗ Error: {server_time}")
+    elif server_time:
+        print(f"✓ Success!")
+        print(f"  Server Time: {datetime.fromtimestamp(server_time/1000, tz=timezone.utc)}")
+    else:
+        print("✗ Failed: No data returned")
+    print()
 
-        # Test 1: Get Server Time (Health Check)
-        print("🕐 Test 1: Get Server Time")
-        print("-" * 60)
-        try:
-            server_time = await client.get_server_time()
-            if server_time:
-                print(f"✓ Success!")
-                print(f"  Server Time: {datetime.fromtimestamp(server_time/1000, tz=timezone.utc)}")
-            else:
-                print("✗ Failed: No data returned")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        print()
-
-        # Test 2: Get Historical OHLC
-        print("📈 Test 2: Get Historical OHLC for BTCUSDT (1h interval)")
-        print("-" * 60)
-        try:
-            ohlc_data = await client.get_historical_ohlc("BTCUSDT", "1h", limit=5)
-            if ohlc_data:
-                print(f"✓ Success! Fetched {len(ohlc_data)} candles")
-                # Show last 3 candles
-                for i, candle in enumerate(ohlc_data[-3:], 1):
-                    print(f"  Candle {i}:")
-                    print(f"    Time: {candle.timestamp}")
-                    print(f"    O: ${candle.open:,.2f}  H: ${candle.high:,.2f}")
-                    print(f"    L: ${candle.low:,.2f}   C: ${candle.close:,.2f}")
-                    print(f"    Volume: {candle.volume:.4f} BTC")
-            else:
-                print("✗ Failed: No data returned")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        print()
-
-        # Test 3: Get Open Interest
-        print("📊 Test 3: Get Open Interest for BTCUSDT")
-        print("-" * 60)
-        try:
-            oi = await client.get_open_interest("BTCUSDT")
-            if oi:
-                print(f"✓ Success!")
-                print(f"  Exchange: {oi.exchange}")
-                print(f"  Symbol: {oi.symbol}")
-                print(f"  Open Interest: {oi.open_interest:,.2f} BTC")
-                if oi.open_interest_value:
-                    print(f"  OI Value: ${oi.open_interest_value:,.2f}")
-                print(f"  Timestamp: {oi.timestamp}")
-            else:
-                print("✗ Failed: No data returned")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        print()
-
-        # Test 4: Get Funding Rate History
-        print("💰 Test 4: Get Funding Rate History for BTCUSDT")
-        print("-" * 60)
-        try:
-            rates = await client.get_funding_rate("BTCUSDT", limit=3)
-            if rates:
-                print(f"✓ Success! Fetched {len(rates)} funding rates")
-                for i, rate in enumerate(rates[-3:], 1):
-                    print(f"  Rate {i}:")
-                    print(f"    Funding Rate: {rate.funding_rate * 100:.4f}%")
-                    print(f"    Time: {rate.funding_time}")
-            else:
-                print("✗ Failed: No data returned")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        print()
+    # Test 2: Get Historical OHLC
+    print("📈 Test 2: Get Historical OHLC for BTCUSDT (1h interval)")
+    print("-" * 60)
+    if isinstance(ohlc_data, Exception):
+        print(f"✗ Error: {ohlc_data}")
+    elif ohlc_data:
+        print(f"✓ Success! Fetched {len(ohlc_data)} candles")
+        # Show last 3 candles
+        for i, candle in enumerate(ohlc_data[-3:], 1):
+            print(f"  Candle {i}:")
+            print(f"    Time: {candle.timestamp}")
+            print(f"    O: ${candle.open:,.2f}  H: ${candle.high:,.2f}")
+            print(f"    L: ${candle.low:,.2f}   C: ${candle.close:,.2f}")
+            print(f"    Volume: {candle.volume:.4f} BTC")
+    else:
+        print("✗ Failed: No data returned")
+    print()
+
+    # Test 3: Get Open Interest
+    print("📊 Test 3: Get Open Interest for BTCUSDT")
+    print("-" * 60)
+    if isinstance(oi, Exception):
+        print(f"✗ Error: {oi}")
+    elif oi:
+        print(f"✓ Success!")
+        print(f"  Exchange: {oi.exchange}")
+        print(f"  Symbol: {oi.symbol}")
+        print(f"  Open Interest: {oi.open_interest:,.2f} BTC")
+        if oi.open_interest_value:
+            print(f"  OI Value: ${oi.open_interest_value:,.2f}")
+        print(f"  Timestamp: {oi.timestamp}")
+    else:
+        print("✗ Failed: No data returned")
+    print()
+
+    # Test 4: Get Funding Rate History
+    print("💰 Test 4: Get Funding Rate History for BTCUSDT")
+    print("-" * 60)
+    if isinstance(rates, Exception):
+        print(f"✗ Error: {rates}")
+    elif rates:
+        print(f"✓ Success! Fetched {len(rates)} funding rates")
+        for i, rate in enumerate(rates[-3:], 1):
+            print(f"  Rate {i}:")
+            print(f"    Funding Rate: {rate.funding_rate * 100:.4f}%")
+            print(f"    Time: {rate.funding_time}")
+    else:
+        print("✗ Failed: No data returned")
+    print()
 
     print("=" * 60)
     print("REST API TESTS COMPLETED")
@@ -464,6 +465,15 @@ if __name__ == "__main__":
         print_usage()
         sys.exit(0)
 
+    # The streaming tests are I/O-bound; run them on uvloop (libuv) when it
+    # is installed, as the server does (see start.py)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     try:
         if mode == "rest":
             asyncio.run(test_rest_api())
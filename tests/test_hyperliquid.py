@@ -39,84 +39,85 @@ async def test_rest_api():
     print()
 
     async with HyperliquidAPIClient() as client:
+        # Last 5 minutes of 1m candles for the OHLC probe
+        end_time = current_utc_timestamp(milliseconds=True)
+        start_time = end_time - (5 * 60 * 1000)  # 5 minutes ago
+
+        # The probes are independent, so run them concurrently and report
+        # each result (or its exception) in order
+        oi, rates, predicted, ohlc_data = await asyncio.gather(
+            client.get_open_interest("BTC"),
+            client.get_funding_rate("BTC", limit=3),
+            client.get_predicted_funding(),
+            client.get_historical_ohlc("BTC", "1m", start_time, end_time),
+            return_exceptions=True,
+        )
+
+    # Test 1: Get Open Interest
+    print("📊 Test 1: Get Open Interest for BTC")
+    print("-" * 60)
+    if isinstance(oi, Exception):
+        print(f"✗ Error: {oi}")
+    elif oi:
+        print(f"✓ Success!")
+        print(f"  Exchange: {oi.exchange}")
+        print(f"  Symbol: {oi.symbol}")
+        print(f"  Open Interest: {oi.open_interest:,.2f} BTC")
+        if oi.open_interest_value:
+            print(f"  OI Value: ${oi.open_interest_value:,.2f}")
+        print(f"  Timestamp: {oi.timestamp}")
+    else:
+        print("✗ Failed: No data returned")
+    print()
 
-        # Test 1: Get Open Interest
-        print("📊 Test 1: Get Open Interest for BTC")
-        print("-" * 60)
-        try:
-            oi = await client.get_open_interest("BTC")
-            if oi:
-                print(f"✓ Success!")
-                print(f"  Exchange: {oi.exchange}")
-                print(f"  Symbol: {oi.symbol}")
-                print(f"  Open Interest: {oi.open_interest:,.2f} BTC")
-                if oi.open_interest_value:
-                    print(f"  OI Value: ${oi.open_interest_value:,.2f}")
-                print(f"  Timestamp: {oi.timestamp}")
-            else:
-                print("✗ Failed: No data returned")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        print()
-
-        # Test 2: Get Funding Rate
-        print("💰 Test 2: Get Funding Rate History for BTC")
-        print("-" * 60)
-        try:
-            rates = await client.get_funding_rate("BTC", limit=3)
-            if rates:
-                print(f"✓ Success! Fetched {len(rates)} funding rates")
-                for i, rate in enumerate(rates[-3:], 1):
-                    print(f"  Rate {i}:")
-                    print(f"    Funding Rate: {rate.funding_rate * 100:.4f}%")
-                    print(f"    Time: {rate.funding_time}")
-            else:
-                print("✗ Failed: No data returned")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        print()
-
-        # Test 3: Get Predicted Funding
-        print("🔮 Test 3: Get Predicted Funding Rates")
-        print("-" * 60)
-        try:
-            predicted = await client.get_predicted_funding()
-            if predicted:
-                print(f"✓ Success! Fetched predictions for {len(predicted)} symbols")
-                # Show first 5
-                for symbol, rate in list(predicted.items())[:5]:
-                    print(f"  {symbol}: {rate * 100:.4f}%")
-                if len(predicted) > 5:
-                    print(f"  ... and {len(predicted) - 5} more")
-            else:
-                print("✗ Failed: No data returned")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        print()
-
-        # Test 4: Get Historical OHLC
-        print("📈 Test 4: Get Historical OHLC for BTC (1m interval)")
-        print("-" * 60)
-        try:
-            # Get last 5 minutes of data
-            end_time = current_utc_timestamp(milliseconds=True)
-            start_time = end_time - (5 * 60 * 1000)  # 5 minutes ago
-
-            ohlc_data = await client.get_historical_ohlc("BTC", "1m", start_time, end_time)
-            if ohlc_data:
-                print(f"✓ Success! Fetched {len(ohlc_data)} candles")
-                # Show last 3 candles
-                for i, candle in enumerate(ohlc_data[-3:], 1):
-                    print(f"  Candle {i}:")
-                    print(f"    Time: {candle.timestamp}")
-                    print(f"    O: ${candle.open:,.2f}  H: ${candle.high:,.2f}")
-                    print(f"    L: ${candle.low:,.2f}   C: ${candle.close:,.2f}")
-                    print(f"    Volume: {candle.volume:.4f}")
-            else:
-                print("✗ Failed: No data returned")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        print()
+    # Test 2: Get Funding Rate
+    print("💰 Test 2: Get Funding Rate History for BTC")
+    print("-" * 60)
+    if isinstance(rates, Exception):
+        print(f"✗ Error: {rates}")
+    elif rates:
+        print(f"✓ Success! Fetched {len(rates)} funding rates")
+        for i, rate in enumerate(rates[-3:], 1):
+            print(f"  Rate {i}:")
+            print(f"    Funding Rate: {rate.funding_rate * 100:.4f}%")
+            print(f"    Time: {rate.funding_time}")
+    else:
+        print("✗ Failed: No data returned")
+    print()
+
+    # Test 3: Get Predicted Funding
+    print("🔮 Test 3: Get Predicted Funding Rates")
+    print("-" * 60)
+    if isinstance(predicted, Exception):
+        print(f"✗ Error: {predicted}")
+    elif predicted:
+        print(f"✓ Success! Fetched predictions for {len(predicted)} symbols")
+        # Show first 5
+        for symbol, rate in list(predicted.items())[:5]:
+            print(f"  {symbol}: {rate * 100:.4f}%")
+        if len(predicted) > 5:
+            print(f"  ... and {len(predicted) - 5} more")
+    else:
+        print("✗ Failed: No data returned")
+    print()
+
+    # Test 4: Get Historical OHLC
+    print("📈 Test 4: Get Historical OHLC for BTC (1m interval)")
+    print("-" * 60)
+    if isinstance(ohlc_data, Exception):
+        print(f"✗ Error: {ohlc_data}")
+    elif ohlc_data:
+        print(f"✓ Success! Fetched {len(ohlc_data)} candles")
+        # Show last 3 candles
+        for i, candle in enumerate(ohlc_data[-3:], 1):
+            print(f"  Candle {i}:")
+            print(f"    Time: {candle.timestamp}")
+            print(f"    O: ${candle.open:,.2f}  H: ${candle.high:,.2f}")
+            print(f"    L: ${candle.low:,.2f}   C: ${candle.close:,.2f}")
+            print(f"    Volume: {candle.volume:.4f}")
+    else:
+        print("✗ Failed: No data returned")
+    print()
 
     print("=" * 60)
     print("REST API TESTS COMPLETED")
@@ -411,6 +412,15 @@ if __name__ == "__main__":
         print_usage()
         sys.exit(0)
 
+    # The streaming tests are I/O-bound; run them on uvloop (libuv) when it
+    # is installed, as the server does (see start.py)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     try:
         if mode == "rest":
             asyncio.run(test_rest_api())
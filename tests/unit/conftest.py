@@ -0,0 +1,17 @@
+"""
+Shared fixtures for the unit tests
+"""
+
+import pytest
+
+
+@pytest.fixture(params=[
+    pytest.param(1704110400000, id="whole-second-ms"),
+    pytest.param(1704110400123, id="nonzero-ms"),
+    pytest.param(1704110400007, id="leading-zero-ms"),
+    pytest.param(1704110400, id="seconds"),
+    pytest.param(0, id="zero"),
+])
+def exchange_timestamp(request):
+    """Timestamp inputs as exchanges send them (ms, seconds, 0)"""
+    return request.param
@@ -0,0 +1,248 @@
+"""
+Unit Tests for the Large Trades Aggregator
+
+These tests verify that services.all_large_trades:
+- Builds events identical to the LargeTrade model's JSON dump
+- Maps Bybit ("Buy"/"Sell") and Hyperliquid ("B"/"A") side codes, skipping unknown ones
+- Skips trades with missing fields or below the threshold without dropping the frame
+- Publishes one batch per Bybit/Hyperliquid frame and one event per Binance aggTrade
+
+Run with:
+    pytest tests/unit/test_all_large_trades.py -v
+"""
+
+import orjson
+import pytest
+from websockets.exceptions import ConnectionClosedOK
+
+import services.all_large_trades as lt_module
+from core.schemas import LargeTrade
+from core.utils.time import to_utc_datetime
+from services.all_large_trades import AllLargeTradesService, _iso_ts, _large_trade_event
+
+TS = 1704110400123
+
+
+class FakeWebSocket:
+    """Delivers the scripted frames, then stops the service and closes"""
+
+    def __init__(self, service, frames):
+        self._service = service
+        self._frames = [orjson.dumps(frame).decode() for frame in frames]
+        self.sent = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def send(self, data):
+        self.sent.append(data)
+
+    async def recv(self):
+        if not self._frames:
+            self._service._running.clear()
+            raise ConnectionClosedOK(None, None)
+        return self._frames.pop(0)
+
+
+class FakeBus:
+    """Records what the loops publish to the event bus"""
+
+    def __init__(self):
+        self.events = []
+        self.batches = []
+
+    async def publish(self, topic, event):
+        self.events.append(event)
+
+    async def publish_many(self, topic, events):
+        self.batches.append(events)
+        self.events.extend(events)
+
+
+@pytest.fixture
+def fake_bus(monkeypatch):
+    bus = FakeBus()
+    monkeypatch.setattr(lt_module, "bus", bus)
+    return bus
+
+
+@pytest.fixture
+def service():
+    service = AllLargeTradesService()
+    service._symbols = ["BTCUSDT"]
+    service._threshold = 100_000.0
+    service._running.set()
+    return service
+
+
+async def run_loop(monkeypatch, service, loop, frames):
+    """Run one stream loop over a single connection delivering frames"""
+    ws = FakeWebSocket(service, frames)
+    monkeypatch.setattr(lt_module.websockets, "connect", lambda url, **kwargs: ws)
+    await loop()
+    return ws
+
+
+def bybit_trade(**overrides):
+    trade = {"p": "50000", "v": "3", "S": "Buy", "T": TS}
+    trade.update(overrides)
+    return {k: v for k, v in trade.items() if v is not None}
+
+
+def hl_trade(**overrides):
+    trade = {"coin": "BTC", "side": "B", "px": "50000", "sz": "3", "time": TS}
+    trade.update(overrides)
+    return {k: v for k, v in trade.items() if v is not None}
+
+
+# ============================================
+# Tests for Event Parity with the LargeTrade Model
+# ============================================
+
+class TestLargeTradeEventParity:
+    """The hand-built events must match LargeTrade.model_dump(mode="json") byte for byte"""
+
+    @pytest.mark.parametrize("side,is_buyer_maker", [("buy", False), ("sell", True)])
+    def test_event_matches_model_dump(self, exchange_timestamp, side, is_buyer_maker):
+        """Verify the event dict (keys, order and values) equals the model's JSON dump"""
+        ts = exchange_timestamp
+        event = _large_trade_event("bybit", "ETHUSDT", side, 2250.75, 120.0, 270090.0, is_buyer_maker, ts)
+        model = LargeTrade(
+            exchange="bybit", symbol="ETHUSDT", side=side, price=2250.75, quantity=120.0, value=270090.0,
+            is_buyer_maker=is_buyer_maker, timestamp=to_utc_datetime(ts),
+        )
+        expected = {"type": "large_trade", **model.model_dump(mode="json")}
+
+        assert list(event.items()) == list(expected.items())
+        assert orjson.dumps(event) == orjson.dumps(expected)
+        assert event["timestamp"] == _iso_ts(ts)
+
+
+# ============================================
+# Tests for Bybit Trades
+# ============================================
+
+class TestBybitLoop:
+    """Tests for side mapping and per-trade skips in the Bybit loop"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("code,side", [("Buy", "buy"), ("Sell", "sell")])
+    async def test_side_codes_are_mapped(self, monkeypatch, service, fake_bus, code, side):
+        """Verify Bybit's Buy/Sell taker sides become buy/sell"""
+        frame = {"topic": "publicTrade.BTCUSDT", "data": [bybit_trade(S=code)]}
+        await run_loop(monkeypatch, service, service._bybit_loop, [frame])
+
+        assert [(e["exchange"], e["symbol"], e["side"]) for e in fake_bus.events] == [("bybit", "BTCUSDT", side)]
+        assert fake_bus.events[0]["value"] == 150000.0
+
+    @pytest.mark.asyncio
+    async def test_bad_trades_are_skipped_rest_of_frame_published(self, monkeypatch, service, fake_bus):
+        """Verify unknown sides, missing fields and small trades are dropped one by one"""
+        frame = {"topic": "publicTrade.BTCUSDT", "data": [
+            bybit_trade(S="buy"),          # Side codes are case-sensitive
+            bybit_trade(S=None),           # No side
+            bybit_trade(p=None),           # No price
+            bybit_trade(v="not-a-number"),
+            bybit_trade(v="1"),            # $50k, below threshold
+            bybit_trade(T=None),           # No timestamp: published at epoch 0
+            bybit_trade(S="Sell"),
+        ]}
+        await run_loop(monkeypatch, service, service._bybit_loop, [frame])
+
+        assert len(fake_bus.batches) == 1
+        assert [(e["side"], e["timestamp"]) for e in fake_bus.events] == [
+            ("buy", _iso_ts(0)),
+            ("sell", _iso_ts(TS)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_topic_and_acks_are_ignored(self, monkeypatch, service, fake_bus):
+        """Verify subscribe acks and unsubscribed topics publish nothing"""
+        frames = [
+            {"op": "subscribe", "success": True},
+            {"topic": "publicTrade.ETHUSDT", "data": [bybit_trade()]},
+            {"topic": "publicTrade.BTCUSDT"},
+        ]
+        ws = await run_loop(monkeypatch, service, service._bybit_loop, frames)
+
+        assert fake_bus.events == []
+        assert [orjson.loads(f) for f in ws.sent] == [{"op": "subscribe", "args": ["publicTrade.BTCUSDT"]}]
+
+
+# ============================================
+# Tests for Hyperliquid Trades
+# ============================================
+
+class TestHyperliquidLoop:
+    """Tests for side mapping and per-trade skips in the Hyperliquid loop"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("code,side", [("B", "buy"), ("A", "sell")])
+    async def test_side_codes_are_mapped(self, monkeypatch, service, fake_bus, code, side):
+        """Verify Hyperliquid's B (bid) / A (ask) taker sides become buy/sell"""
+        frame = {"channel": "trades", "data": [hl_trade(side=code)]}
+        await run_loop(monkeypatch, service, service._hyperliquid_loop, [frame])
+
+        assert [(e["exchange"], e["symbol"], e["side"]) for e in fake_bus.events] == [("hyperliquid", "BTC", side)]
+
+    @pytest.mark.asyncio
+    async def test_bad_trades_are_skipped_rest_of_frame_published(self, monkeypatch, service, fake_bus):
+        """Verify unknown sides, missing fields and small trades are dropped one by one"""
+        frame = {"channel": "trades", "data": [
+            hl_trade(side="X"),
+            hl_trade(side=None),
+            hl_trade(px=None),
+            hl_trade(sz=None),
+            hl_trade(sz="1"),              # $50k, below threshold
+            hl_trade(coin="eth", time=None),
+            hl_trade(side="A"),
+        ]}
+        await run_loop(monkeypatch, service, service._hyperliquid_loop, [frame])
+
+        assert len(fake_bus.batches) == 1
+        assert [(e["symbol"], e["side"], e["timestamp"]) for e in fake_bus.events] == [
+            ("ETH", "buy", _iso_ts(0)),
+            ("BTC", "sell", _iso_ts(TS)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_non_trade_channels_are_ignored(self, monkeypatch, service, fake_bus):
+        """Verify subscription responses publish nothing"""
+        frames = [{"channel": "subscriptionResponse", "data": {"method": "subscribe"}}]
+        await run_loop(monkeypatch, service, service._hyperliquid_loop, frames)
+
+        assert fake_bus.events == []
+
+
+# ============================================
+# Tests for Binance Trades
+# ============================================
+
+class TestBinanceLoop:
+    """Tests for maker-flag sides and skips in the Binance loop"""
+
+    @staticmethod
+    def agg_trade(**overrides):
+        msg = {"e": "aggTrade", "p": "50000", "q": "3", "m": False, "T": TS}
+        msg.update(overrides)
+        return {"stream": "btcusdt@aggTrade", "data": {k: v for k, v in msg.items() if v is not None}}
+
+    @pytest.mark.asyncio
+    async def test_maker_flag_sets_side_and_bad_messages_are_skipped(self, monkeypatch, service, fake_bus):
+        """Verify m=True is a sell, and malformed or small aggTrades are dropped"""
+        frames = [
+            self.agg_trade(m=True),
+            self.agg_trade(e="trade"),
+            self.agg_trade(p=None),
+            self.agg_trade(T=None),
+            self.agg_trade(q="1"),
+            {"stream": "ethusdt@aggTrade", "data": self.agg_trade()["data"]},
+            self.agg_trade(),
+        ]
+        await run_loop(monkeypatch, service, service._binance_loop, frames)
+
+        assert [(e["side"], e["is_buyer_maker"]) for e in fake_bus.events] == [("sell", True), ("buy", False)]
+        assert {e["symbol"] for e in fake_bus.events} == {"BTCUSDT"}
@@ -0,0 +1,187 @@
+"""
+Unit Tests for the All-Exchanges Liquidations Aggregator
+
+These tests verify that services.all_liquidations:
+- Skips malformed liquidation records instead of raising
+- Tracks Bybit subscribe acks by req_id and splits rejected batches
+- Builds events identical to the Liquidation model's JSON dump
+
+Run with:
+    pytest tests/unit/test_all_liquidations.py -v
+"""
+
+import logging
+
+import orjson
+import pytest
+
+from core.schemas import Liquidation
+from core.utils.time import to_utc_datetime
+from services.all_liquidations import (
+    AllLiquidationsService,
+    _liquidation_event,
+    _parse_binance,
+    _parse_bybit,
+    _parse_okx,
+    _ts_iso,
+)
+
+
+class FakeWebSocket:
+    """Records the frames sent with send_str"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_str(self, data: str) -> None:
+        self.sent.append(orjson.loads(data))
+
+
+def model_timestamp(ts):
+    """Timestamp as the stream loops used to build it for the Liquidation model"""
+    return to_utc_datetime(int(ts)) if ts is not None else to_utc_datetime(0)
+
+
+# ============================================
+# Tests for Event Parity with the Liquidation Model
+# ============================================
+
+class TestLiquidationEventParity:
+    """The hand-built events must match Liquidation.model_dump(mode="json") byte for byte"""
+
+    def test_ts_iso_matches_model_dump(self, exchange_timestamp):
+        """Verify _ts_iso formats timestamps exactly as the model serializes them"""
+        model = Liquidation(
+            exchange="bybit", symbol="BTCUSDT", side="buy", price=1.0, quantity=1.0, value=1.0,
+            timestamp=model_timestamp(exchange_timestamp),
+        )
+        assert _ts_iso(exchange_timestamp) == model.model_dump(mode="json")["timestamp"]
+
+    def test_missing_timestamp_falls_back_to_epoch(self):
+        """Verify a record without a timestamp serializes as epoch 0, like the model did"""
+        event = _liquidation_event("okx", "BTC-USDT-SWAP", "buy", 1.0, 1.0, 1.0, None)
+        assert _ts_iso(None) == _ts_iso(0) == "1970-01-01T00:00:00Z"
+        assert event["timestamp"] == _ts_iso(0)
+
+    @pytest.mark.parametrize("side", ["buy", "sell", ""])
+    def test_event_matches_model_dump(self, exchange_timestamp, side):
+        """Verify the event dict (keys, order and values) equals the model's JSON dump"""
+        ts = exchange_timestamp
+        event = _liquidation_event("binance", "btcusdt", side, 42000.5, 1.25, 52500.625, ts)
+        model = Liquidation(
+            exchange="binance", symbol="btcusdt", side=side if side else "sell",
+            price=42000.5, quantity=1.25, value=52500.625, timestamp=model_timestamp(ts),
+        )
+        expected = {"type": "liquidation", **model.model_dump(mode="json")}
+
+        assert list(event.items()) == list(expected.items())
+        assert orjson.dumps(event) == orjson.dumps(expected)
+
+
+# ============================================
+# Tests for Malformed Records
+# ============================================
+
+class TestMalformedRecords:
+    """A bad record is skipped (None), never raised to the stream loop"""
+
+    @pytest.mark.parametrize("record", [
+        "not-a-dict",
+        None,
+        {"p": "abc", "v": "1", "T": 1704110400000},
+        {"p": "30000", "v": "10", "T": "not-a-timestamp"},
+        {"p": "30000", "v": "10", "T": -1},
+        {"p": "30000", "v": "10", "T": 10**20},
+    ])
+    def test_bybit_bad_record_returns_none(self, record):
+        """Bybit records with bad types, numbers or timestamps are skipped"""
+        assert _parse_bybit(record, "BTCUSDT", 0.0) is None
+
+    def test_binance_bad_timestamp_returns_none(self):
+        """Binance orders with an unparseable timestamp are skipped"""
+        order = {"s": "BTCUSDT", "S": "SELL", "p": "30000", "q": "10", "T": "bad"}
+        assert _parse_binance(order, 0.0) is None
+
+    def test_okx_bad_timestamp_returns_none(self):
+        """OKX details with a negative timestamp are skipped"""
+        detail = {"side": "buy", "sz": "10", "bkPx": "30000", "ts": -1}
+        assert _parse_okx("BTC-USDT-SWAP", detail, 0.0) is None
+
+    def test_valid_record_still_parsed(self):
+        """A well-formed record next to bad ones is still published"""
+        event = _parse_bybit({"p": "30000", "v": "10", "S": "Buy", "T": 1704110400000}, "BTCUSDT", 0.0)
+        assert event is not None
+        assert event["symbol"] == "BTCUSDT"
+        assert event["side"] == "buy"
+        assert event["value"] == 300000.0
+
+
+# ============================================
+# Tests for Bybit Subscription Acks
+# ============================================
+
+class TestBybitSubscribeAck:
+    """Tests for req_id tracking and halve-on-reject resubscription"""
+
+    @pytest.fixture
+    def service(self):
+        return AllLiquidationsService()
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_resubscribes_both_halves_with_fresh_req_ids(self, service):
+        """Verify a rejected multi-topic batch is retried as two halves"""
+        ws = FakeWebSocket()
+        pending = {}
+        topics = [f"allLiquidation.SYM{i}USDT" for i in range(5)]
+        await service._bybit_subscribe(ws, pending, topics)
+        req_id = ws.sent[0]["req_id"]
+
+        await service._on_bybit_subscribe_ack(ws, pending, {"op": "subscribe", "req_id": req_id, "success": False})
+
+        assert [frame["args"] for frame in ws.sent[1:]] == [topics[:2], topics[2:]]
+        retry_ids = [frame["req_id"] for frame in ws.sent[1:]]
+        assert req_id not in retry_ids
+        assert len(set(retry_ids)) == 2
+        assert pending == {retry_ids[0]: topics[:2], retry_ids[1]: topics[2:]}
+
+    @pytest.mark.asyncio
+    async def test_rejected_single_topic_is_logged_not_retried(self, service, caplog):
+        """Verify a rejected one-topic batch is given up on with a warning"""
+        ws = FakeWebSocket()
+        pending = {}
+        await service._bybit_subscribe(ws, pending, ["allLiquidation.BADUSDT"])
+        ack = {"op": "subscribe", "req_id": ws.sent[0]["req_id"], "success": False, "ret_msg": "invalid topic"}
+
+        with caplog.at_level(logging.WARNING):
+            await service._on_bybit_subscribe_ack(ws, pending, ack)
+
+        assert len(ws.sent) == 1
+        assert pending == {}
+        assert "allLiquidation.BADUSDT" in caplog.text
+        assert "invalid topic" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_successful_ack_clears_pending(self, service):
+        """Verify an accepted batch is no longer tracked"""
+        ws = FakeWebSocket()
+        pending = {}
+        await service._bybit_subscribe(ws, pending, ["allLiquidation.BTCUSDT", "allLiquidation.ETHUSDT"])
+
+        await service._on_bybit_subscribe_ack(ws, pending, {"req_id": ws.sent[0]["req_id"], "success": True})
+
+        assert pending == {}
+        assert len(ws.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_req_id_is_ignored(self, service):
+        """Verify acks for untracked req_ids send nothing and keep pending intact"""
+        ws = FakeWebSocket()
+        pending = {}
+        await service._bybit_subscribe(ws, pending, ["allLiquidation.BTCUSDT", "allLiquidation.ETHUSDT"])
+        before = dict(pending)
+
+        await service._on_bybit_subscribe_ack(ws, pending, {"req_id": "liq_sub_unknown", "success": False})
+        await service._on_bybit_subscribe_ack(ws, pending, {"success": False})
+
+        assert pending == before
+        assert len(ws.sent) == 1
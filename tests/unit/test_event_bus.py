@@ -0,0 +1,195 @@
+"""
+Unit Tests for the Event Bus
+
+These tests verify that services.event_bus:
+- Delivers events through SubscriberQueue in FIFO order
+- Enforces the queue bound (QueueFull) and drops instead of blocking publishers
+- Drains bursts in batches of at most max_items
+- Wakes a blocked consumer when an event arrives
+- Drops (and logs) events that cannot be JSON-encoded without raising
+
+Run with:
+    pytest tests/unit/test_event_bus.py -v
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from services.event_bus import BusEvent, EventBus, SubscriberQueue, drain_batch
+
+
+def make_event(n: int) -> BusEvent:
+    return BusEvent({"n": n}, f'{{"n":{n}}}')
+
+
+# ============================================
+# Tests for SubscriberQueue
+# ============================================
+
+class TestSubscriberQueue:
+    """Tests for the deque-backed subscriber queue"""
+
+    @pytest.mark.asyncio
+    async def test_fifo_order(self):
+        """Verify events come out in the order they were put"""
+        queue = SubscriberQueue(maxsize=10)
+        for n in range(5):
+            queue.put_nowait(make_event(n))
+
+        assert queue.qsize() == 5
+        assert queue.get_nowait().data == {"n": 0}
+        assert (await queue.get()).data == {"n": 1}
+        assert [e.data["n"] for e in await queue.drain(10)] == [2, 3, 4]
+        assert queue.empty()
+
+    def test_put_nowait_raises_queue_full_at_maxsize(self):
+        """Verify the queue rejects events beyond maxsize"""
+        queue = SubscriberQueue(maxsize=2)
+        queue.put_nowait(make_event(0))
+        queue.put_nowait(make_event(1))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(make_event(2))
+        assert queue.qsize() == 2
+
+    def test_get_nowait_raises_queue_empty(self):
+        """Verify get_nowait on an empty queue raises QueueEmpty"""
+        with pytest.raises(asyncio.QueueEmpty):
+            SubscriberQueue(maxsize=1).get_nowait()
+
+    @pytest.mark.asyncio
+    async def test_drain_returns_at_most_max_items_and_keeps_remainder(self):
+        """Verify drain splits a burst and leaves the rest queued in order"""
+        queue = SubscriberQueue(maxsize=10)
+        for n in range(5):
+            queue.put_nowait(make_event(n))
+
+        first = await queue.drain(3)
+        assert [e.data["n"] for e in first] == [0, 1, 2]
+        assert queue.qsize() == 2
+
+        rest = await drain_batch(queue, max_items=3)
+        assert [e.data["n"] for e in rest] == [3, 4]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_blocked_get_is_woken_by_put_nowait(self):
+        """Verify a consumer waiting on an empty queue wakes on the next put"""
+        queue = SubscriberQueue(maxsize=10)
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        queue.put_nowait(make_event(7))
+        event = await asyncio.wait_for(getter, timeout=1)
+        assert event.data == {"n": 7}
+
+    @pytest.mark.asyncio
+    async def test_blocked_get_waits_again_after_queue_is_emptied(self):
+        """Verify a stale wakeup doesn't let get() return on an empty queue"""
+        queue = SubscriberQueue(maxsize=10)
+        queue.put_nowait(make_event(0))
+        queue.get_nowait()  # Event flag is still set from the put
+
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        queue.put_nowait(make_event(1))
+        assert (await asyncio.wait_for(getter, timeout=1)).data == {"n": 1}
+
+    @pytest.mark.asyncio
+    async def test_blocked_drain_is_woken_by_put_nowait(self):
+        """Verify drain waits for the first event, then returns it"""
+        queue = SubscriberQueue(maxsize=10)
+        drainer = asyncio.create_task(queue.drain(5))
+        await asyncio.sleep(0)
+        assert not drainer.done()
+
+        queue.put_nowait(make_event(1))
+        batch = await asyncio.wait_for(drainer, timeout=1)
+        assert [e.data["n"] for e in batch] == [1]
+
+
+# ============================================
+# Tests for EventBus
+# ============================================
+
+class TestEventBus:
+    """Tests for publish/subscribe fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_publish_fans_out_one_shared_event(self):
+        """Verify every subscriber receives the same encoded event"""
+        bus = EventBus()
+        q1 = await bus.subscribe("liquidation")
+        q2 = await bus.subscribe("liquidation")
+
+        await bus.publish("liquidation", {"n": 1})
+
+        e1, e2 = q1.get_nowait(), q2.get_nowait()
+        assert e1 is e2
+        assert e1.json == '{"n":1}'
+
+    @pytest.mark.asyncio
+    async def test_publish_drops_when_queue_full(self):
+        """Verify a full subscriber queue drops events instead of blocking"""
+        bus = EventBus(max_queue_size=1)
+        queue = await bus.subscribe("liquidation")
+
+        await bus.publish("liquidation", {"n": 1})
+        await bus.publish("liquidation", {"n": 2})
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait().data == {"n": 1}
+
+    @pytest.mark.asyncio
+    async def test_publish_many_drops_rest_of_batch_for_full_queue_only(self):
+        """Verify publish_many stops at a full queue but still feeds other subscribers"""
+        bus = EventBus(max_queue_size=2)
+        small = await bus.subscribe("large_trade")
+        small.put_nowait(make_event(-1))  # One slot left
+        roomy = await bus.subscribe("large_trade")
+
+        await bus.publish_many("large_trade", [{"n": n} for n in range(3)])
+
+        assert [small.get_nowait().data["n"] for _ in range(small.qsize())] == [-1, 0]
+        assert [e.data["n"] for e in await roomy.drain(10)] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_publish_drops_unencodable_event(self, caplog):
+        """Verify an event orjson can't encode is logged and dropped, not raised"""
+        bus = EventBus()
+        queue = await bus.subscribe("liquidation")
+
+        with caplog.at_level(logging.ERROR):
+            await bus.publish("liquidation", {"n": 2 ** 70})
+        await bus.publish("liquidation", {"n": 1})
+
+        assert "Dropping unencodable event for topic 'liquidation'" in caplog.text
+        assert [e.data for e in await queue.drain(10)] == [{"n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_publish_many_drops_only_unencodable_events(self, caplog):
+        """Verify publish_many skips the bad event but delivers the rest in order"""
+        bus = EventBus()
+        queue = await bus.subscribe("large_trade")
+
+        with caplog.at_level(logging.ERROR):
+            await bus.publish_many("large_trade", [{"n": 0}, {"n": 2 ** 70}, {"n": 2}])
+
+        assert "Dropping unencodable event for topic 'large_trade'" in caplog.text
+        assert [e.data["n"] for e in await queue.drain(10)] == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_delivery(self):
+        """Verify an unsubscribed queue no longer receives events"""
+        bus = EventBus()
+        queue = await bus.subscribe("oi_spike")
+        await bus.unsubscribe("oi_spike", queue)
+
+        await bus.publish("oi_spike", {"n": 1})
+
+        assert queue.empty()
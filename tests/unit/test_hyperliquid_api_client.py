@@ -11,6 +11,7 @@ Run with:
     pytest tests/unit/test_hyperliquid_api_client.py -v
 """
 
+import asyncio
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -27,7 +28,7 @@ from core.schemas import OHLC, OpenInterest, FundingRate
 @pytest_asyncio.fixture
 async def api_client():
     """Create a HyperliquidAPIClient instance for testing"""
-    async with HyperliquidAPIClient() as client:
+    async with HyperliquidAPIClient(warmup=False) as client:
         yield client
 
 
@@ -54,10 +55,10 @@ class TestGetHistoricalOHLC:
             }
         ]
 
-        async def mock_post(payload):
-            return mock_response
+        async def mock_post_items(payload, build):
+            return [build(item) for item in mock_response]
 
-        monkeypatch.setattr(api_client, "_post", mock_post)
+        monkeypatch.setattr(api_client, "_post_items", mock_post_items)
 
         # Call the method
         result = await api_client.get_historical_ohlc("BTC", "1m", 1720000000000, 1720001000000)
@@ -82,12 +83,12 @@ class TestGetHistoricalOHLC:
         """Verify symbol is normalized to uppercase"""
         called_payload = {}
 
-        async def mock_post(payload):
+        async def mock_post_items(payload, build):
             nonlocal called_payload
             called_payload = payload
             return []
 
-        monkeypatch.setattr(api_client, "_post", mock_post)
+        monkeypatch.setattr(api_client, "_post_items", mock_post_items)
 
         await api_client.get_historical_ohlc("btc", "1h", 1720000000000, 1720001000000)
 
@@ -96,10 +97,10 @@ class TestGetHistoricalOHLC:
     @pytest.mark.asyncio
     async def test_get_historical_ohlc_handles_empty_response(self, api_client, monkeypatch):
         """Verify empty response is handled gracefully"""
-        async def mock_post(payload):
+        async def mock_post_items(payload, build):
             return []
 
-        monkeypatch.setattr(api_client, "_post", mock_post)
+        monkeypatch.setattr(api_client, "_post_items", mock_post_items)
 
         result = await api_client.get_historical_ohlc("BTC", "1h", 1720000000000, 1720001000000)
 
@@ -107,6 +108,39 @@ class TestGetHistoricalOHLC:
         assert len(result) == 0
 
 
+    @pytest.mark.asyncio
+    async def test_post_items_stream_decodes_response(self, api_client):
+        """Verify _post_items builds one object per streamed array item"""
+
+        class MockContent:
+            def __init__(self, body: bytes):
+                self._body = body
+
+            async def read(self, n=-1):
+                if n < 0:
+                    n = len(self._body)
+                chunk, self._body = self._body[:n], self._body[n:]
+                return chunk
+
+        class MockResponse:
+            status = 200
+
+            def __init__(self):
+                self.content = MockContent(b'[{"t": 1720000000000, "c": "50250.0"}, {"t": 1720000060000, "c": "50300.5"}]')
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+        api_client.session.post = lambda url, json=None, headers=None, timeout=None: MockResponse()
+
+        result = await api_client._post_items({"type": "candleSnapshot"}, lambda item: (item["t"], item["c"]))
+
+        assert result == [(1720000000000, "50250.0"), (1720000060000, "50300.5")]
+
+
 # ============================================
 # Tests for Open Interest
 # ============================================
@@ -195,6 +229,57 @@ class TestGetOpenInterest:
         assert called_payload["type"] == "metaAndAssetCtxs"
 
 
+    @pytest.mark.asyncio
+    async def test_get_open_interest_reuses_recent_snapshot(self, api_client, monkeypatch):
+        """Verify lookups within SNAPSHOT_TTL share one metaAndAssetCtxs request"""
+        call_count = 0
+
+        async def mock_post(payload):
+            nonlocal call_count
+            call_count += 1
+            return [
+                {"universe": [{"name": "BTC"}, {"name": "ETH"}]},
+                [
+                    {"openInterest": "100.0", "markPx": "50000.0"},
+                    {"openInterest": "2000.0", "markPx": "3000.0"},
+                ],
+            ]
+
+        monkeypatch.setattr(api_client, "_post", mock_post)
+
+        btc = await api_client.get_open_interest("BTCUSDT")
+        eth = await api_client.get_open_interest("ETH")
+
+        assert call_count == 1
+        assert btc.symbol == "BTCUSDT"
+        assert btc.open_interest == 100.0
+        assert eth.open_interest_value == 2000.0 * 3000.0
+
+    @pytest.mark.asyncio
+    async def test_get_open_interest_many_uses_single_request(self, api_client, monkeypatch):
+        """Verify get_open_interest_many resolves all symbols from one snapshot"""
+        call_count = 0
+
+        async def mock_post(payload):
+            nonlocal call_count
+            call_count += 1
+            return [
+                {"universe": [{"name": "BTC"}, {"name": "ETH"}]},
+                [
+                    {"openInterest": "100.0", "markPx": "50000.0"},
+                    {"openInterest": "2000.0", "markPx": "3000.0"},
+                ],
+            ]
+
+        monkeypatch.setattr(api_client, "_post", mock_post)
+
+        result = await api_client.get_open_interest_many(["BTCUSDT", "ETHUSDT", "UNKNOWN"])
+
+        assert call_count == 1
+        assert set(result) == {"BTCUSDT", "ETHUSDT"}
+        assert result["ETHUSDT"].open_interest == 2000.0
+
+
 # ============================================
 # Tests for Funding Rate
 # ============================================
@@ -299,6 +384,28 @@ class TestGetPredictedFunding:
         assert result["BTC"] == 0.00015
         assert result["ETH"] == 0.0002
 
+    @pytest.mark.asyncio
+    async def test_get_predicted_funding_picks_hlperp_venue(self, api_client, monkeypatch):
+        """Verify only the HlPerp venue rate is returned per coin"""
+        mock_response = [
+            ["BTC", [
+                ["BinPerp", {"fundingRate": "0.0003", "nextFundingTime": 1720000000000}],
+                ["HlPerp", {"fundingRate": "0.00015", "nextFundingTime": 1720000000000}],
+            ]],
+            ["ETH", [
+                ["BybitPerp", {"fundingRate": "0.0001", "nextFundingTime": 1720000000000}],
+            ]],
+        ]
+
+        async def mock_post(payload):
+            return mock_response
+
+        monkeypatch.setattr(api_client, "_post", mock_post)
+
+        result = await api_client.get_predicted_funding()
+
+        assert result == {"BTC": 0.00015}
+
     @pytest.mark.asyncio
     async def test_get_predicted_funding_handles_empty_response(self, api_client, monkeypatch):
         """Verify empty response is handled gracefully"""
@@ -313,6 +420,25 @@ class TestGetPredictedFunding:
         assert len(result) == 0
 
 
+# ============================================
+# Tests for Symbol Conversion
+# ============================================
+
+class TestExtractCoinSymbol:
+    """Tests for _extract_coin_symbol pair -> coin mapping"""
+
+    @pytest.mark.parametrize("symbol,expected", [
+        ("BTCUSDT", "BTC"),
+        ("ethusdt", "ETH"),
+        ("SOL", "SOL"),
+        ("AVAXUSDC", "AVAX"),
+        ("UNKNOWNPAIR", "UNKNOWNPAIR"),
+    ])
+    def test_extract_coin_symbol(self, symbol, expected):
+        """Verify pairs, bare coins and unknown symbols resolve correctly"""
+        assert HyperliquidAPIClient()._extract_coin_symbol(symbol) == expected
+
+
 # ============================================
 # Tests for Context Manager
 # ============================================
@@ -338,6 +464,122 @@ class TestContextManager:
             await client._post({"type": "test"})
 
 
+# ============================================
+# Tests for Request Coalescing
+# ============================================
+
+class TestRequestCoalescing:
+    """Tests for single-flight deduplication in _post"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_payloads_share_one_request(self, api_client, monkeypatch):
+        """Verify concurrent identical payloads issue a single POST"""
+        call_count = 0
+
+        async def mock_post_with_retry(payload):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return {"type": payload["type"]}
+
+        monkeypatch.setattr(api_client, "_post_with_retry", mock_post_with_retry)
+
+        results = await asyncio.gather(
+            api_client._post({"type": "metaAndAssetCtxs"}),
+            api_client._post({"type": "metaAndAssetCtxs"}),
+            api_client._post({"type": "predictedFundings"}),
+        )
+
+        assert call_count == 2
+        assert results[0] == results[1] == {"type": "metaAndAssetCtxs"}
+        assert results[2] == {"type": "predictedFundings"}
+        assert api_client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_failure(self, api_client, monkeypatch):
+        """Verify an in-flight failure propagates to every waiting caller"""
+        async def mock_post_with_retry(payload):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("Failed to fetch")
+
+        monkeypatch.setattr(api_client, "_post_with_retry", mock_post_with_retry)
+
+        results = await asyncio.gather(
+            api_client._post({"type": "test"}),
+            api_client._post({"type": "test"}),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert api_client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_fails_followers_without_cancelling_them(self, api_client, monkeypatch):
+        """Verify followers of a cancelled leader get an error, not CancelledError"""
+        async def mock_post_with_retry(payload):
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(api_client, "_post_with_retry", mock_post_with_retry)
+
+        leader = asyncio.create_task(api_client._post({"type": "test"}))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(api_client._post({"type": "test"}))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        with pytest.raises(RuntimeError, match="In-flight request cancelled"):
+            await follower
+        assert not follower.cancelled()
+        assert api_client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_ohlc_requests_share_one_stream(self, api_client, monkeypatch):
+        """Verify identical concurrent candle requests share one streamed POST"""
+        call_count = 0
+
+        async def mock_post_items(payload, build):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return [build({"t": 1720000000000, "o": "1", "h": "2", "l": "0.5", "c": "1.5", "v": "10", "n": 3})]
+
+        monkeypatch.setattr(api_client, "_post_items", mock_post_items)
+
+        a, b, other = await asyncio.gather(
+            api_client.get_historical_ohlc("BTCUSDT", "1h", 1720000000000, 1720003600000),
+            api_client.get_historical_ohlc("BTCUSDT", "1h", 1720000000000, 1720003600000),
+            api_client.get_historical_ohlc("BTC", "1h", 1720000000000, 1720003600000),
+        )
+
+        # Same payload but a different output symbol is a separate request
+        assert call_count == 2
+        assert a is b
+        assert a[0].symbol == "BTCUSDT"
+        assert other[0].symbol == "BTC"
+        assert api_client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_get_funding_rate_does_not_mutate_shared_response(self, api_client, monkeypatch):
+        """Verify get_funding_rate sorts a copy of the (shareable) response"""
+        response = [
+            {"coin": "BTC", "fundingRate": "0.0002", "time": 1704139200000},
+            {"coin": "BTC", "fundingRate": "0.0001", "time": 1704110400000},
+        ]
+        original = list(response)
+
+        async def mock_post(payload):
+            return response
+
+        monkeypatch.setattr(api_client, "_post", mock_post)
+
+        rates = await api_client.get_funding_rate("BTCUSDT", limit=10)
+
+        assert [r.funding_rate for r in rates] == [0.0001, 0.0002]
+        assert response == original
+
+
 # ============================================
 # Tests for Error Handling
 # ============================================
@@ -411,6 +653,35 @@ class TestErrorHandling:
         with pytest.raises(RuntimeError, match="Failed to fetch"):
             await api_client._post({"type": "test"})
 
+    @pytest.mark.asyncio
+    async def test_post_does_not_retry_client_errors(self, api_client):
+        """Verify _post fails fast on non-retryable HTTP status"""
+        call_count = 0
+
+        class MockResponse:
+            status = 400
+
+            async def text(self):
+                return "Bad request"
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+        def mock_post(url, json=None, headers=None, timeout=None):
+            nonlocal call_count
+            call_count += 1
+            return MockResponse()
+
+        api_client.session.post = mock_post
+
+        with pytest.raises(RuntimeError, match="Failed to fetch"):
+            await api_client._post({"type": "test"})
+
+        assert call_count == 1
+
     @pytest.mark.asyncio
     async def test_get_open_interest_handles_exception(self, api_client, monkeypatch):
         """Verify get_open_interest handles exceptions gracefully"""
@@ -439,10 +710,10 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_get_historical_ohlc_handles_exception(self, api_client, monkeypatch):
         """Verify get_historical_ohlc handles exceptions gracefully"""
-        async def mock_post(payload):
+        async def mock_post_items(payload, build):
             raise Exception("Network error")
 
-        monkeypatch.setattr(api_client, "_post", mock_post)
+        monkeypatch.setattr(api_client, "_post_items", mock_post_items)
 
         result = await api_client.get_historical_ohlc("BTC", "1m", 1720000000000, 1720001000000)
 
@@ -0,0 +1,122 @@
+"""
+Unit Tests for Hyperliquid WebSocket Client
+
+These tests verify that the HyperliquidWSClient:
+- Backs off exponentially when the server keeps closing the socket before data
+- Retries immediately (and resets the backoff) after a connection that delivered data
+
+Run with:
+    pytest tests/unit/test_hyperliquid_ws_client.py -v
+"""
+
+from collections import deque
+
+import orjson
+import pytest
+from websockets.exceptions import ConnectionClosedOK
+
+import exchanges.hyperliquid.ws_client as ws_module
+from exchanges.hyperliquid.ws_client import HyperliquidWSClient
+
+
+CANDLE_FRAME = orjson.dumps({
+    "channel": "candle",
+    "data": {"t": 1720000000000, "o": "1", "h": "2", "l": "0.5", "c": "1.5", "v": "10", "n": 3, "closed": False},
+}).decode()
+
+TRADES_FRAME = orjson.dumps({
+    "channel": "trades",
+    "data": [{"coin": "BTC", "side": "B", "px": "50000", "sz": "1", "time": 1720000000000, "tid": 1}],
+}).decode()
+
+
+class FakeWebSocket:
+    """Accepts the subscription, delivers the scripted frames, then closes"""
+
+    def __init__(self, frames):
+        self.messages = deque()
+        self._frames = list(frames)
+
+    async def recv(self):
+        if not self._frames:
+            raise ConnectionClosedOK(None, None)
+        return self._frames.pop(0)
+
+
+class StopStream(Exception):
+    """Raised by the fake sleep to end the otherwise endless stream"""
+
+
+@pytest.fixture
+def record_sleeps(monkeypatch):
+    """Replace the reconnect sleep with a recorder that stops after 5 waits"""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) >= 5:
+            raise StopStream
+
+    monkeypatch.setattr(ws_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def script_connections(monkeypatch, client, connections):
+    """Make each _connect_and_subscribe call return the next scripted socket"""
+    sockets = iter(connections)
+
+    async def fake_connect(frame, stream_type):
+        return FakeWebSocket(next(sockets, []))
+
+    monkeypatch.setattr(client, "_connect_and_subscribe", fake_connect)
+
+
+# ============================================
+# Tests for Reconnect Backoff
+# ============================================
+
+class TestReconnectBackoff:
+    """Tests for the per-stream reconnect delay"""
+
+    @pytest.mark.asyncio
+    async def test_accept_then_close_backs_off_exponentially(self, monkeypatch, record_sleeps):
+        """Verify a server that closes before any data never gets a zero-delay retry"""
+        client = HyperliquidWSClient(max_reconnect_delay=8)
+        script_connections(monkeypatch, client, [])
+
+        with pytest.raises(StopStream):
+            async for _ in client.stream_ohlc("BTC", "1m"):
+                pass
+
+        assert record_sleeps == [1, 2, 4, 8, 8]
+
+    @pytest.mark.asyncio
+    async def test_healthy_connection_resets_backoff(self, monkeypatch, record_sleeps):
+        """Verify a connection that delivered data is retried at once and resets the backoff"""
+        client = HyperliquidWSClient(max_reconnect_delay=30)
+        # Two empty connections, one with data, then empty ones again
+        script_connections(monkeypatch, client, [[], [], [CANDLE_FRAME], [], []])
+
+        candles = []
+        with pytest.raises(StopStream):
+            async for candle in client.stream_ohlc("BTC", "1m"):
+                candles.append(candle)
+
+        # 1s, 2s, (immediate retry after data: no sleep), then 1s, 2s, 4s
+        assert len(candles) == 1
+        assert record_sleeps == [1, 2, 1, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_trades_stream_uses_same_backoff(self, monkeypatch, record_sleeps):
+        """Verify the trades stream follows the same reset-on-data rule"""
+        client = HyperliquidWSClient(max_reconnect_delay=30)
+        script_connections(monkeypatch, client, [[], [TRADES_FRAME]])
+
+        trades = []
+        with pytest.raises(StopStream):
+            async for trade in client.stream_trades("BTC"):
+                trades.append(trade)
+
+        assert len(trades) == 1
+        assert trades[0].side == "buy"
+        assert record_sleeps == [1, 1, 2, 4, 8]